@@ -11,6 +11,8 @@ from datetime import datetime
 from typing import Dict, List, Optional
 from urllib.parse import urlparse
 
+import http_client
+
 
 # Configuration from environment variables
 OVERSEER_BOT_AI_URL = os.getenv('OVERSEER_BOT_AI_URL', '')
@@ -215,7 +217,7 @@ def fetch_overseer_bot_ai_status() -> Optional[dict]:
         elif OVERSEER_BOT_AI_USERNAME and OVERSEER_BOT_AI_PASSWORD:
             auth = (OVERSEER_BOT_AI_USERNAME, OVERSEER_BOT_AI_PASSWORD)
         
-        response = requests.get(url, headers=headers, auth=auth, timeout=REQUEST_TIMEOUT)
+        response = http_client.get(url, headers=headers, auth=auth, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         
         data = response.json()
@@ -265,7 +267,7 @@ def fetch_overseer_bot_ai_alerts() -> Optional[List[dict]]:
         elif OVERSEER_BOT_AI_USERNAME and OVERSEER_BOT_AI_PASSWORD:
             auth = (OVERSEER_BOT_AI_USERNAME, OVERSEER_BOT_AI_PASSWORD)
         
-        response = requests.get(url, headers=headers, auth=auth, timeout=REQUEST_TIMEOUT)
+        response = http_client.get(url, headers=headers, auth=auth, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         
         alerts = response.json()
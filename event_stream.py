@@ -0,0 +1,124 @@
+"""
+Incremental JSON event parser for overseer-bot-ai
+Reads a JSON array or newline-delimited JSON from a file-like stream chunk by
+chunk, yielding each top-level value as soon as it is complete
+"""
+import json
+from typing import Any, BinaryIO, Iterator, Optional, Tuple
+
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = ' \t\r\n'
+_NUMBER_TAIL = '0123456789.eE+-'
+
+
+class EventStreamError(ValueError):
+    """The body cannot be parsed any further (bad array syntax or an oversized value)"""
+
+
+def iter_json_values(stream: BinaryIO, chunk_size: int = 65536,
+                     max_value_bytes: int = 65536) -> Iterator[Tuple[Optional[Any], Optional[str]]]:
+    """
+    Yield (value, None) for each parsed value, or (None, error) for a bad one
+
+    A body whose first non-blank character is '[' is read as one JSON array;
+    anything else as NDJSON (values separated by newlines). A malformed NDJSON
+    line is reported and skipped; a malformed array element ends the array
+    with EventStreamError, since there is no safe place to resume. Only the
+    value being parsed is held in memory, up to *max_value_bytes*.
+    """
+    buffer = ''
+    pos = 0
+    eof = False
+    mode = None  # 'array' or 'ndjson' once the first character is seen
+    expect_value = True  # array mode: a value (not ',' or ']') comes next
+    after_comma = False  # array mode: the last token was ',' so ']' is not allowed
+    pending = b''  # bytes of a UTF-8 character split across chunks
+
+    def fill():
+        nonlocal buffer, pos, eof, pending
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            eof = True
+            if pending:
+                raise EventStreamError("Body is not valid UTF-8")
+            return
+        data = pending + chunk
+        try:
+            text = data.decode('utf-8')
+            pending = b''
+        except UnicodeDecodeError as e:
+            if e.start < len(data) - 3:
+                raise EventStreamError("Body is not valid UTF-8")
+            text, pending = data[:e.start].decode('utf-8'), data[e.start:]
+        buffer = buffer[pos:] + text
+        pos = 0
+
+    while True:
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        if pos >= len(buffer):
+            if eof:
+                break
+            fill()
+            continue
+
+        if mode is None:
+            mode = 'array' if buffer[pos] == '[' else 'ndjson'
+            if mode == 'array':
+                pos += 1
+                continue
+
+        if mode == 'array' and not expect_value:
+            char = buffer[pos]
+            pos += 1
+            if char == ',':
+                expect_value = True
+                after_comma = True
+                continue
+            if char == ']':
+                mode = 'done'
+                continue
+            raise EventStreamError(f"Expected ',' or ']' in array, found {char!r}")
+        if mode == 'array' and buffer[pos] == ']':
+            if after_comma:
+                raise EventStreamError("Trailing comma in array")
+            pos += 1
+            mode = 'done'
+            continue
+        if mode == 'done':
+            raise EventStreamError("Unexpected data after the end of the array")
+
+        try:
+            value, end = _DECODER.raw_decode(buffer, pos)
+        except json.JSONDecodeError as e:
+            line_end = buffer.find('\n', pos)
+            if mode == 'ndjson' and line_end != -1:
+                yield None, f"Invalid JSON: {e.msg}"
+                pos = line_end + 1
+                continue
+            if not eof:
+                if len(buffer) - pos > max_value_bytes:
+                    raise EventStreamError(f"Event larger than {max_value_bytes} bytes")
+                fill()
+                continue
+            if mode == 'ndjson':
+                yield None, f"Invalid JSON: {e.msg}"
+                break
+            raise EventStreamError(f"Invalid JSON in array: {e.msg}")
+
+        # A number or literal is only complete once a delimiter or EOF follows:
+        # "1." or "1e" at the buffer edge may continue as "1.5" in the next chunk
+        if (not eof and not isinstance(value, (dict, list, str))
+                and not buffer[end:].strip(_NUMBER_TAIL)):
+            if len(buffer) - pos > max_value_bytes:
+                raise EventStreamError(f"Event larger than {max_value_bytes} bytes")
+            fill()
+            continue
+        pos = end
+        expect_value = False
+        after_comma = False
+        yield value, None
+
+    if mode == 'array':
+        raise EventStreamError("Unterminated JSON array")
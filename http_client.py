@@ -0,0 +1,153 @@
+"""
+Shared HTTP client for overseer-bot-ai
+Keeps one pooled keep-alive requests.Session per host, retries transient
+failures with jittered backoff, and records per-host latency and error counts
+"""
+import logging
+import os
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Configuration from environment variables
+HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', '8'))  # connections kept per host (matches gunicorn threads)
+HTTP_MAX_RETRIES = int(os.getenv('HTTP_MAX_RETRIES', '2'))
+HTTP_BACKOFF_FACTOR = float(os.getenv('HTTP_BACKOFF_FACTOR', '0.5'))  # seconds, doubled per retry
+HTTP_BACKOFF_JITTER = float(os.getenv('HTTP_BACKOFF_JITTER', '0.3'))  # seconds of random jitter added
+# 429 is deliberately absent: callers such as the CoinGecko limiter run their own backoff
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+# One session per scheme://host
+_SESSIONS: Dict[str, requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+# Per-host retry overrides set with configure_host()
+_HOST_RETRIES: Dict[str, int] = {}
+
+# Per-host request counters
+HOST_STATS: Dict[str, dict] = {}
+HOST_STATS_LOCK = threading.Lock()
+
+
+def _build_retry(max_retries: int) -> Retry:
+    """Retry policy for idempotent requests: connection errors and 5xx responses"""
+    kwargs = dict(
+        total=max_retries,
+        connect=max_retries,
+        read=max_retries,
+        status=max_retries,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({'GET', 'HEAD', 'OPTIONS'}),
+        raise_on_status=False,
+    )
+    try:
+        return Retry(backoff_jitter=HTTP_BACKOFF_JITTER, **kwargs)
+    except TypeError:
+        # urllib3 < 2.0 has no backoff_jitter; fall back to plain exponential backoff
+        return Retry(**kwargs)
+
+
+def _host_key(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def configure_host(url: str, max_retries: int):
+    """
+    Override the retry count for the host of *url*
+
+    Use max_retries=0 for optional lookups on latency-sensitive paths, where a
+    fast failure beats waiting out the backoff. Takes effect on the next request.
+    """
+    host = _host_key(url)
+    with _SESSIONS_LOCK:
+        _HOST_RETRIES[host] = max_retries
+        session = _SESSIONS.pop(host, None)
+    if session is not None:
+        session.close()
+
+
+def get_session(url: str) -> requests.Session:
+    """Return the pooled session for the host of *url*, creating it on first use"""
+    host = _host_key(url)
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(host)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE,
+                                  max_retries=_build_retry(_HOST_RETRIES.get(host, HTTP_MAX_RETRIES)))
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _SESSIONS[host] = session
+            logging.debug(f"HTTP session created for {host}")
+        return session
+
+
+def _record(host: str, elapsed_ms: float, ok: bool):
+    """Update latency counters for one request (thread-safe)"""
+    with HOST_STATS_LOCK:
+        stats = HOST_STATS.setdefault(host, {
+            'requests': 0, 'errors': 0, 'total_ms': 0.0, 'last_ms': 0.0, 'max_ms': 0.0
+        })
+        stats['requests'] += 1
+        if not ok:
+            stats['errors'] += 1
+        stats['total_ms'] += elapsed_ms
+        stats['last_ms'] = elapsed_ms
+        stats['max_ms'] = max(stats['max_ms'], elapsed_ms)
+
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    """
+    Send a request through the pooled session for the URL's host
+
+    Accepts the same keyword arguments as requests.request(). Responses with
+    status >= 500 and raised exceptions are counted as errors for the host.
+    """
+    host = _host_key(url)
+    start = time.perf_counter()
+    ok = False
+    try:
+        response = get_session(url).request(method, url, **kwargs)
+        ok = response.status_code < 500
+        return response
+    finally:
+        _record(host, (time.perf_counter() - start) * 1000, ok)
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """GET through the pooled session (see request())"""
+    return request('GET', url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    """POST through the pooled session (see request()); only failed connects are retried"""
+    return request('POST', url, **kwargs)
+
+
+def get_host_stats() -> Dict[str, dict]:
+    """Snapshot of per-host counters with average latency, for /api/metrics"""
+    with HOST_STATS_LOCK:
+        snapshot = {host: dict(stats) for host, stats in HOST_STATS.items()}
+    for stats in snapshot.values():
+        stats['avg_ms'] = round(stats['total_ms'] / stats['requests'], 2) if stats['requests'] else 0.0
+        stats['total_ms'] = round(stats['total_ms'], 2)
+        stats['last_ms'] = round(stats['last_ms'], 2)
+        stats['max_ms'] = round(stats['max_ms'], 2)
+    return snapshot
+
+
+def close_sessions():
+    """Close every pooled session (their connections are reopened on next use)"""
+    with _SESSIONS_LOCK:
+        sessions = list(_SESSIONS.values())
+        _SESSIONS.clear()
+    for session in sessions:
+        session.close()
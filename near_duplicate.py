@@ -0,0 +1,142 @@
+"""
+Near-duplicate text index for overseer-bot-ai
+MinHash signatures over word shingles, bucketed with locality-sensitive
+hashing so a similarity query only compares against likely matches
+"""
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_URL_RE = re.compile(r'https?://\S+|\b[\w-]+\.(?:xyz|com|io|net|org)\b')
+_WORD_RE = re.compile(r"[a-z0-9$']+")
+
+
+def shingles(text: str, size: int = 2) -> List[str]:
+    """
+    Word n-gram shingles of normalized text
+
+    Lower-cases, drops links (every broadcast may carry the same game link) and
+    punctuation. Texts shorter than *size* words yield their words as shingles.
+    """
+    words = _WORD_RE.findall(_URL_RE.sub(' ', text.lower()))
+    if len(words) < size:
+        return words
+    return [' '.join(words[i:i + size]) for i in range(len(words) - size + 1)]
+
+
+class NearDuplicateIndex:
+    """
+    Thread-safe MinHash/LSH index of recently seen texts
+
+    Each text gets a `num_perm` MinHash signature split into `bands` bands;
+    texts sharing any band bucket are candidates, and a candidate counts as a
+    near duplicate when the fraction of equal signature slots (an estimate of
+    shingle Jaccard similarity) reaches `threshold`. Entries older than
+    `window_seconds` or beyond `max_items` are evicted oldest first.
+    """
+
+    def __init__(self, threshold: float = 0.7, num_perm: int = 64, bands: int = 16,
+                 shingle_size: int = 2, window_seconds: Optional[float] = None,
+                 max_items: int = 2000, seed: int = 77):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.window_seconds = window_seconds
+        self.max_items = max_items
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()  # id -> (ts, signature, band keys)
+        self._buckets: List[Dict[bytes, set]] = [dict() for _ in range(bands)]
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """MinHash signature of *text*, or None when it has no shingles"""
+        grams = shingles(text, self.shingle_size)
+        if not grams:
+            return None
+        hashes = np.array(
+            [int.from_bytes(hashlib.blake2b(g.encode('utf-8'), digest_size=4).digest(), 'little')
+             for g in set(grams)],
+            dtype=np.uint64,
+        )
+        # (shingles x permutations) universal hashes; wrap-around in uint64 is intended
+        permuted = ((hashes[:, None] * self._a + self._b) % _MERSENNE_PRIME) & _MAX_HASH
+        return permuted.min(axis=0)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def _evict(self, now: float):
+        """Drop expired and over-capacity entries. Caller holds _lock."""
+        while self._entries:
+            doc_id, (ts, _, keys) = next(iter(self._entries.items()))
+            expired = self.window_seconds is not None and now - ts > self.window_seconds
+            if not expired and len(self._entries) <= self.max_items:
+                break
+            del self._entries[doc_id]
+            for band, key in enumerate(keys):
+                bucket = self._buckets[band].get(key)
+                if bucket is not None:
+                    bucket.discard(doc_id)
+                    if not bucket:
+                        del self._buckets[band][key]
+
+    def add(self, text: str, now: Optional[float] = None):
+        """Index *text* as seen at *now* (defaults to the current time)"""
+        signature = self.signature(text)
+        if signature is None:
+            return
+        now = time.time() if now is None else now
+        keys = self._band_keys(signature)
+        with self._lock:
+            doc_id = self._next_id
+            self._next_id += 1
+            self._entries[doc_id] = (now, signature, keys)
+            for band, key in enumerate(keys):
+                self._buckets[band].setdefault(key, set()).add(doc_id)
+            self._evict(now)
+
+    def similarity(self, text: str, now: Optional[float] = None) -> float:
+        """Highest estimated Jaccard similarity between *text* and any indexed text"""
+        signature = self.signature(text)
+        if signature is None:
+            return 0.0
+        now = time.time() if now is None else now
+        keys = self._band_keys(signature)
+        with self._lock:
+            self._evict(now)
+            candidates = set()
+            for band, key in enumerate(keys):
+                candidates |= self._buckets[band].get(key, set())
+            if not candidates:
+                return 0.0
+            matrix = np.stack([self._entries[c][1] for c in candidates])
+        return float((matrix == signature).mean(axis=1).max())
+
+    def is_near_duplicate(self, text: str, now: Optional[float] = None) -> bool:
+        """True when some indexed text is at least `threshold` similar to *text*"""
+        return self.similarity(text, now) >= self.threshold
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            for bucket in self._buckets:
+                bucket.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
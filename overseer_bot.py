@@ -1,10 +1,16 @@
 import os
+import atexit
+import bisect
+import concurrent.futures
+import functools
 import time
 import logging
 import random
 import hashlib
+import queue
 from datetime import datetime, timedelta, timezone
 import json
+from collections import OrderedDict, deque
 
 # Load .env file (if present) before any os.getenv() calls.
 # This is a no-op in production when env-vars are already injected by the
@@ -23,7 +29,14 @@ from flask_httpauth import HTTPBasicAuth
 import ccxt
 import re
 import threading
+import warnings
+import numpy as np
 import api_client
+import event_stream
+import http_client
+import near_duplicate
+import price_stream
+import state_store
 
 # Wallet integrations (optional imports)
 WALLET_ENABLED = False
@@ -62,10 +75,18 @@ BROADCAST_MAX_INTERVAL = 90  # minutes (reduced frequency)
 MENTION_CHECK_MIN_INTERVAL = 30  # minutes (reduced from 15-30)
 MENTION_CHECK_MAX_INTERVAL = 45  # minutes (reduced frequency)
 
-# LLM Response Cache to reduce API costs
-LLM_CACHE = {}
-LLM_CACHE_MAX_SIZE = 50
-LLM_CACHE_TTL = 3600  # 1 hour
+# LLM Response Cache to reduce API costs.
+# LRU + TTL: OrderedDict keeps recency order so hits and evictions are O(1).
+# Shared by scheduler jobs and Flask request threads, so always hold LLM_CACHE_LOCK.
+LLM_CACHE = OrderedDict()
+LLM_CACHE_LOCK = threading.Lock()
+LLM_CACHE_MAX_SIZE = int(os.getenv('LLM_CACHE_MAX_SIZE', '50'))
+LLM_CACHE_TTL = int(os.getenv('LLM_CACHE_TTL', '3600'))  # 1 hour
+LLM_CACHE_STATS = {'hits': 0, 'disk_hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'saved_tokens': 0}
+
+def estimate_tokens(text):
+    """Rough token count for cost estimates (~4 characters per token)."""
+    return max(1, len(text) // 4) if text else 0
 
 def get_cache_key(prompt, max_tokens, context=None):
     """Generate cache key for LLM responses."""
@@ -74,28 +95,106 @@ def get_cache_key(prompt, max_tokens, context=None):
         key_parts.append(str(context))
     return hashlib.md5('|'.join(key_parts).encode()).hexdigest()
 
+# Optional second tier: a SQLite file that survives restarts and redeploys.
+# Opened lazily on the first memory miss; writes go through a background writer.
+LLM_CACHE_PERSIST = os.getenv('LLM_CACHE_PERSIST', 'false').lower() == 'true'
+LLM_CACHE_DB_FILE = os.getenv('LLM_CACHE_DB_FILE', 'llm_cache.db')
+LLM_DISK_CACHE = state_store.SQLiteStore(LLM_CACHE_DB_FILE, [
+    "CREATE TABLE IF NOT EXISTS llm_cache ("
+    "cache_key TEXT PRIMARY KEY, response TEXT NOT NULL, tokens INTEGER NOT NULL DEFAULT 0, "
+    "created_at REAL NOT NULL, expires_at REAL NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS idx_llm_cache_expires_at ON llm_cache (expires_at)",
+])
+
+def _store_in_memory_cache(cache_key, response, tokens, timestamp):
+    """Insert into the in-memory LRU tier. Caller holds LLM_CACHE_LOCK."""
+    LLM_CACHE[cache_key] = {'response': response, 'timestamp': timestamp, 'tokens': tokens}
+    LLM_CACHE.move_to_end(cache_key)
+    while len(LLM_CACHE) > LLM_CACHE_MAX_SIZE:
+        LLM_CACHE.popitem(last=False)
+        LLM_CACHE_STATS['evictions'] += 1
+
+def _get_disk_cached_response(cache_key):
+    """Look up *cache_key* in the SQLite tier and promote a hit into memory."""
+    try:
+        rows = LLM_DISK_CACHE.query(
+            "SELECT response, tokens, created_at FROM llm_cache WHERE cache_key = ? AND expires_at > ?",
+            (cache_key, time.time()),
+        )
+    except Exception as e:
+        logging.warning(f"LLM disk cache lookup failed: {e}")
+        return None
+    if not rows:
+        return None
+    response, tokens, created_at = rows[0]
+    with LLM_CACHE_LOCK:
+        _store_in_memory_cache(cache_key, response, tokens, created_at)
+        LLM_CACHE_STATS['disk_hits'] += 1
+        LLM_CACHE_STATS['saved_tokens'] += tokens
+    logging.debug("Using disk-cached LLM response")
+    return response
+
 def get_cached_response(cache_key):
-    """Get cached LLM response if valid."""
-    if cache_key in LLM_CACHE:
-        cached = LLM_CACHE[cache_key]
-        if time.time() - cached['timestamp'] < LLM_CACHE_TTL:
-            logging.debug("Using cached LLM response")
-            return cached['response']
-        else:
+    """Get cached LLM response if valid (memory first, then the optional disk tier)."""
+    with LLM_CACHE_LOCK:
+        cached = LLM_CACHE.get(cache_key)
+        if cached is not None:
+            if time.time() - cached['timestamp'] < LLM_CACHE_TTL:
+                LLM_CACHE.move_to_end(cache_key)
+                LLM_CACHE_STATS['hits'] += 1
+                LLM_CACHE_STATS['saved_tokens'] += cached.get('tokens', 0)
+                logging.debug("Using cached LLM response")
+                return cached['response']
             del LLM_CACHE[cache_key]
+            LLM_CACHE_STATS['expirations'] += 1
+
+    if LLM_CACHE_PERSIST:
+        response = _get_disk_cached_response(cache_key)
+        if response is not None:
+            return response
+
+    with LLM_CACHE_LOCK:
+        LLM_CACHE_STATS['misses'] += 1
     return None
 
-def cache_response(cache_key, response):
-    """Cache LLM response."""
-    if len(LLM_CACHE) >= LLM_CACHE_MAX_SIZE:
-        # Remove oldest entry
-        oldest_key = min(LLM_CACHE.keys(), key=lambda k: LLM_CACHE[k]['timestamp'])
-        del LLM_CACHE[oldest_key]
-    
-    LLM_CACHE[cache_key] = {
-        'response': response,
-        'timestamp': time.time()
-    }
+def cache_response(cache_key, response, tokens=None):
+    """Cache LLM response, evicting the least recently used entry when full.
+
+    *tokens* is the estimated prompt + completion token cost a future hit saves.
+    When LLM_CACHE_PERSIST is on, the entry is also written to disk asynchronously.
+    """
+    now = time.time()
+    tokens = tokens if tokens is not None else estimate_tokens(response)
+    with LLM_CACHE_LOCK:
+        _store_in_memory_cache(cache_key, response, tokens, now)
+    if LLM_CACHE_PERSIST:
+        LLM_DISK_CACHE.execute_async(
+            "INSERT OR REPLACE INTO llm_cache (cache_key, response, tokens, created_at, expires_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (cache_key, response, tokens, now, now + LLM_CACHE_TTL),
+        )
+
+def compact_llm_disk_cache():
+    """Delete expired rows from the SQLite LLM cache tier."""
+    if LLM_CACHE_PERSIST:
+        LLM_DISK_CACHE.execute_async("DELETE FROM llm_cache WHERE expires_at <= ?", (time.time(),))
+
+def get_llm_cache_stats():
+    """Return LLM cache counters, size and hit rate (thread-safe)."""
+    with LLM_CACHE_LOCK:
+        stats = dict(LLM_CACHE_STATS)
+        stats['size'] = len(LLM_CACHE)
+    hits = stats['hits'] + stats['disk_hits']
+    lookups = hits + stats['misses']
+    stats['hit_rate'] = round(hits / lookups, 4) if lookups else 0.0
+    stats['max_size'] = LLM_CACHE_MAX_SIZE
+    stats['ttl_seconds'] = LLM_CACHE_TTL
+    stats['persistent'] = LLM_CACHE_PERSIST
+    if LLM_CACHE_PERSIST:
+        stats['pending_disk_writes'] = LLM_DISK_CACHE.pending_writes()
+    return stats
+
+atexit.register(LLM_DISK_CACHE.flush)
 
 # ------------------------------------------------------------
 # TWITTER AUTH
@@ -113,6 +212,27 @@ HF_MODEL = os.getenv('HF_MODEL', 'HuggingFaceH4/zephyr-7b-beta')
 XAI_API = os.getenv('XAI_API')
 XAI_MODEL = os.getenv('XAI_MODEL', 'grok-3-mini')
 LLM_ENABLED = bool(os.getenv('OPENAI_API_KEY') or os.getenv('HUGGING_FACE_TOKEN') or os.getenv('XAI_API'))
+# Hedged mode: start xAI, then race the secondary providers if xAI has no usable
+# answer after LLM_HEDGE_DELAY seconds; the first acceptable response wins
+LLM_HEDGE_MODE = os.getenv('LLM_HEDGE_MODE', 'false').lower() == 'true'
+LLM_HEDGE_DELAY = float(os.getenv('LLM_HEDGE_DELAY', '2.0'))
+# Per-provider circuit breakers: open when the recent failure rate is too high,
+# mark a provider degraded when its p95 latency is too slow
+LLM_BREAKER_WINDOW = int(os.getenv('LLM_BREAKER_WINDOW', '20'))          # recent calls tracked
+LLM_BREAKER_MIN_CALLS = int(os.getenv('LLM_BREAKER_MIN_CALLS', '5'))
+LLM_BREAKER_FAILURE_RATE = float(os.getenv('LLM_BREAKER_FAILURE_RATE', '0.5'))
+LLM_BREAKER_COOLDOWN = int(os.getenv('LLM_BREAKER_COOLDOWN', '60'))      # seconds open before a trial call
+LLM_BREAKER_SLOW_MS = float(os.getenv('LLM_BREAKER_SLOW_MS', '8000'))    # p95 above this = degraded
+LLM_BREAKER_SAMPLE_TTL = int(os.getenv('LLM_BREAKER_SAMPLE_TTL', '600'))  # seconds a latency sample counts
+# Relative cost per call, used to order healthy fallback providers (cheapest first)
+LLM_PROVIDER_COST = {'xAI-Grok': 1.0, 'OpenAI': 1.0, 'HuggingFace': 0.2}
+# Candidates requested per broadcast LLM call (n= choices); 1 disables batching
+LLM_BROADCAST_CANDIDATES = int(os.getenv('LLM_BROADCAST_CANDIDATES', '3'))
+# Stream tweet-length generations and stop reading once the reply is long enough
+LLM_STREAMING = os.getenv('LLM_STREAMING', 'true').lower() == 'true'
+# Shared provider thread pool and per-provider concurrency cap
+LLM_EXECUTOR_WORKERS = int(os.getenv('LLM_EXECUTOR_WORKERS', '6'))
+LLM_PROVIDER_CONCURRENCY = int(os.getenv('LLM_PROVIDER_CONCURRENCY', '2'))
 
 # Check if Twitter credentials are configured
 TWITTER_ENABLED = all([CONSUMER_KEY, CONSUMER_SECRET, ACCESS_TOKEN, ACCESS_SECRET, BEARER_TOKEN])
@@ -259,7 +379,9 @@ if TWITTER_ENABLED:
             access_token=ACCESS_TOKEN,
             access_token_secret=ACCESS_SECRET,
             bearer_token=BEARER_TOKEN,
-            wait_on_rate_limit=True
+            # Never sleep out a 429 on a scheduler thread; callers see
+            # TooManyRequests and the reply sender pauses that endpoint instead
+            wait_on_rate_limit=False
         )
         
         auth_v1 = tweepy.OAuth1UserHandler(
@@ -292,6 +414,154 @@ if TWITTER_ENABLED:
         except tweepy.TweepyException as e:
             logging.warning(f"⚠️  Twitter read access check failed: {e}")
 
+# ------------------------------------------------------------
+# RATE LIMITING
+# ------------------------------------------------------------
+class TokenBucket:
+    """Thread-safe, non-blocking token bucket rate limiter.
+
+    Tokens refill continuously at *rate* per second up to *capacity*.
+    try_acquire() never sleeps; callers decide what to do when it fails.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens=1):
+        """Take *tokens* if available. Returns True on success, False otherwise."""
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def available(self):
+        """Return the number of tokens currently available."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+class CircuitBreaker:
+    """Rolling-window circuit breaker for one upstream provider.
+
+    Tracks the last *window* call outcomes and latencies. The breaker opens
+    when at least *min_calls* were seen and the failure rate reaches
+    *failure_rate*; after *cooldown* seconds it goes half-open. allow_trial()
+    then admits a single caller, and the recorded result of that trial call
+    either closes the breaker (success) or reopens it (failure). Latency
+    samples older than *sample_ttl* seconds no longer count toward the p95,
+    so a provider that was slow is not ranked as degraded forever.
+    """
+
+    def __init__(self, window, min_calls, failure_rate, cooldown, slow_ms, sample_ttl=600):
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.cooldown = cooldown
+        self.slow_ms = slow_ms
+        self.sample_ttl = sample_ttl
+        self._outcomes = deque(maxlen=window)
+        self._latencies = deque(maxlen=window)  # (monotonic time, elapsed_ms)
+        self._opened_at = None
+        self._trial = None  # (owner thread id, monotonic start) of the admitted half-open call
+        self._trips = 0
+        self._lock = threading.Lock()
+
+    def _state(self):
+        if self._opened_at is None:
+            return 'closed'
+        if time.monotonic() - self._opened_at >= self.cooldown:
+            return 'half_open'
+        return 'open'
+
+    def _p95(self):
+        cutoff = time.monotonic() - self.sample_ttl
+        while self._latencies and self._latencies[0][0] < cutoff:
+            self._latencies.popleft()
+        if len(self._latencies) < self.min_calls:
+            return None
+        ordered = sorted(ms for _, ms in self._latencies)
+        return ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+
+    def _trial_in_flight(self):
+        """True while an admitted trial call has not reported back. Caller holds _lock."""
+        # A trial that never reports (the caller did not use it) expires after one cooldown
+        return self._trial is not None and time.monotonic() - self._trial[1] < self.cooldown
+
+    def allow_trial(self):
+        """Admit the calling thread as the single half-open trial. False if not half-open or taken."""
+        with self._lock:
+            if self._state() != 'half_open' or self._trial_in_flight():
+                return False
+            self._trial = (threading.get_ident(), time.monotonic())
+            return True
+
+    def release_trial(self):
+        """Give back a trial the calling thread claimed but did not use."""
+        with self._lock:
+            if self._trial is not None and self._trial[0] == threading.get_ident():
+                self._trial = None
+
+    def record(self, ok, elapsed_ms):
+        """Record one call outcome and update the breaker state."""
+        with self._lock:
+            state = self._state()
+            if state == 'open':
+                return  # late result from a call started before the breaker opened
+            if state == 'half_open':
+                self._trial = None
+                self._outcomes.clear()
+                self._latencies.clear()
+                if not ok:
+                    self._opened_at = time.monotonic()
+                    self._trips += 1
+                    return
+                self._opened_at = None
+            self._outcomes.append(ok)
+            self._latencies.append((time.monotonic(), elapsed_ms))
+            failures = self._outcomes.count(False)
+            if len(self._outcomes) >= self.min_calls and failures / len(self._outcomes) >= self.failure_rate:
+                self._opened_at = time.monotonic()
+                self._trips += 1
+                logging.warning(f"Circuit breaker opened after {failures}/{len(self._outcomes)} failures")
+
+    def health(self):
+        """'open' (skip), 'trial' (this thread holds the half-open trial),
+        'degraded' (half-open awaiting a trial, or slow p95) or 'healthy'."""
+        with self._lock:
+            state = self._state()
+            if state == 'open':
+                return 'open'
+            if state == 'half_open' and self._trial_in_flight():
+                return 'trial' if self._trial[0] == threading.get_ident() else 'open'
+            p95 = self._p95()
+            if state == 'half_open' or (p95 is not None and p95 > self.slow_ms):
+                return 'degraded'
+            return 'healthy'
+
+    def snapshot(self):
+        """State, failure rate and p95 latency for metrics."""
+        with self._lock:
+            calls = len(self._outcomes)
+            p95 = self._p95()
+            return {
+                'state': self._state(),
+                'recent_calls': calls,
+                'failure_rate': round(self._outcomes.count(False) / calls, 3) if calls else 0.0,
+                'p95_ms': round(p95, 2) if p95 is not None else None,
+                'trips': self._trips,
+            }
+
 # ------------------------------------------------------------
 # PRICE MONITORING
 # ------------------------------------------------------------
@@ -319,17 +589,91 @@ MONITORED_TOKENS = {
     }
 }
 
-def load_price_cache():
-    """Load cached price data."""
+# In-memory price store. Reads are served from PRICE_STORE; PRICE_CACHE_FILE
+# is only read once for a warm restart and is written back by a background
+# write-behind thread using an atomic replace.
+PRICE_STORE: dict = {}
+PRICE_STORE_LOCK = threading.Lock()
+PRICE_STORE_FLUSH_DELAY = 5  # seconds to coalesce writes before hitting disk
+_price_store_state = {'loaded': False, 'writer': None}
+_price_store_dirty = threading.Event()
+# Serializes flushes: the writer thread and the atexit hook share one temp path
+_PRICE_STORE_FLUSH_LOCK = threading.Lock()
+
+def _atomic_write_json(path, data):
+    """Write *data* as JSON to a temp file and atomically replace *path*."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def _ensure_price_store_loaded():
+    """Warm PRICE_STORE from PRICE_CACHE_FILE on first use. Caller holds PRICE_STORE_LOCK."""
+    if _price_store_state['loaded']:
+        return
+    _price_store_state['loaded'] = True
     if os.path.exists(PRICE_CACHE_FILE):
-        with open(PRICE_CACHE_FILE, 'r') as f:
-            return json.load(f)
-    return {}
+        try:
+            with open(PRICE_CACHE_FILE, 'r') as f:
+                PRICE_STORE.update(json.load(f))
+            logging.info(f"Price store warmed from {PRICE_CACHE_FILE} ({len(PRICE_STORE)} entries)")
+        except (OSError, ValueError) as e:
+            logging.warning(f"Could not warm price store from {PRICE_CACHE_FILE}: {e}")
+
+def flush_price_store():
+    """Write PRICE_STORE to disk if it changed since the last flush."""
+    with _PRICE_STORE_FLUSH_LOCK:
+        if not _price_store_dirty.is_set():
+            return
+        _price_store_dirty.clear()
+        with PRICE_STORE_LOCK:
+            snapshot = dict(PRICE_STORE)
+        try:
+            _atomic_write_json(PRICE_CACHE_FILE, snapshot)
+        except OSError as e:
+            logging.error(f"Failed to persist price store: {e}")
+            _price_store_dirty.set()
+
+def _price_store_writer_loop():
+    """Background write-behind loop: coalesce changes, then flush to disk."""
+    while True:
+        _price_store_dirty.wait()
+        time.sleep(PRICE_STORE_FLUSH_DELAY)
+        flush_price_store()
+
+def _schedule_price_store_flush():
+    """Mark the store dirty and make sure the write-behind thread is running."""
+    _price_store_dirty.set()
+    with PRICE_STORE_LOCK:
+        if _price_store_state['writer'] is None:
+            writer = threading.Thread(target=_price_store_writer_loop, daemon=True, name='price-store-writer')
+            _price_store_state['writer'] = writer
+            writer.start()
+
+def load_price_cache():
+    """Return a snapshot of cached price data (served from memory)."""
+    with PRICE_STORE_LOCK:
+        _ensure_price_store_loaded()
+        return dict(PRICE_STORE)
 
 def save_price_cache(cache):
-    """Save price data to cache."""
-    with open(PRICE_CACHE_FILE, 'w') as f:
-        json.dump(cache, f)
+    """Replace cached price data in memory; disk is updated in the background."""
+    with PRICE_STORE_LOCK:
+        _price_store_state['loaded'] = True
+        PRICE_STORE.clear()
+        PRICE_STORE.update(cache)
+    _schedule_price_store_flush()
+
+def update_price_entry(cache_key, price_data):
+    """Update a single cached price entry in memory; disk is updated in the background."""
+    with PRICE_STORE_LOCK:
+        _ensure_price_store_loaded()
+        PRICE_STORE[cache_key] = price_data
+    _schedule_price_store_flush()
+
+atexit.register(flush_price_store)
 
 # CoinGecko API mapping for tokens (no geo-restrictions, free tier)
 COINGECKO_MAPPING = {
@@ -339,84 +683,165 @@ COINGECKO_MAPPING = {
 }
 
 COINGECKO_CACHE = {}
+COINGECKO_CACHE_LOCK = threading.Lock()
 COINGECKO_CACHE_TTL = 60  # seconds
 COINGECKO_BACKOFF = 5     # initial backoff in seconds
 COINGECKO_MAX_BACKOFF = 60
 
-def get_token_price_coingecko(symbol):
+# Shared free-tier budget (10-30 req/min). Requests over budget are skipped,
+# never slept on, so scheduler and Flask threads are not blocked.
+COINGECKO_REQUESTS_PER_MINUTE = int(os.getenv('COINGECKO_REQUESTS_PER_MINUTE', '10'))
+COINGECKO_LIMITER = TokenBucket(rate=COINGECKO_REQUESTS_PER_MINUTE / 60.0, capacity=3)
+
+# After a 429 no request is sent until this monotonic deadline passes.
+# Scheduler and request threads share it, so it is only touched under the lock.
+_coingecko_backoff = {'until': 0.0, 'delay': COINGECKO_BACKOFF}
+_COINGECKO_BACKOFF_LOCK = threading.Lock()
+
+def _coingecko_price_data(coin_data):
+    """Convert one CoinGecko /simple/price entry into the shared price-data dict."""
+    return {
+        'price': coin_data.get('usd', 0),
+        'high_24h': None,  # CoinGecko simple API doesn't provide this
+        'low_24h': None,   # CoinGecko simple API doesn't provide this
+        'volume_24h': coin_data.get('usd_24h_vol', 0),
+        'change_24h': coin_data.get('usd_24h_change', 0),
+        'timestamp': time.time(),
+        'source': 'coingecko'
+    }
+
+def _fetch_coingecko_simple_prices(coin_ids):
     """
-    Fetch token price from CoinGecko API (fallback when exchanges are geo-blocked).
+    Request /simple/price for every id in *coin_ids* with a single call.
 
-    Note: CoinGecko simple API has limitations:
-    - high_24h and low_24h are not available (returns None)
-    - Downstream consumers should handle None values for these fields
-    - Rate limited: 10-30 req/min on free tier; uses backoff on 429
+    Respects the shared token bucket and any active 429 backoff window; when
+    either blocks the request it returns None immediately instead of sleeping.
 
     Returns:
-        dict: Price data with 'source': 'coingecko' or None on error
+        dict: Raw CoinGecko payload keyed by coin id, or None on error
     """
-    coin_id = COINGECKO_MAPPING.get(symbol)
-    if not coin_id:
-        logging.warning(f"No CoinGecko mapping for {symbol}")
+    ids = ','.join(coin_ids)
+    with _COINGECKO_BACKOFF_LOCK:
+        sent_at = time.monotonic()
+        backing_off = sent_at < _coingecko_backoff['until']
+    if backing_off:
+        logging.debug(f"CoinGecko backoff active, skipping request for {ids}")
+        return None
+    if not COINGECKO_LIMITER.try_acquire():
+        logging.warning(f"CoinGecko request budget exhausted, skipping request for {ids}")
         return None
-
-    cache_key = f"{symbol}_coingecko"
-    now = time.time()
-    if cache_key in COINGECKO_CACHE:
-        cached = COINGECKO_CACHE[cache_key]
-        if now - cached['timestamp'] < COINGECKO_CACHE_TTL:
-            logging.info(f"Using cached CoinGecko price for {symbol}")
-            return cached['data']
 
     url = "https://api.coingecko.com/api/v3/simple/price"
     params = {
-        'ids': coin_id,
+        'ids': ids,
         'vs_currencies': 'usd',
         'include_24hr_change': 'true',
         'include_24hr_vol': 'true'
     }
+    try:
+        response = http_client.get(url, params=params, timeout=10)
+        if response.status_code == 429:
+            with _COINGECKO_BACKOFF_LOCK:
+                # Requests already in flight when another thread backed off
+                # report the same rate limit; count it once
+                if _coingecko_backoff['until'] > sent_at:
+                    return None
+                delay = _coingecko_backoff['delay']
+                _coingecko_backoff['until'] = time.monotonic() + delay
+                _coingecko_backoff['delay'] = min(delay * 2, COINGECKO_MAX_BACKOFF)
+            logging.warning(f"CoinGecko rate limited. Pausing requests for {delay}s...")
+            return None
+        response.raise_for_status()
+        with _COINGECKO_BACKOFF_LOCK:
+            # A reply to a request sent before a newer 429 must not reset its backoff
+            if _coingecko_backoff['until'] <= sent_at:
+                _coingecko_backoff['delay'] = COINGECKO_BACKOFF
+        return response.json()
+
+    except requests.exceptions.HTTPError as e:
+        logging.error(f"HTTP error from CoinGecko for {ids}: {e}")
+        return None
+    except Exception as e:
+        logging.error(f"Failed to fetch price from CoinGecko for {ids}: {e}")
+        return None
 
-    backoff = COINGECKO_BACKOFF
-    retry_limit = 5
-    retries = 0
-    while retries < retry_limit:
-        try:
-            response = requests.get(url, params=params, timeout=10)
-            if response.status_code == 429:
-                logging.warning(f"CoinGecko rate limited. Backing off {backoff}s...")
-                time.sleep(backoff)
-                backoff = min(backoff * 2, COINGECKO_MAX_BACKOFF)
-                retries += 1
-                continue
-            response.raise_for_status()
-            data = response.json()
+def refresh_coingecko_prices():
+    """
+    Resolve every COINGECKO_MAPPING entry with one /simple/price request.
 
+    Fills COINGECKO_CACHE for all mapped symbols at once, so a geo-blocked
+    exchange costs one CoinGecko request per TTL regardless of symbol count.
+
+    Returns:
+        dict: {symbol: price data} for the symbols CoinGecko returned
+    """
+    data = _fetch_coingecko_simple_prices(sorted(set(COINGECKO_MAPPING.values())))
+    if not data:
+        return {}
+
+    now = time.time()
+    results = {}
+    with COINGECKO_CACHE_LOCK:
+        for symbol, coin_id in COINGECKO_MAPPING.items():
             if coin_id not in data:
                 logging.error(f"CoinGecko returned no data for {coin_id}")
-                return None
+                continue
+            result = _coingecko_price_data(data[coin_id])
+            COINGECKO_CACHE[f"{symbol}_coingecko"] = {'timestamp': now, 'data': result}
+            results[symbol] = result
+    return results
 
-            coin_data = data[coin_id]
-            result = {
-                'price': coin_data.get('usd', 0),
-                'high_24h': None,  # CoinGecko simple API doesn't provide this
-                'low_24h': None,   # CoinGecko simple API doesn't provide this
-                'volume_24h': coin_data.get('usd_24h_vol', 0),
-                'change_24h': coin_data.get('usd_24h_change', 0),
-                'timestamp': time.time(),
-                'source': 'coingecko'
-            }
-            COINGECKO_CACHE[cache_key] = {'timestamp': now, 'data': result}
-            return result
+def _cached_coingecko_prices(symbols):
+    """Return {symbol: price data} for *symbols* with a fresh COINGECKO_CACHE entry."""
+    now = time.time()
+    results = {}
+    with COINGECKO_CACHE_LOCK:
+        for symbol in symbols:
+            cached = COINGECKO_CACHE.get(f"{symbol}_coingecko")
+            if cached and now - cached['timestamp'] < COINGECKO_CACHE_TTL:
+                results[symbol] = cached['data']
+    return results
+
+def get_token_prices_coingecko(symbols):
+    """
+    Fetch CoinGecko prices for several symbols.
 
-        except requests.exceptions.HTTPError as e:
-            logging.error(f"HTTP error from CoinGecko for {symbol}: {e}")
-            return None
-        except Exception as e:
-            logging.error(f"Failed to fetch price from CoinGecko for {symbol}: {e}")
-            return None
+    Symbols with a fresh COINGECKO_CACHE entry are served from the cache. If any
+    mapped symbol is stale, all mapped coins are refreshed in one request.
 
-    logging.error(f"CoinGecko rate limit exceeded retry limit ({retry_limit}) for {symbol}")
-    return None
+    Returns:
+        dict: {symbol: price data} for every symbol that could be resolved
+    """
+    mapped = []
+    for symbol in symbols:
+        if symbol in COINGECKO_MAPPING:
+            mapped.append(symbol)
+        else:
+            logging.warning(f"No CoinGecko mapping for {symbol}")
+
+    results = _cached_coingecko_prices(mapped)
+    if len(results) == len(mapped):
+        return results
+
+    refreshed = refresh_coingecko_prices()
+    for symbol in mapped:
+        if symbol in refreshed:
+            results[symbol] = refreshed[symbol]
+    return results
+
+def get_token_price_coingecko(symbol):
+    """
+    Fetch token price from CoinGecko API (fallback when exchanges are geo-blocked).
+
+    Note: CoinGecko simple API has limitations:
+    - high_24h and low_24h are not available (returns None)
+    - Downstream consumers should handle None values for these fields
+    - Rate limited: 10-30 req/min on free tier; shares COINGECKO_LIMITER
+
+    Returns:
+        dict: Price data with 'source': 'coingecko' or None on error
+    """
+    return get_token_prices_coingecko([symbol]).get(symbol)
 
 def is_geo_restriction_error(exception):
     """
@@ -440,23 +865,89 @@ def is_geo_restriction_error(exception):
     ]
     return any(indicator in error_msg for indicator in geo_indicators)
 
+# Process-wide ccxt exchange registry. Each exchange is built once and reused so
+# its HTTP session (connection pool) and loaded markets survive between calls.
+# Sync ccxt instances are not safe for concurrent use, so every call made through
+# exchange_call() holds that exchange's own lock.
+_EXCHANGES: dict = {}  # {exchange_name: {'exchange': ccxt.Exchange, 'lock': Lock}}
+_EXCHANGES_LOCK = threading.Lock()
+EXCHANGE_TIMEOUT_MS = 10000
+
+# Per-exchange call latency counters, exposed via /api/metrics
+EXCHANGE_LATENCY_STATS: dict = {}
+EXCHANGE_LATENCY_STATS_LOCK = threading.Lock()
+
+def get_exchange(exchange_name):
+    """Return the registry entry for *exchange_name*, building the exchange on first use."""
+    with _EXCHANGES_LOCK:
+        entry = _EXCHANGES.get(exchange_name)
+        if entry is None:
+            exchange_cls = getattr(ccxt, exchange_name)
+            entry = {
+                'exchange': exchange_cls({'enableRateLimit': True, 'timeout': EXCHANGE_TIMEOUT_MS}),
+                'lock': threading.Lock(),
+            }
+            _EXCHANGES[exchange_name] = entry
+            logging.info(f"Exchange registry: initialized {exchange_name}")
+        return entry
+
+def _record_exchange_latency(exchange_name, elapsed_ms, ok):
+    """Update latency counters for one exchange call (thread-safe)."""
+    with EXCHANGE_LATENCY_STATS_LOCK:
+        stats = EXCHANGE_LATENCY_STATS.setdefault(exchange_name, {
+            'calls': 0, 'errors': 0, 'total_ms': 0.0, 'last_ms': 0.0, 'max_ms': 0.0
+        })
+        stats['calls'] += 1
+        if not ok:
+            stats['errors'] += 1
+        stats['total_ms'] += elapsed_ms
+        stats['last_ms'] = elapsed_ms
+        stats['max_ms'] = max(stats['max_ms'], elapsed_ms)
+
+def exchange_call(exchange_name, method, *args, **kwargs):
+    """Call *method* on the pooled *exchange_name* instance and record its latency."""
+    entry = get_exchange(exchange_name)
+    start = time.perf_counter()
+    ok = False
+    try:
+        with entry['lock']:
+            result = getattr(entry['exchange'], method)(*args, **kwargs)
+        ok = True
+        return result
+    finally:
+        _record_exchange_latency(exchange_name, (time.perf_counter() - start) * 1000, ok)
+
+def get_exchange_latency_stats():
+    """Return a snapshot of per-exchange latency counters with average latency."""
+    with EXCHANGE_LATENCY_STATS_LOCK:
+        snapshot = {name: dict(stats) for name, stats in EXCHANGE_LATENCY_STATS.items()}
+    for stats in snapshot.values():
+        stats['avg_ms'] = round(stats['total_ms'] / stats['calls'], 2) if stats['calls'] else 0.0
+        stats['total_ms'] = round(stats['total_ms'], 2)
+        stats['last_ms'] = round(stats['last_ms'], 2)
+        stats['max_ms'] = round(stats['max_ms'], 2)
+    return snapshot
+
+def _ticker_to_price_data(ticker, exchange_name):
+    """Convert a ccxt ticker into the shared price-data dict."""
+    return {
+        'price': ticker['last'],
+        'high_24h': ticker['high'],
+        'low_24h': ticker['low'],
+        'volume_24h': ticker['quoteVolume'],
+        'change_24h': ticker['percentage'],
+        'timestamp': time.time(),
+        'source': exchange_name
+    }
+
 def get_token_price(symbol, exchange_name='binance'):
     """
     Fetch current token price from exchange with CoinGecko fallback.
     If the exchange is geo-blocked or fails, automatically falls back to CoinGecko.
     """
     try:
-        exchange = getattr(ccxt, exchange_name)()
-        ticker = exchange.fetch_ticker(symbol)
-        return {
-            'price': ticker['last'],
-            'high_24h': ticker['high'],
-            'low_24h': ticker['low'],
-            'volume_24h': ticker['quoteVolume'],
-            'change_24h': ticker['percentage'],
-            'timestamp': time.time(),
-            'source': exchange_name
-        }
+        ticker = exchange_call(exchange_name, 'fetch_ticker', symbol)
+        return _ticker_to_price_data(ticker, exchange_name)
     except Exception as e:
         # Check if it's a geographic restriction error
         if is_geo_restriction_error(e):
@@ -468,45 +959,311 @@ def get_token_price(symbol, exchange_name='binance'):
             logging.info(f"Attempting CoinGecko fallback for {symbol}...")
             return get_token_price_coingecko(symbol)
 
+def get_token_prices(tokens):
+    """
+    Fetch prices for many symbols with one multi-ticker request per exchange.
+
+    *tokens* maps symbol -> config with an 'exchange' key (e.g. MONITORED_TOKENS).
+    Symbols are grouped by exchange and fetched with fetch_tickers(); anything an
+    exchange misses (geo-block, error, unknown pair) goes to one batched
+    CoinGecko call.
+
+    Returns:
+        dict: {symbol: price data} in the same shape get_token_price() returns
+    """
+    by_exchange = {}
+    for symbol, config in tokens.items():
+        by_exchange.setdefault(config.get('exchange', 'binance'), []).append(symbol)
+
+    results = {}
+    missing = []
+    for exchange_name, symbols in by_exchange.items():
+        try:
+            tickers = exchange_call(exchange_name, 'fetch_tickers', symbols)
+        except Exception as e:
+            if is_geo_restriction_error(e):
+                logging.warning(f"{exchange_name} is geo-blocked for {symbols}, falling back to CoinGecko...")
+            else:
+                logging.error(f"Failed to fetch tickers for {symbols} on {exchange_name}: {e}")
+            tickers = {}
+
+        for symbol in symbols:
+            ticker = tickers.get(symbol)
+            if ticker and ticker.get('last') is not None:
+                results[symbol] = _ticker_to_price_data(ticker, exchange_name)
+            else:
+                missing.append(symbol)
+
+    if missing:
+        logging.info(f"Attempting batched CoinGecko fallback for {missing}...")
+        results.update(get_token_prices_coingecko(missing))
+    return results
+
 def calculate_price_change(old_price, new_price):
     """Calculate percentage change between two prices."""
     if old_price == 0:
         return 0
     return ((new_price - old_price) / old_price) * 100
 
+# Rolling per-symbol price history. Samples live in fixed-size NumPy ring
+# buffers (one row per symbol) so windowed change, volatility and z-score are
+# computed for every symbol at once. Metrics are recomputed when samples are
+# recorded, so /api/prices and the dashboard only read a snapshot.
+PRICE_HISTORY_SIZE = int(os.getenv('PRICE_HISTORY_SIZE', '288'))  # 24h of 5-minute samples
+PRICE_METRIC_WINDOWS = {'1h': 3600, '4h': 14400, '24h': 86400}
+PRICE_DRIFT_WINDOW = '1h'          # window checked for slow multi-tick drift
+PRICE_ZSCORE_THRESHOLD = 3.0       # alert when latest price is this many std devs from the mean
+PRICE_ZSCORE_MIN_SAMPLES = 12      # need an hour of samples before trusting z-scores
+PRICE_ZSCORE_MIN_CHANGE = 1.0      # ...and at least this % move so flat markets stay quiet
+
+PRICE_HISTORY_LOCK = threading.Lock()
+_price_history = {
+    'rows': {},  # {symbol: row index}
+    'ts': np.full((0, PRICE_HISTORY_SIZE), np.nan),
+    'price': np.full((0, PRICE_HISTORY_SIZE), np.nan),
+    'head': np.zeros(0, dtype=np.int64),
+}
+_price_metrics_snapshot: dict = {}
+
+def _price_history_row(symbol):
+    """Return the ring-buffer row for *symbol*, adding one if needed. Caller holds PRICE_HISTORY_LOCK."""
+    row = _price_history['rows'].get(symbol)
+    if row is None:
+        row = len(_price_history['rows'])
+        _price_history['rows'][symbol] = row
+        empty = np.full((1, PRICE_HISTORY_SIZE), np.nan)
+        _price_history['ts'] = np.vstack([_price_history['ts'], empty])
+        _price_history['price'] = np.vstack([_price_history['price'], empty])
+        _price_history['head'] = np.append(_price_history['head'], 0)
+    return row
+
+def compute_price_metrics(ts, prices, now):
+    """
+    Compute windowed % change, volatility and z-score for every row at once.
+
+    Args:
+        ts: (symbols, samples) array of sample timestamps, NaN where empty
+        prices: matching array of prices
+        now: reference timestamp for the windows
+
+    Returns:
+        dict of 1-D arrays: 'samples', 'latest', 'change_<window>', 'volatility', 'zscore'
+    """
+    rows = np.arange(ts.shape[0])
+    valid = ~np.isnan(ts)
+    latest = prices[rows, np.where(valid, ts, -np.inf).argmax(axis=1)]
+    metrics = {'samples': valid.sum(axis=1), 'latest': latest}
+
+    with np.errstate(divide='ignore', invalid='ignore'), warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        for label, window in PRICE_METRIC_WINDOWS.items():
+            in_window = valid & (ts >= now - window)
+            reference = prices[rows, np.where(in_window, ts, np.inf).argmin(axis=1)]
+            change = (latest - reference) / reference * 100
+            metrics[f'change_{label}'] = np.where(in_window.any(axis=1) & (reference != 0), change, np.nan)
+
+        # Chronological order per row (empty slots sort last) for log returns
+        order = np.argsort(np.where(valid, ts, np.inf), axis=1)
+        ordered = np.take_along_axis(prices, order, axis=1)
+        log_returns = np.diff(np.log(ordered), axis=1)
+        metrics['volatility'] = np.nanstd(log_returns, axis=1) * 100
+
+        std = np.nanstd(prices, axis=1)
+        zscore = (latest - np.nanmean(prices, axis=1)) / std
+        metrics['zscore'] = np.where(std > 0, zscore, 0.0)
+    return metrics
+
+def _nan_to_none(value, digits=4):
+    """Round a float for JSON output, mapping NaN/inf to None."""
+    return round(value, digits) if np.isfinite(value) else None
+
+def _refresh_price_metrics_locked(now):
+    """Recompute the metrics snapshot served to the API. Caller holds PRICE_HISTORY_LOCK."""
+    global _price_metrics_snapshot
+    metrics = compute_price_metrics(_price_history['ts'], _price_history['price'], now)
+    columns = {name: values.tolist() for name, values in metrics.items()}
+    snapshot = {}
+    for symbol, row in _price_history['rows'].items():
+        snapshot[symbol] = {
+            'samples': columns['samples'][row],
+            'latest': _nan_to_none(columns['latest'][row]),
+            'change_pct': {
+                label: _nan_to_none(columns[f'change_{label}'][row], 2)
+                for label in PRICE_METRIC_WINDOWS
+            },
+            'volatility_pct': _nan_to_none(columns['volatility'][row]),
+            'zscore': _nan_to_none(columns['zscore'][row], 2),
+        }
+    _price_metrics_snapshot = snapshot
+
+def record_price_samples(samples, now=None):
+    """Append {symbol: price} samples to the ring buffers and refresh metrics."""
+    now = time.time() if now is None else now
+    with PRICE_HISTORY_LOCK:
+        for symbol, price in samples.items():
+            if price is None:
+                continue
+            row = _price_history_row(symbol)
+            head = _price_history['head'][row]
+            _price_history['ts'][row, head] = now
+            _price_history['price'][row, head] = price
+            _price_history['head'][row] = (head + 1) % PRICE_HISTORY_SIZE
+        _refresh_price_metrics_locked(now)
+
+def get_price_metrics():
+    """Return the latest per-symbol metrics snapshot (no computation per call)."""
+    return _price_metrics_snapshot
+
+def get_price_history(symbol):
+    """Return chronological {'timestamps': [...], 'prices': [...]} for *symbol*."""
+    with PRICE_HISTORY_LOCK:
+        row = _price_history['rows'].get(symbol)
+        if row is None:
+            return {'timestamps': [], 'prices': []}
+        shift = -int(_price_history['head'][row])
+        ts = np.roll(_price_history['ts'][row], shift)
+        prices = np.roll(_price_history['price'][row], shift)
+    valid = ~np.isnan(ts)
+    return {'timestamps': ts[valid].tolist(), 'prices': prices[valid].tolist()}
+
+def evaluate_price_alert(config, tick_change, symbol_metrics=None):
+    """
+    Decide whether a symbol's latest move deserves an alert.
+
+    Considers the tick-to-tick change, the drift over PRICE_DRIFT_WINDOW and
+    the rolling z-score from the price history.
+
+    Returns:
+        float: The % change to report, or None when no alert should fire
+    """
+    symbol_metrics = symbol_metrics or {}
+    drift = symbol_metrics.get('change_pct', {}).get(PRICE_DRIFT_WINDOW)
+    candidates = [c for c in (tick_change, drift) if c is not None]
+    if not candidates:
+        return None
+    change = max(candidates, key=abs)
+
+    if change > 0 and change >= config['alert_threshold_up']:
+        return change
+    if change < 0 and abs(change) >= config['alert_threshold_down']:
+        return change
+
+    zscore = symbol_metrics.get('zscore')
+    if (zscore is not None
+            and symbol_metrics.get('samples', 0) >= PRICE_ZSCORE_MIN_SAMPLES
+            and abs(zscore) >= PRICE_ZSCORE_THRESHOLD
+            and abs(change) >= PRICE_ZSCORE_MIN_CHANGE):
+        return change
+    return None
+
+# Optional streaming mode: a websocket ticker feed keeps PRICE_STORE current and
+# evaluates alerts as prices arrive. check_price_alerts() keeps sampling history
+# on its 5-minute tick and only polls REST for symbols the stream has gone quiet on.
+_price_stream = None
+
+def handle_stream_price(symbol, price_data):
+    """Store a streamed ticker and evaluate alerts against the latest history sample."""
+    config = MONITORED_TOKENS.get(symbol)
+    if not config:
+        return
+    update_price_entry(f"{symbol}_{config['exchange']}", price_data)
+
+    symbol_metrics = get_price_metrics().get(symbol)
+    if not symbol_metrics or symbol_metrics.get('latest') is None:
+        return
+    tick_change = calculate_price_change(symbol_metrics['latest'], price_data['price'])
+    price_change = evaluate_price_alert(config, tick_change, symbol_metrics)
+    if price_change is None:
+        return
+    reserved_at = reserve_price_alert_cooldown(symbol)
+    if reserved_at is not None:
+        # Posting blocks on Twitter; keep it off the websocket thread
+        PRICE_ALERT_EXECUTOR.submit(_post_reserved_price_alert, symbol, price_data, price_change, reserved_at)
+
+def _post_reserved_price_alert(symbol, price_data, price_change, reserved_at):
+    """Post an alert whose cooldown slot is already reserved; give the slot back if it is not posted."""
+    posted = False
+    try:
+        posted = post_price_alert(symbol, price_data, price_change)
+    except Exception as e:
+        logging.error(f"Price alert for {symbol} failed: {e}")
+    finally:
+        if not posted:
+            release_price_alert_cooldown(symbol, reserved_at)
+
+def start_price_stream():
+    """Start the websocket price feed for streamable monitored tokens, if enabled."""
+    global _price_stream
+    if not price_stream.PRICE_STREAM_ENABLED:
+        return
+    if not price_stream.WEBSOCKETS_AVAILABLE:
+        logging.warning("PRICE_STREAM_ENABLED is set but websockets is not installed; using REST polling")
+        return
+    symbols = [s for s, config in MONITORED_TOKENS.items() if config['exchange'] == 'binance']
+    if not symbols or _price_stream is not None:
+        return
+    _price_stream = price_stream.PriceStream(symbols, handle_stream_price)
+    _price_stream.start()
+
+def _current_prices_by_source():
+    """(streamed, polled): fresh stream prices, and REST prices for every other symbol."""
+    streamed = _price_stream.fresh_prices() if _price_stream else {}
+    stale = {s: config for s, config in MONITORED_TOKENS.items() if s not in streamed}
+    polled = {}
+    if stale:
+        if _price_stream:
+            logging.info(f"Price stream stale for {list(stale)}, polling REST")
+        polled = get_token_prices(stale)
+    return streamed, polled
+
+def get_current_prices():
+    """Fresh streamed prices where available, REST prices for everything else."""
+    streamed, polled = _current_prices_by_source()
+    return {**streamed, **polled}
+
 def check_price_alerts():
-    """Monitor token prices and generate alerts."""
+    """Monitor token prices and generate alerts.
+
+    Alerts fire on a large tick-to-tick move, a slow drift across
+    PRICE_DRIFT_WINDOW, or an outlier z-score against the rolling history.
+    """
     price_cache = load_price_cache()
+    streamed, polled = _current_prices_by_source()
+    prices = {**streamed, **polled}
+    # The baseline is the previous history sample, taken before this tick is
+    # recorded: the stream keeps PRICE_STORE current, so the cached price would
+    # already equal a streamed price
+    baseline = get_price_metrics()
+    record_price_samples({symbol: data['price'] for symbol, data in prices.items()})
+    metrics = get_price_metrics()
     
     for symbol, config in MONITORED_TOKENS.items():
-        current_data = get_token_price(symbol, config['exchange'])
+        current_data = prices.get(symbol)
         
         if not current_data:
             continue
             
         current_price = current_data['price']
-        change_24h = current_data['change_24h']
         
-        # Check if we have previous data
+        # Compare against the previous sample if we have one
         cache_key = f"{symbol}_{config['exchange']}"
-        if cache_key in price_cache:
-            old_price = price_cache[cache_key]['price']
-            price_change = calculate_price_change(old_price, current_price)
-            
-            # Check for significant price movements with correct threshold logic
-            should_alert = False
-            if price_change > 0 and price_change >= config['alert_threshold_up']:
-                should_alert = True
-            elif price_change < 0 and abs(price_change) >= config['alert_threshold_down']:
-                should_alert = True
-            
-            if should_alert and not is_price_alert_on_cooldown(symbol):
-                post_price_alert(symbol, current_data, price_change)
+        previous = (baseline.get(symbol) or {}).get('latest')
+        if previous is None and symbol in polled and cache_key in price_cache:
+            previous = price_cache[cache_key]['price']  # warm restart: no history yet
+        tick_change = None
+        if previous is not None:
+            tick_change = calculate_price_change(previous, current_price)
+
+        price_change = evaluate_price_alert(config, tick_change, metrics.get(symbol))
+        if price_change is not None:
+            reserved_at = reserve_price_alert_cooldown(symbol)
+            if reserved_at is not None:
+                _post_reserved_price_alert(symbol, current_data, price_change, reserved_at)
         
-        # Update cache
-        price_cache[cache_key] = current_data
-    
-    save_price_cache(price_cache)
+        # Only REST prices are new here; streamed ones are already in the store
+        # and may have moved on since this snapshot
+        if symbol in polled:
+            update_price_entry(cache_key, current_data)
 
 def create_fallback_alert_message(token_name, price_change, price):
     """Create a guaranteed short fallback alert message with dynamic personality."""
@@ -520,10 +1277,10 @@ def create_fallback_alert_message(token_name, price_change, price):
     )
 
 def post_price_alert(symbol, price_data, price_change):
-    """Post a price alert to Twitter with Overseer personality."""
+    """Post a price alert to Twitter with Overseer personality. Returns True if it was posted."""
     if not TWITTER_ENABLED or not client:
         logging.debug(f"Skipping price alert for {symbol} - Twitter not enabled")
-        return
+        return False
     
     try:
         token_name = symbol.split('/')[0]
@@ -561,13 +1318,14 @@ def post_price_alert(symbol, price_data, price_change):
         
         if is_duplicate_tweet(message):
             logging.debug(f"Skipping duplicate price alert for {symbol}")
-            return
+            return False
 
         client.create_tweet(text=message)
         mark_tweet_sent(message)
         mark_price_alert_sent(symbol)
         logging.info(f"Posted price alert for {symbol}: {price_change:+.2f}%")
         add_activity("PRICE_ALERT", f"{symbol} {price_change:+.2f}% - ${price_data['price']:.2f}")
+        return True
         
     except tweepy.TweepyException as e:
         if _is_twitter_duplicate_error(e):
@@ -575,6 +1333,7 @@ def post_price_alert(symbol, price_data, price_change):
         else:
             logging.error(f"Failed to post price alert: {e}")
             add_activity("ERROR", f"Price alert failed for {symbol}: {str(e)}")
+        return False
 
 def post_market_summary():
     """Post a market summary with multiple token prices."""
@@ -584,9 +1343,10 @@ def post_market_summary():
     
     try:
         summary_lines = ["📊 WASTELAND MARKET REPORT 📊\n"]
+        prices = get_current_prices()
         
-        for symbol, config in MONITORED_TOKENS.items():
-            data = get_token_price(symbol, config['exchange'])
+        for symbol in MONITORED_TOKENS:
+            data = prices.get(symbol)
             if data:
                 token_name = symbol.split('/')[0]
                 emoji = "🟢" if data['change_24h'] > 0 else "🔴"
@@ -707,13 +1467,71 @@ def health_check():
 
 @app.route("/overseer-event", methods=["POST"])
 def overseer_event():
-    """Webhook endpoint for overseer events"""
+    """
+    Webhook endpoint for overseer events
+
+    Validates the event and queues it for the dispatcher thread; tweets are
+    posted off the request thread, so the response is 202 Accepted.
+    """
+    if not verify_webhook_auth():
+        return {"ok": False, "error": "Unauthorized"}, 401
+
+    event = request.get_json(silent=True)
+    error = validate_overseer_event(event)
+    if error:
+        record_rejected_event()
+        return {"ok": False, "error": error}, 400
+    if not enqueue_overseer_event(event):
+        return {"ok": False, "error": "Event queue full"}, 503
+    return {"ok": True, "queued": True}, 202
+
+@app.route("/overseer-events", methods=["POST"])
+def overseer_events_batch():
+    """
+    Batch webhook endpoint: a JSON array or NDJSON body of overseer events
+
+    Authenticates once, parses the body incrementally from request.stream and
+    queues each valid event like /overseer-event. Returns 202 with one result
+    per event in body order; a body that stops parsing part-way also reports
+    the error, keeping the results for the events before it. Returns 400 when
+    no event was accepted.
+    """
     if not verify_webhook_auth():
         return {"ok": False, "error": "Unauthorized"}, 401
 
-    event = request.json
-    overseer_event_bridge(event)
-    return {"ok": True}
+    results = []
+    accepted = 0
+    error = None
+    try:
+        values = event_stream.iter_json_values(request.stream, max_value_bytes=EVENT_MAX_BYTES)
+        for index, (event, parse_error) in enumerate(values):
+            if index >= EVENT_BATCH_MAX_EVENTS:
+                error = f"Batch limit of {EVENT_BATCH_MAX_EVENTS} events exceeded"
+                break
+            reason = parse_error or validate_overseer_event(event)
+            if reason:
+                record_rejected_event()
+            elif not enqueue_overseer_event(event):
+                reason = "Event queue full"
+            if reason:
+                results.append({"index": index, "ok": False, "error": reason})
+            else:
+                accepted += 1
+                results.append({"index": index, "ok": True})
+    except event_stream.EventStreamError as e:
+        error = str(e)
+
+    if not results:
+        return {"ok": False, "error": error or "No events in request body"}, 400
+    payload = {"ok": error is None, "accepted": accepted,
+               "rejected": len(results) - accepted, "results": results}
+    if error:
+        payload["error"] = error
+    if not accepted:
+        payload["ok"] = False
+        payload.setdefault("error", "No valid events in request body")
+        return payload, 400
+    return payload, 202
 
 # ------------------------------------------------------------
 # MONITORING UI ROUTES
@@ -1098,15 +1916,23 @@ def monitoring_dashboard():
                             <th>Token</th>
                             <th>Price</th>
                             <th>24h Change</th>
+                            <th>1h Drift</th>
+                            <th>Volatility</th>
                             <th>Last Updated</th>
                         </tr>
                         {% for token, data in price_data.items() %}
+                        {% set metrics = price_metrics.get(token.split('_')[0], {}) %}
+                        {% set drift = metrics.get('change_pct', {}).get('1h') %}
                         <tr>
                             <td>{{ token }}</td>
                             <td>${{ "%.2f"|format(data.price) if data.price else 'N/A' }}</td>
                             <td class="{{ 'positive' if data.change_24h > 0 else 'negative' }}">
                                 {{ "%+.2f"|format(data.change_24h) if data.change_24h else 'N/A' }}%
                             </td>
+                            <td class="{{ 'positive' if drift and drift > 0 else 'negative' }}">
+                                {{ "%+.2f"|format(drift) ~ '%' if drift is not none else 'N/A' }}
+                            </td>
+                            <td>{{ "%.3f"|format(metrics.volatility_pct) ~ '%' if metrics.volatility_pct is not none else 'N/A' }}</td>
                             <td>{{ data.timestamp[:19] if data.timestamp else 'N/A' }}</td>
                         </tr>
                         {% endfor %}
@@ -1228,6 +2054,8 @@ def monitoring_dashboard():
                         <li><a href="/api/jobs">/api/jobs</a> - Scheduler jobs JSON</li>
                         <li><a href="/api/activities">/api/activities</a> - Recent activities JSON</li>
                         <li><a href="/api/alerts">/api/alerts</a> - Recent alerts JSON</li>
+                        <li><a href="/api/metrics">/api/metrics</a> - Performance counters JSON</li>
+                        <li><a href="/api/llm/cache">/api/llm/cache</a> - LLM cache hit rate and savings JSON</li>
                     </ul>
                     
                     <h3>Wallet APIs:</h3>
@@ -1265,6 +2093,7 @@ curl -u {{ admin_user }}:PASSWORD https://your-domain.com/api/status
         price_cache_count=len(price_cache),
         safety_cache_count=len(TOKEN_SAFETY_CACHE),
         price_data=price_cache,
+        price_metrics=get_price_metrics(),
         jobs=jobs_info,
         activities=activities_copy,
         wallet_enabled=WALLET_ENABLED and ENABLE_WALLET_UI,
@@ -1291,10 +2120,39 @@ def api_status():
 def api_prices():
     """JSON endpoint for current prices"""
     price_cache = load_price_cache()
-    return {
+    payload = {
         "prices": price_cache,
+        "metrics": get_price_metrics(),
         "monitored_tokens": list(MONITORED_TOKENS.keys())
     }
+    if request.args.get('history', '').lower() in ('1', 'true'):
+        payload["history"] = {symbol: get_price_history(symbol) for symbol in MONITORED_TOKENS}
+    return payload
+
+@app.route("/api/metrics")
+@auth.login_required
+def api_metrics():
+    """JSON endpoint for internal performance counters"""
+    return jsonify({
+        "exchanges": get_exchange_latency_stats(),
+        "http_hosts": http_client.get_host_stats(),
+        "llm_providers": get_llm_latency_stats(),
+        "llm_executor": get_llm_executor_stats(),
+        "llm_breakers": get_llm_breaker_stats(),
+        "llm_streaming": get_llm_stream_stats(),
+        "broadcast_buffer": get_broadcast_buffer_stats(),
+        "user_cache": get_user_cache_stats(),
+        "twitter_sender": get_twitter_sender_stats(),
+        "event_queue": get_event_queue_stats(),
+        "event_digest": get_event_digest_stats(),
+        "price_stream": _price_stream.status() if _price_stream else {"enabled": False},
+    })
+
+@app.route("/api/llm/cache")
+@auth.login_required
+def api_llm_cache():
+    """JSON endpoint for LLM response cache effectiveness"""
+    return jsonify(get_llm_cache_stats())
 
 @app.route("/api/jobs")
 @auth.login_required
@@ -1449,8 +2307,8 @@ def api_manual_price_check():
         return {"error": "symbol required (e.g., 'SOL/USDT')"}, 400
     
     try:
-        exchange = ccxt.binance() if exchange_name == 'binance' else ccxt.coinbase()
-        ticker = exchange.fetch_ticker(symbol)
+        registry_name = 'binance' if exchange_name == 'binance' else 'coinbase'
+        ticker = exchange_call(registry_name, 'fetch_ticker', symbol)
         
         result = {
             "symbol": symbol,
@@ -1519,7 +2377,7 @@ def check_token_safety(token_address: str, chain: str = 'eth') -> dict:
         # Use honeypot.is API for basic checks
         chain_id = CHAIN_IDS.get(chain, '1')
         honeypot_api = f"https://api.honeypot.is/v2/IsHoneypot?address={token_address}&chainID={chain_id}"
-        response = requests.get(honeypot_api, timeout=5)
+        response = http_client.get(honeypot_api, timeout=5)
         
         if response.status_code == 200:
             data = response.json()
@@ -1565,13 +2423,42 @@ def check_token_safety(token_address: str, chain: str = 'eth') -> dict:
 # ------------------------------------------------------------
 # Tracks hashes of recently posted tweet texts to avoid Twitter 187 errors.
 # dict of {md5_hash: posted_timestamp}; entries expire after 24 hours.
+# _RECENT_TWEET_ORDER holds (timestamp, hash) in posting order so expiry only
+# pops from the left instead of scanning the whole dict.
 RECENT_TWEET_HASHES: dict = {}
+_RECENT_TWEET_ORDER = deque()
 RECENT_TWEET_HASHES_LOCK = threading.Lock()
 TWEET_DEDUP_WINDOW_SECONDS = 86400  # 24 hours
+_tweet_dedup_state = {'loaded': False}
+
+# Posted-tweet hashes, price alert cooldowns and mention state are also written
+# to a local SQLite file so a restart inside their windows does not allow reposts.
+# Like PRICE_CACHE_FILE it lives in the working directory unless STATE_DB_FILE says otherwise.
+STATE_PERSIST = os.getenv('STATE_PERSIST', 'true').lower() == 'true'
+STATE_DB_FILE = os.getenv('STATE_DB_FILE', 'overseer_state.db')
+STATE_STORE = state_store.SQLiteStore(STATE_DB_FILE, [
+    "CREATE TABLE IF NOT EXISTS tweet_hashes ("
+    "hash TEXT PRIMARY KEY, sent_at REAL NOT NULL, text TEXT NOT NULL DEFAULT '')",
+    "CREATE INDEX IF NOT EXISTS idx_tweet_hashes_sent_at ON tweet_hashes (sent_at)",
+    "CREATE TABLE IF NOT EXISTS price_alert_cooldowns (symbol TEXT PRIMARY KEY, sent_at REAL NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS processed_mentions (tweet_id INTEGER PRIMARY KEY, processed_at REAL NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS idx_processed_mentions_at ON processed_mentions (processed_at)",
+    "CREATE TABLE IF NOT EXISTS bot_state (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+])
+atexit.register(STATE_STORE.flush)
+# Near-duplicate guard: reworded copies of recent posts (one or two words changed)
+# still get rejected by Twitter as duplicates, so they are caught before posting
+TWEET_SIMILARITY_THRESHOLD = float(os.getenv('TWEET_SIMILARITY_THRESHOLD', '0.7'))
+NEAR_DUPLICATE_INDEX = near_duplicate.NearDuplicateIndex(
+    threshold=TWEET_SIMILARITY_THRESHOLD, window_seconds=TWEET_DEDUP_WINDOW_SECONDS)
 
 # Per-symbol price alert cooldown (1 hour between alerts for same token).
 PRICE_ALERT_COOLDOWNS: dict = {}
+PRICE_ALERT_COOLDOWNS_LOCK = threading.Lock()
 PRICE_ALERT_COOLDOWN_SECONDS = 3600  # 1 hour
+_price_cooldown_state = {'loaded': False}
+# Streamed alerts are posted here so the websocket thread never waits on Twitter
+PRICE_ALERT_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='price-alert')
 
 # ------------------------------------------------------------
 # FALLOUT WIKI LORE FETCHER
@@ -1595,6 +2482,10 @@ _WIKI_LORE_TOPICS = [
 # {topic: (fetched_timestamp, snippet_text)}
 _wiki_lore_cache: dict = {}
 _WIKI_CACHE_TTL = 7200  # 2 hours
+_WIKI_API_URL = "https://fallout.fandom.com/api.php"
+
+# Lore is optional and fetched on the tweet path, so fail fast instead of retrying
+http_client.configure_host(_WIKI_API_URL, max_retries=0)
 
 
 def fetch_fallout_wiki_snippet(topic: str) -> str | None:
@@ -1619,8 +2510,8 @@ def fetch_fallout_wiki_snippet(topic: str) -> str | None:
             "exsentences": 3,
             "format": "json",
         }
-        resp = requests.get(
-            "https://fallout.fandom.com/api.php",
+        resp = http_client.get(
+            _WIKI_API_URL,
             params=params,
             timeout=8,
             headers={"User-Agent": "OverseerBot/1.0 (AtomicFizzCaps; contact@atomicfizzcaps.xyz)"},
@@ -1679,32 +2570,142 @@ def _tweet_hash(text: str) -> str:
     """Return the MD5 hex digest of a tweet text string."""
     return hashlib.md5(text.encode("utf-8")).hexdigest()
 
+def _ensure_tweet_dedup_loaded():
+    """Restore in-window tweet hashes from STATE_STORE once. Caller holds RECENT_TWEET_HASHES_LOCK."""
+    if _tweet_dedup_state['loaded']:
+        return
+    _tweet_dedup_state['loaded'] = True
+    if not STATE_PERSIST:
+        return
+    try:
+        rows = STATE_STORE.query(
+            "SELECT hash, sent_at, text FROM tweet_hashes WHERE sent_at >= ? ORDER BY sent_at",
+            (time.time() - TWEET_DEDUP_WINDOW_SECONDS,),
+        )
+    except Exception as e:
+        logging.warning(f"Could not restore tweet dedup state: {e}")
+        return
+    for h, sent_at, text in rows:
+        RECENT_TWEET_HASHES[h] = sent_at
+        _RECENT_TWEET_ORDER.append((sent_at, h))
+        if text:
+            NEAR_DUPLICATE_INDEX.add(text, now=sent_at)
+    if rows:
+        logging.info(f"Restored {len(rows)} recent tweet hashes for deduplication")
+
+def _expire_tweet_hashes(now: float) -> None:
+    """Drop entries older than the dedup window. Caller holds RECENT_TWEET_HASHES_LOCK."""
+    cutoff = now - TWEET_DEDUP_WINDOW_SECONDS
+    while _RECENT_TWEET_ORDER and _RECENT_TWEET_ORDER[0][0] < cutoff:
+        ts, h = _RECENT_TWEET_ORDER.popleft()
+        # A re-posted text has a newer timestamp in the dict; keep that one
+        if RECENT_TWEET_HASHES.get(h) == ts:
+            del RECENT_TWEET_HASHES[h]
+
 def is_duplicate_tweet(text: str) -> bool:
     """Return True if the same tweet text was posted within the dedup window."""
     h = _tweet_hash(text)
     now = time.time()
     with RECENT_TWEET_HASHES_LOCK:
-        # Expire old entries
-        expired = [k for k, ts in RECENT_TWEET_HASHES.items()
-                   if now - ts > TWEET_DEDUP_WINDOW_SECONDS]
-        for k in expired:
-            del RECENT_TWEET_HASHES[k]
+        _ensure_tweet_dedup_loaded()
+        _expire_tweet_hashes(now)
         return h in RECENT_TWEET_HASHES
 
+def is_near_duplicate_tweet(text: str) -> bool:
+    """Return True if *text* matches or closely resembles a tweet posted within the dedup window."""
+    if is_duplicate_tweet(text):
+        return True
+    if NEAR_DUPLICATE_INDEX.is_near_duplicate(text):
+        logging.debug(f"Near-duplicate tweet suppressed: {text[:60]}")
+        return True
+    return False
+
 def mark_tweet_sent(text: str) -> None:
     """Record that a tweet was successfully posted."""
     h = _tweet_hash(text)
+    now = time.time()
     with RECENT_TWEET_HASHES_LOCK:
-        RECENT_TWEET_HASHES[h] = time.time()
+        _ensure_tweet_dedup_loaded()
+        RECENT_TWEET_HASHES[h] = now
+        _RECENT_TWEET_ORDER.append((now, h))
+        _expire_tweet_hashes(now)
+    if STATE_PERSIST:
+        STATE_STORE.execute_async(
+            "INSERT OR REPLACE INTO tweet_hashes (hash, sent_at, text) VALUES (?, ?, ?)", (h, now, text))
+    NEAR_DUPLICATE_INDEX.add(text, now=now)
+
+def compact_state_store() -> None:
+    """Delete dedup, cooldown and processed-mention entries that have left their windows."""
+    now = time.time()
+    if not STATE_PERSIST:
+        with _MENTION_STATE_LOCK:
+            for tweet_id, processed_at in list(_PROCESSED_MENTIONS.items()):
+                if processed_at < now - PROCESSED_MENTIONS_RETENTION_SECONDS:
+                    del _PROCESSED_MENTIONS[tweet_id]
+        return
+    STATE_STORE.execute_async("DELETE FROM tweet_hashes WHERE sent_at < ?",
+                              (now - TWEET_DEDUP_WINDOW_SECONDS,))
+    STATE_STORE.execute_async("DELETE FROM price_alert_cooldowns WHERE sent_at < ?",
+                              (now - PRICE_ALERT_COOLDOWN_SECONDS,))
+    STATE_STORE.execute_async("DELETE FROM processed_mentions WHERE processed_at < ?",
+                              (now - PROCESSED_MENTIONS_RETENTION_SECONDS,))
+
+def _ensure_price_cooldowns_loaded():
+    """Restore active price alert cooldowns from STATE_STORE once. Caller holds PRICE_ALERT_COOLDOWNS_LOCK."""
+    if _price_cooldown_state['loaded']:
+        return
+    _price_cooldown_state['loaded'] = True
+    if not STATE_PERSIST:
+        return
+    try:
+        rows = STATE_STORE.query(
+            "SELECT symbol, sent_at FROM price_alert_cooldowns WHERE sent_at >= ?",
+            (time.time() - PRICE_ALERT_COOLDOWN_SECONDS,),
+        )
+    except Exception as e:
+        logging.warning(f"Could not restore price alert cooldowns: {e}")
+        return
+    for symbol, sent_at in rows:
+        if sent_at > PRICE_ALERT_COOLDOWNS.get(symbol, 0):
+            PRICE_ALERT_COOLDOWNS[symbol] = sent_at
 
 def is_price_alert_on_cooldown(symbol: str) -> bool:
     """Return True if a price alert for *symbol* was posted within the cooldown window."""
-    last = PRICE_ALERT_COOLDOWNS.get(symbol, 0)
+    with PRICE_ALERT_COOLDOWNS_LOCK:
+        _ensure_price_cooldowns_loaded()
+        last = PRICE_ALERT_COOLDOWNS.get(symbol, 0)
     return (time.time() - last) < PRICE_ALERT_COOLDOWN_SECONDS
 
+def reserve_price_alert_cooldown(symbol: str):
+    """Claim the cooldown slot for *symbol* before posting.
+
+    Check and claim happen under one lock, so of two callers racing on the
+    same move only one gets a timestamp back; the other gets None. Pass the
+    timestamp to release_price_alert_cooldown if the alert is not posted.
+    """
+    now = time.time()
+    with PRICE_ALERT_COOLDOWNS_LOCK:
+        _ensure_price_cooldowns_loaded()
+        if now - PRICE_ALERT_COOLDOWNS.get(symbol, 0) < PRICE_ALERT_COOLDOWN_SECONDS:
+            return None
+        PRICE_ALERT_COOLDOWNS[symbol] = now
+    return now
+
+def release_price_alert_cooldown(symbol: str, reserved_at: float) -> None:
+    """Undo a reservation that did not lead to a posted alert."""
+    with PRICE_ALERT_COOLDOWNS_LOCK:
+        if PRICE_ALERT_COOLDOWNS.get(symbol) == reserved_at:
+            del PRICE_ALERT_COOLDOWNS[symbol]
+
 def mark_price_alert_sent(symbol: str) -> None:
     """Record that a price alert was just posted for *symbol*."""
-    PRICE_ALERT_COOLDOWNS[symbol] = time.time()
+    now = time.time()
+    with PRICE_ALERT_COOLDOWNS_LOCK:
+        _ensure_price_cooldowns_loaded()
+        PRICE_ALERT_COOLDOWNS[symbol] = now
+    if STATE_PERSIST:
+        STATE_STORE.execute_async(
+            "INSERT OR REPLACE INTO price_alert_cooldowns (symbol, sent_at) VALUES (?, ?)", (symbol, now))
 
 def _is_twitter_duplicate_error(exc: tweepy.TweepyException) -> bool:
     """Return True when Twitter rejected the tweet as a duplicate (error 187)."""
@@ -1725,9 +2726,215 @@ def load_json_set(filename):
             return set(json.load(f))
     return set()
 
-def save_json_set(data, filename):
-    with open(filename, 'w') as f:
-        json.dump(list(data), f)
+# ------------------------------------------------------------
+# MENTION INGESTION STATE
+# Mentions are fetched incrementally with since_id (the highest mention ID
+# fully handled so far). Replied-to IDs go into the processed_mentions table,
+# which guards mentions above a failed one from a second reply; rows older
+# than the retention window are compacted away, since since_id has moved past them.
+# When catching up stops at MENTIONS_MAX_PAGES with older pages still unread,
+# until_id marks the oldest mention fetched; later runs read the gap between
+# since_id and until_id first, and since_id only advances once it is closed.
+# With STATE_PERSIST off all of this lives in memory only and resets on restart.
+# ------------------------------------------------------------
+MENTIONS_SINCE_ID_KEY = 'mentions_since_id'
+MENTIONS_UNTIL_ID_KEY = 'mentions_until_id'
+MENTIONS_PAGE_SIZE = 50
+MENTIONS_MAX_PAGES = int(os.getenv('MENTIONS_MAX_PAGES', '4'))  # pages fetched per run when catching up
+PROCESSED_MENTIONS_RETENTION_SECONDS = 7 * 86400
+MENTION_REPLY_MAX_ATTEMPTS = 3  # after this many failed replies a mention no longer holds back since_id
+# The since_id / until_id entries are only used with STATE_PERSIST off
+_mention_state = {'migrated': False, MENTIONS_SINCE_ID_KEY: None, MENTIONS_UNTIL_ID_KEY: None}
+_PROCESSED_MENTIONS: dict = {}  # tweet_id -> processed_at, only used with STATE_PERSIST off
+_MENTION_FAILURES: dict = {}  # tweet_id -> failed reply attempts
+_MENTION_STATE_LOCK = threading.Lock()
+
+def _migrate_processed_mentions_file():
+    """One-time import of the legacy processed_mentions.json set into STATE_STORE (or memory)"""
+    with _MENTION_STATE_LOCK:
+        if _mention_state['migrated']:
+            return
+        _mention_state['migrated'] = True
+        if not os.path.exists(PROCESSED_MENTIONS_FILE):
+            return
+        try:
+            ids = sorted(int(i) for i in load_json_set(PROCESSED_MENTIONS_FILE))
+        except (ValueError, json.JSONDecodeError) as e:
+            logging.warning(f"Could not migrate {PROCESSED_MENTIONS_FILE}: {e}")
+            return
+        now = time.time()
+        if not STATE_PERSIST:
+            # Nothing to migrate into; seed memory and leave the file in place
+            _PROCESSED_MENTIONS.update(dict.fromkeys(ids, now))
+            if ids and _mention_state[MENTIONS_SINCE_ID_KEY] is None:
+                _mention_state[MENTIONS_SINCE_ID_KEY] = ids[-1]
+            return
+        for tweet_id in ids:
+            STATE_STORE.execute_async(
+                "INSERT OR IGNORE INTO processed_mentions (tweet_id, processed_at) VALUES (?, ?)",
+                (tweet_id, now))
+        if ids and get_mention_since_id() is None:
+            set_mention_since_id(ids[-1])
+        STATE_STORE.flush()
+        os.replace(PROCESSED_MENTIONS_FILE, PROCESSED_MENTIONS_FILE + '.migrated')
+        logging.info(f"Migrated {len(ids)} processed mention IDs from {PROCESSED_MENTIONS_FILE}")
+
+def _get_mention_cursor(key):
+    if not STATE_PERSIST:
+        return _mention_state[key]
+    rows = STATE_STORE.query("SELECT value FROM bot_state WHERE key = ?", (key,))
+    return int(rows[0][0]) if rows else None
+
+def _set_mention_cursor(key, tweet_id):
+    """Store *tweet_id* under *key*; None clears it"""
+    if not STATE_PERSIST:
+        _mention_state[key] = None if tweet_id is None else int(tweet_id)
+    elif tweet_id is None:
+        STATE_STORE.execute_async("DELETE FROM bot_state WHERE key = ?", (key,))
+    else:
+        STATE_STORE.execute_async("INSERT OR REPLACE INTO bot_state (key, value) VALUES (?, ?)",
+                                  (key, str(tweet_id)))
+
+def get_mention_since_id():
+    """Highest mention ID already handled, or None before the first run"""
+    return _get_mention_cursor(MENTIONS_SINCE_ID_KEY)
+
+def set_mention_since_id(tweet_id: int):
+    _set_mention_cursor(MENTIONS_SINCE_ID_KEY, tweet_id)
+
+def get_mention_until_id():
+    """Oldest mention fetched by a catch-up that stopped at the page cap, or None"""
+    return _get_mention_cursor(MENTIONS_UNTIL_ID_KEY)
+
+def set_mention_until_id(tweet_id):
+    _set_mention_cursor(MENTIONS_UNTIL_ID_KEY, tweet_id)
+
+def filter_unprocessed_mentions(tweet_ids) -> set:
+    """Return the subset of *tweet_ids* without a recorded reply (one indexed query)"""
+    ids = [int(i) for i in tweet_ids]
+    if not ids:
+        return set()
+    if not STATE_PERSIST:
+        with _MENTION_STATE_LOCK:
+            return {i for i in ids if i not in _PROCESSED_MENTIONS}
+    STATE_STORE.flush()
+    placeholders = ','.join('?' * len(ids))
+    done = {row[0] for row in STATE_STORE.query(
+        f"SELECT tweet_id FROM processed_mentions WHERE tweet_id IN ({placeholders})", tuple(ids))}
+    return {i for i in ids if i not in done}
+
+def mark_mention_processed(tweet_id: int):
+    if not STATE_PERSIST:
+        with _MENTION_STATE_LOCK:
+            _PROCESSED_MENTIONS[int(tweet_id)] = time.time()
+        return
+    STATE_STORE.execute_async(
+        "INSERT OR IGNORE INTO processed_mentions (tweet_id, processed_at) VALUES (?, ?)",
+        (int(tweet_id), time.time()))
+
+# Mention authors, keyed by user ID. Filled from the includes payload of each
+# mentions page (expansions=author_id), so replies need no get_user() call;
+# get_user() is only the fallback for an author missing from includes.
+USER_CACHE = OrderedDict()
+USER_CACHE_LOCK = threading.Lock()
+USER_CACHE_TTL = int(os.getenv('USER_CACHE_TTL', '86400'))  # 24 hours
+USER_CACHE_MAX_SIZE = int(os.getenv('USER_CACHE_MAX_SIZE', '2000'))
+USER_CACHE_STATS = {'hits': 0, 'misses': 0, 'hydrated': 0, 'api_lookups': 0}
+
+def _store_username(user_id, username: str, now: float):
+    """Insert into USER_CACHE, evicting the least recently used. Caller holds USER_CACHE_LOCK."""
+    key = str(user_id)
+    USER_CACHE[key] = {'username': username, 'timestamp': now}
+    USER_CACHE.move_to_end(key)
+    while len(USER_CACHE) > USER_CACHE_MAX_SIZE:
+        USER_CACHE.popitem(last=False)
+
+def cache_users(users) -> int:
+    """Store user objects (anything with id and username) in USER_CACHE; returns how many"""
+    now = time.time()
+    count = 0
+    with USER_CACHE_LOCK:
+        for user in users or []:
+            username = getattr(user, 'username', None)
+            if username:
+                _store_username(user.id, username, now)
+                count += 1
+        USER_CACHE_STATS['hydrated'] += count
+    return count
+
+def get_cached_username(user_id):
+    """Username for *user_id* if cached and fresh, else None"""
+    key = str(user_id)
+    with USER_CACHE_LOCK:
+        entry = USER_CACHE.get(key)
+        if entry and time.time() - entry['timestamp'] < USER_CACHE_TTL:
+            USER_CACHE.move_to_end(key)
+            USER_CACHE_STATS['hits'] += 1
+            return entry['username']
+        if entry:
+            del USER_CACHE[key]
+        USER_CACHE_STATS['misses'] += 1
+    return None
+
+def resolve_username(user_id):
+    """Username for *user_id* from USER_CACHE, falling back to one get_user() call"""
+    username = get_cached_username(user_id)
+    if username:
+        return username
+    with USER_CACHE_LOCK:
+        USER_CACHE_STATS['api_lookups'] += 1
+    user_data = client.get_user(id=user_id)
+    if not user_data or not user_data.data:
+        return None
+    username = user_data.data.username
+    with USER_CACHE_LOCK:
+        _store_username(user_id, username, time.time())
+    return username
+
+def get_user_cache_stats() -> dict:
+    with USER_CACHE_LOCK:
+        stats = dict(USER_CACHE_STATS)
+        stats['size'] = len(USER_CACHE)
+    stats['ttl_seconds'] = USER_CACHE_TTL
+    return stats
+
+def fetch_new_mentions(since_id=None, until_id=None):
+    """
+    Mentions newer than *since_id* (and older than *until_id*), oldest first
+
+    Returns (mentions, truncated). Follows pagination up to MENTIONS_MAX_PAGES
+    while catching up; truncated is True when older pages were left unread.
+    The very first run (no since_id) only reads the latest page instead of the
+    backlog, and is never reported as truncated.
+    Authors are expanded in the same request and cached via cache_users().
+    """
+    mentions = []
+    pagination_token = None
+    max_pages = MENTIONS_MAX_PAGES if since_id else 1
+    for _ in range(max_pages):
+        kwargs = {
+            'max_results': MENTIONS_PAGE_SIZE,
+            'tweet_fields': ["author_id", "text"],
+            'expansions': ["author_id"],
+            'user_fields': ["username", "name"],
+        }
+        if since_id:
+            kwargs['since_id'] = since_id
+        if until_id:
+            kwargs['until_id'] = until_id
+        if pagination_token:
+            kwargs['pagination_token'] = pagination_token
+        response = client.get_users_mentions(bot_user_id, **kwargs)
+        mentions.extend(response.data or [])
+        includes = getattr(response, 'includes', None)
+        if isinstance(includes, dict):
+            cache_users(includes.get('users'))
+        meta = getattr(response, 'meta', None)
+        pagination_token = meta.get('next_token') if isinstance(meta, dict) else None
+        if not pagination_token:
+            break
+    truncated = bool(pagination_token and since_id and mentions)
+    return sorted(mentions, key=lambda m: int(m.id)), truncated
 
 def get_random_media_id():
     # Check both TWITTER_ENABLED and client/api_v1 for defense in depth
@@ -2151,11 +3358,102 @@ EXAMPLE BAD POSTS (never do these):
 "Elon Musk is a [political opinion]." ← never political, always in-character dry observation
 """
 
-def _generate_openai_response(messages, max_tokens=120):
-    """Generate response using OpenAI-compatible chat completions API."""
+XAI_BASE_URL = "https://api.x.ai/v1"
+
+# Long-lived OpenAI-compatible clients keyed by (base_url, api_key). Each client
+# owns an httpx connection pool, so reusing it skips the TLS handshake per call.
+_LLM_CLIENTS = {}
+_LLM_CLIENTS_LOCK = threading.Lock()
+
+
+def get_llm_client(base_url, api_key):
+    """Return the shared OpenAI-compatible client for *base_url* and *api_key*, creating it once."""
+    key = (base_url, api_key)
+    with _LLM_CLIENTS_LOCK:
+        client = _LLM_CLIENTS.get(key)
+        if client is None:
+            import openai
+            client = openai.OpenAI(api_key=api_key, base_url=base_url)
+            _LLM_CLIENTS[key] = client
+            logging.info(f"LLM client created for {base_url}")
+        return client
+
+
+# Refusals are only looked for in the opening of a streamed reply
+_REFUSAL_WINDOW_CHARS = 80
+LLM_STREAM_STATS = {'streams': 0, 'completed': 0, 'truncated': 0, 'refusals': 0}
+LLM_STREAM_STATS_LOCK = threading.Lock()
+
+
+def _truncate_at_word(text, max_chars):
+    """Cut *text* to at most *max_chars* without splitting a word."""
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars]
+    if not text[max_chars].isspace():
+        head, sep, _ = cut.rpartition(' ')
+        if sep:
+            cut = head
+    return cut.rstrip()
+
+
+def _stream_completion(client, model, messages, max_tokens, max_chars):
+    """Stream a chat completion, closing the stream as soon as the reply is usable or hopeless.
+
+    Reading stops once the text passes *max_chars* (the result is cut back to a
+    word boundary) or when a refusal phrase shows up in the opening characters.
+    A refusal is returned as-is so _score_response rejects it and callers fail
+    over without waiting for the rest of it.
+    """
+    stream = client.chat.completions.create(
+        model=model,
+        messages=messages,
+        max_tokens=max_tokens,
+        temperature=0.92,
+        stream=True,
+    )
+    text = ""
+    outcome = 'completed'
+    try:
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content or ""
+            text += delta
+            if len(text) - len(delta) < _REFUSAL_WINDOW_CHARS:
+                opening = text[:_REFUSAL_WINDOW_CHARS].lower()
+                if any(phrase in opening for phrase in _REFUSAL_PHRASES):
+                    outcome = 'refusals'
+                    break
+            if len(text) > max_chars:
+                outcome = 'truncated'
+                break
+    finally:
+        # Closing the response tells the provider to stop generating
+        stream.close()
+    with LLM_STREAM_STATS_LOCK:
+        LLM_STREAM_STATS['streams'] += 1
+        LLM_STREAM_STATS[outcome] += 1
+    if outcome == 'truncated':
+        text = _truncate_at_word(text, max_chars)
+    return text.strip()
+
+
+def get_llm_stream_stats():
+    """Counters for streamed generations for /api/metrics."""
+    with LLM_STREAM_STATS_LOCK:
+        return dict(LLM_STREAM_STATS, enabled=LLM_STREAMING)
+
+
+def _generate_openai_response(messages, max_tokens=120, max_chars=None):
+    """Generate response using OpenAI-compatible chat completions API.
+
+    With *max_chars* and LLM_STREAMING the reply is streamed and cut off early.
+    """
     try:
-        import openai
-        oc = openai.OpenAI(api_key=OPENAI_API_KEY, base_url=OPENAI_BASE_URL)
+        oc = get_llm_client(OPENAI_BASE_URL, OPENAI_API_KEY)
+        if max_chars and LLM_STREAMING:
+            return _stream_completion(oc, LLM_MODEL, messages, max_tokens, max_chars)
         resp = oc.chat.completions.create(
             model=LLM_MODEL,
             messages=messages,
@@ -2168,11 +3466,15 @@ def _generate_openai_response(messages, max_tokens=120):
         return None
 
 
-def _generate_xai_response(messages, max_tokens=120):
-    """Generate response using xAI (Grok) via its OpenAI-compatible API."""
+def _generate_xai_response(messages, max_tokens=120, max_chars=None):
+    """Generate response using xAI (Grok) via its OpenAI-compatible API.
+
+    With *max_chars* and LLM_STREAMING the reply is streamed and cut off early.
+    """
     try:
-        import openai
-        xc = openai.OpenAI(api_key=XAI_API, base_url="https://api.x.ai/v1")
+        xc = get_llm_client(XAI_BASE_URL, XAI_API)
+        if max_chars and LLM_STREAMING:
+            return _stream_completion(xc, XAI_MODEL, messages, max_tokens, max_chars)
         resp = xc.chat.completions.create(
             model=XAI_MODEL,
             messages=messages,
@@ -2185,6 +3487,36 @@ def _generate_xai_response(messages, max_tokens=120):
         return None
 
 
+def _chat_candidates(client, model, messages, max_tokens, n):
+    """Request *n* completion choices in one call and return their texts."""
+    resp = client.chat.completions.create(
+        model=model,
+        messages=messages,
+        max_tokens=max_tokens,
+        temperature=0.92,
+        n=n,
+    )
+    return [c.message.content.strip() for c in resp.choices if c.message.content]
+
+
+def _generate_openai_candidates(messages, max_tokens=120, n=3):
+    """Generate *n* alternative responses from the OpenAI-compatible API in one request."""
+    try:
+        return _chat_candidates(get_llm_client(OPENAI_BASE_URL, OPENAI_API_KEY), LLM_MODEL, messages, max_tokens, n)
+    except Exception as e:
+        logging.error(f"OpenAI candidate call failed: {e}")
+        return []
+
+
+def _generate_xai_candidates(messages, max_tokens=120, n=3):
+    """Generate *n* alternative responses from xAI (Grok) in one request."""
+    try:
+        return _chat_candidates(get_llm_client(XAI_BASE_URL, XAI_API), XAI_MODEL, messages, max_tokens, n)
+    except Exception as e:
+        logging.error(f"xAI (Grok) candidate call failed: {e}")
+        return []
+
+
 def _generate_hf_chat_response(messages, max_tokens=120):
     """Generate response using HuggingFace chat completions API (instruction-tuned models)."""
     try:
@@ -2196,7 +3528,7 @@ def _generate_hf_chat_response(messages, max_tokens=120):
             "max_tokens": max_tokens,
             "temperature": 0.92,
         }
-        response = requests.post(url, headers=headers, json=data, timeout=HUGGING_FACE_TIMEOUT)
+        response = http_client.post(url, headers=headers, json=data, timeout=HUGGING_FACE_TIMEOUT)
         if response.status_code == 200:
             result = response.json()
             return result["choices"][0]["message"]["content"].strip()
@@ -2235,7 +3567,277 @@ def _score_response(text, max_tokens=120):
     return score
 
 
-def generate_llm_response(prompt, max_tokens=120, context=None):
+# Per-provider latency histograms: bucket i counts calls <= LLM_LATENCY_BUCKETS_MS[i],
+# the last bucket counts everything slower
+LLM_LATENCY_BUCKETS_MS = (250, 500, 1000, 2000, 4000, 8000, 16000)
+LLM_PROVIDER_LATENCY = {}
+LLM_PROVIDER_LATENCY_LOCK = threading.Lock()
+
+
+def _record_llm_latency(name, elapsed_ms, ok):
+    """Add one provider call to its latency histogram (thread-safe)."""
+    with LLM_PROVIDER_LATENCY_LOCK:
+        stats = LLM_PROVIDER_LATENCY.setdefault(name, {
+            'calls': 0, 'errors': 0, 'total_ms': 0.0, 'max_ms': 0.0,
+            'buckets': [0] * (len(LLM_LATENCY_BUCKETS_MS) + 1),
+        })
+        stats['calls'] += 1
+        if not ok:
+            stats['errors'] += 1
+        stats['total_ms'] += elapsed_ms
+        stats['max_ms'] = max(stats['max_ms'], elapsed_ms)
+        stats['buckets'][bisect.bisect_left(LLM_LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+
+
+def get_llm_latency_stats():
+    """Return per-provider latency histograms keyed by bucket upper bound."""
+    labels = [f"le_{b}ms" for b in LLM_LATENCY_BUCKETS_MS] + [f"gt_{LLM_LATENCY_BUCKETS_MS[-1]}ms"]
+    with LLM_PROVIDER_LATENCY_LOCK:
+        snapshot = {name: dict(stats, buckets=list(stats['buckets'])) for name, stats in LLM_PROVIDER_LATENCY.items()}
+    for stats in snapshot.values():
+        stats['avg_ms'] = round(stats['total_ms'] / stats['calls'], 2) if stats['calls'] else 0.0
+        stats['total_ms'] = round(stats['total_ms'], 2)
+        stats['max_ms'] = round(stats['max_ms'], 2)
+        stats['histogram'] = dict(zip(labels, stats.pop('buckets')))
+    return snapshot
+
+
+_LLM_BREAKERS = {}
+_LLM_BREAKERS_LOCK = threading.Lock()
+
+
+def get_llm_breaker(name):
+    """Return the circuit breaker for provider *name*, creating it on first use."""
+    with _LLM_BREAKERS_LOCK:
+        breaker = _LLM_BREAKERS.get(name)
+        if breaker is None:
+            breaker = _LLM_BREAKERS[name] = CircuitBreaker(
+                LLM_BREAKER_WINDOW, LLM_BREAKER_MIN_CALLS, LLM_BREAKER_FAILURE_RATE,
+                LLM_BREAKER_COOLDOWN, LLM_BREAKER_SLOW_MS, LLM_BREAKER_SAMPLE_TTL)
+        return breaker
+
+
+def get_llm_breaker_stats():
+    """Per-provider breaker state for /api/metrics."""
+    with _LLM_BREAKERS_LOCK:
+        breakers = dict(_LLM_BREAKERS)
+    return {name: breaker.snapshot() for name, breaker in breakers.items()}
+
+
+def _timed_provider_call(name, fn, messages, max_tokens):
+    """Call one provider and record its latency; errors and empty replies count as failures."""
+    start = time.perf_counter()
+    result = None
+    try:
+        result = fn(messages, max_tokens)
+        return result
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        _record_llm_latency(name, elapsed_ms, bool(result))
+        get_llm_breaker(name).record(bool(result), elapsed_ms)
+
+
+# Long-lived pool for provider calls. Callers keep the futures and stop waiting
+# as soon as they have an answer, instead of joining a per-call pool on exit.
+_MAX_RESPONSE_SCORE = 100
+LLM_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=LLM_EXECUTOR_WORKERS,
+                                                     thread_name_prefix='llm-provider')
+_LLM_PROVIDER_SEMAPHORES = {}
+LLM_EXECUTOR_LOCK = threading.Lock()
+LLM_EXECUTOR_STATS = {'submitted': 0, 'queued': 0, 'cancelled': 0, 'saturated': 0,
+                      'early_returns': 0, 'in_flight': {}}
+
+
+def _provider_semaphore(name):
+    with LLM_EXECUTOR_LOCK:
+        sem = _LLM_PROVIDER_SEMAPHORES.get(name)
+        if sem is None:
+            sem = _LLM_PROVIDER_SEMAPHORES[name] = threading.BoundedSemaphore(LLM_PROVIDER_CONCURRENCY)
+        return sem
+
+
+def _run_provider_call(name, permit, abandoned, fn, messages, max_tokens):
+    """Executor task: make the timed call with the provider permit taken at submit time."""
+    started = False
+    try:
+        with LLM_EXECUTOR_LOCK:
+            LLM_EXECUTOR_STATS['queued'] -= 1
+            if abandoned.is_set():
+                # The caller stopped waiting while this sat in the pool queue; skip the paid call
+                LLM_EXECUTOR_STATS['cancelled'] += 1
+                return None
+            in_flight = LLM_EXECUTOR_STATS['in_flight']
+            in_flight[name] = in_flight.get(name, 0) + 1
+            started = True
+        return _timed_provider_call(name, fn, messages, max_tokens)
+    finally:
+        permit.release()
+        if started:
+            with LLM_EXECUTOR_LOCK:
+                LLM_EXECUTOR_STATS['in_flight'][name] -= 1
+
+
+def submit_provider_call(name, fn, messages, max_tokens):
+    """Queue one provider call on the shared LLM executor and return its future.
+
+    The per-provider permit is taken here without blocking, so a saturated
+    provider never holds a pool thread; returns None when none is free and
+    the caller moves on to its other providers.
+    """
+    permit = _provider_semaphore(name)
+    if not permit.acquire(blocking=False):
+        with LLM_EXECUTOR_LOCK:
+            LLM_EXECUTOR_STATS['saturated'] += 1
+        logging.debug(f"AI routing: {name} at its concurrency limit, skipped")
+        return None
+    abandoned = threading.Event()
+    with LLM_EXECUTOR_LOCK:
+        LLM_EXECUTOR_STATS['submitted'] += 1
+        LLM_EXECUTOR_STATS['queued'] += 1
+    future = LLM_EXECUTOR.submit(_run_provider_call, name, permit, abandoned, fn, messages, max_tokens)
+    future.abandoned = abandoned
+    # A future cancelled before it ran never reaches _run_provider_call's release
+    future.add_done_callback(lambda f: f.cancelled() and permit.release())
+    return future
+
+
+def _submit_provider_calls(providers, messages, max_tokens):
+    """submit_provider_call() for each (name, fn); returns {future: name} for those admitted."""
+    futures = {}
+    for name, fn in providers:
+        future = submit_provider_call(name, fn, messages, max_tokens)
+        if future is not None:
+            futures[future] = name
+        else:
+            get_llm_breaker(name).release_trial()  # saturated: a trial it held was never used
+    return futures
+
+
+def _cancel_provider_calls(futures):
+    """Cancel provider calls that have not started; running ones finish in the background."""
+    for future in futures:
+        if future.cancel():
+            with LLM_EXECUTOR_LOCK:
+                LLM_EXECUTOR_STATS['queued'] -= 1
+                LLM_EXECUTOR_STATS['cancelled'] += 1
+        else:
+            # Picked up by a worker but maybe not yet calling the provider
+            future.abandoned.set()
+
+
+def get_llm_executor_stats():
+    """Queue depth, per-provider in-flight calls and counters for /api/metrics."""
+    with LLM_EXECUTOR_LOCK:
+        stats = dict(LLM_EXECUTOR_STATS, in_flight=dict(LLM_EXECUTOR_STATS['in_flight']))
+    stats['workers'] = LLM_EXECUTOR_WORKERS
+    stats['per_provider_limit'] = LLM_PROVIDER_CONCURRENCY
+    return stats
+
+
+def _llm_providers(max_chars=None, names=None):
+    """Configured providers whose breaker is not open, in routing order.
+
+    A half-open provider that this call wins the trial for (see
+    CircuitBreaker.allow_trial()) goes first, so it gets the one call that can
+    close its breaker. Then healthy providers come before degraded ones. Within
+    a tier xAI stays the primary, and the fallbacks are ordered by
+    LLM_PROVIDER_COST (cheapest first).
+    With *max_chars*, the OpenAI-compatible providers are bound to stream and
+    stop at that length. *names* limits routing (and trial claims) to the
+    providers the caller can actually call.
+    """
+    configured = []
+    if XAI_API:
+        configured.append(("xAI-Grok", _generate_xai_response))
+    if OPENAI_API_KEY:
+        configured.append(("OpenAI", _generate_openai_response))
+    if HUGGING_FACE_TOKEN:
+        configured.append(("HuggingFace", _generate_hf_chat_response))
+    if names is not None:
+        configured = [(name, fn) for name, fn in configured if name in names]
+
+    tiers = {'trial': 0, 'healthy': 1, 'degraded': 2}
+    ranked = []
+    for priority, (name, fn) in enumerate(configured):
+        breaker = get_llm_breaker(name)
+        if breaker.health() == 'degraded' and breaker.allow_trial():
+            logging.info(f"AI routing: trial call to half-open {name}")
+        health = breaker.health()
+        if health == 'open':
+            logging.debug(f"AI routing: skipping {name} (circuit open)")
+            continue
+        if max_chars and name in ("xAI-Grok", "OpenAI"):
+            fn = functools.partial(fn, max_chars=max_chars)
+        key = (tiers[health], name != "xAI-Grok", LLM_PROVIDER_COST.get(name, 1.0), priority)
+        ranked.append((key, name, fn))
+    ranked.sort(key=lambda item: item[0])
+    return [(name, fn) for _, name, fn in ranked]
+
+
+def _healthy_only(providers):
+    """Drop degraded providers when at least one healthy (or trial) provider remains."""
+    healthy = [p for p in providers if get_llm_breaker(p[0]).health() in ('healthy', 'trial')]
+    return healthy or providers
+
+
+def _generate_hedged_response(messages, max_tokens, max_chars=None):
+    """Race the providers and return (name, text, score) for the first acceptable reply.
+
+    xAI starts alone; the secondary providers join once xAI fails, scores 0, or
+    has not answered within LLM_HEDGE_DELAY seconds. Without xAI every provider
+    starts at once. Calls still running when a winner is found are ignored.
+    """
+    providers = _llm_providers(max_chars)
+    if not providers:
+        return None
+    if providers[0][0] == "xAI-Grok":
+        first, hedges = providers[:1], providers[1:]
+    else:
+        first, hedges = providers, []
+
+    pending = _submit_provider_calls(first, messages, max_tokens)
+    if not pending:
+        # Primary at its concurrency limit: hedge straight away
+        pending, hedges = _submit_provider_calls(hedges, messages, max_tokens), []
+    try:
+        hedge_at = time.monotonic() + LLM_HEDGE_DELAY
+        while pending:
+            timeout = max(0.0, hedge_at - time.monotonic()) if hedges else None
+            done, _ = concurrent.futures.wait(pending, timeout=timeout,
+                                              return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                name = pending.pop(future)
+                try:
+                    text = future.result()
+                except Exception as e:
+                    logging.error(f"Hedged provider {name} raised: {e}")
+                    continue
+                score = _score_response(text, max_tokens)
+                logging.debug(f"AI hedge — {name}: score={score}, len={len(text) if text else 0}")
+                if score > 0:
+                    return name, text, score
+            if hedges and (not done or not pending):
+                logging.info(f"AI hedge: starting {', '.join(n for n, _ in hedges)}")
+                pending.update(_submit_provider_calls(hedges, messages, max_tokens))
+                hedges = []
+        return None
+    finally:
+        # Don't wait for the losers; their results are discarded
+        _cancel_provider_calls(pending)
+
+
+def _build_llm_messages(prompt, context=None):
+    """Chat messages for *prompt* with the shared Overseer system prompt."""
+    system = OVERSEER_SYSTEM_PROMPT
+    if context:
+        system += f"\n\nCURRENT CONTEXT: {context}"
+    return [
+        {"role": "system", "content": system},
+        {"role": "user", "content": prompt},
+    ]
+
+
+def generate_llm_response(prompt, max_tokens=120, context=None, max_chars=None):
     """Generate an AI response using a unified multi-AI system.
 
     xAI (Grok) is the PRIMARY provider — it is called first and its response is
@@ -2243,6 +3845,10 @@ def generate_llm_response(prompt, max_tokens=120, context=None):
     configured or its response is unusable, the remaining providers (OpenAI and
     HuggingFace) are called in parallel and the best-scoring result is returned.
     All providers share the same system prompt so they speak as one voice.
+    Providers whose circuit breaker is open are skipped, and degraded ones are
+    only used when nothing healthier is available (see _llm_providers()).
+    When *max_chars* is given, OpenAI-compatible providers stream their reply
+    and stop at that length (see _stream_completion()).
     """
     # Check cache first to reduce API costs
     cache_key = get_cache_key(prompt, max_tokens, context)
@@ -2250,86 +3856,105 @@ def generate_llm_response(prompt, max_tokens=120, context=None):
     if cached_response:
         return cached_response
 
-    import concurrent.futures
+    messages = _build_llm_messages(prompt, context)
+    prompt_tokens = sum(estimate_tokens(m["content"]) for m in messages)
 
-    system = OVERSEER_SYSTEM_PROMPT
-    if context:
-        system += f"\n\nCURRENT CONTEXT: {context}"
-    messages = [
-        {"role": "system", "content": system},
-        {"role": "user", "content": prompt},
-    ]
+    # ── Hedged mode: race providers, first acceptable reply wins ─────────────
+    if LLM_HEDGE_MODE:
+        winner = _generate_hedged_response(messages, max_tokens, max_chars)
+        if not winner:
+            return None
+        name, text, score = winner
+        logging.info(f"AI hedge winner: {name} (score={score})")
+        cache_response(cache_key, text, prompt_tokens + estimate_tokens(text))
+        return text
 
-    # ── Primary: xAI (Grok) ──────────────────────────────────────────────────
-    if XAI_API:
-        xai_result = _generate_xai_response(messages, max_tokens)
+    providers = _llm_providers(max_chars)
+
+    # ── Primary: xAI (Grok), while its breaker reports it healthy ────────────
+    if providers and providers[0][0] == "xAI-Grok":
+        (_, primary_fn), providers = providers[0], providers[1:]
+        xai_result = _timed_provider_call("xAI-Grok", primary_fn, messages, max_tokens)
         xai_score = _score_response(xai_result, max_tokens)
         logging.debug(f"AI primary — xAI-Grok: score={xai_score}, len={len(xai_result) if xai_result else 0}")
         if xai_score > 0:
             logging.info("AI response: xAI-Grok (primary)")
-            cache_response(cache_key, xai_result)
+            cache_response(cache_key, xai_result, prompt_tokens + estimate_tokens(xai_result))
             return xai_result
         logging.warning("xAI (Grok) returned an unusable response — falling back to secondary providers")
 
     # ── Fallback: parallel ensemble of remaining providers ───────────────────
-    providers = []
-    if OPENAI_API_KEY:
-        providers.append(("OpenAI", _generate_openai_response))
-    if HUGGING_FACE_TOKEN:
-        providers.append(("HuggingFace", _generate_hf_chat_response))
+    providers = _healthy_only(providers)
 
     if not providers:
         return None
 
-    results = {}
-    with concurrent.futures.ThreadPoolExecutor(max_workers=len(providers)) as executor:
-        futures = {
-            executor.submit(fn, messages, max_tokens): name
-            for name, fn in providers
-        }
+    # Score replies as they arrive; stop waiting once one reaches the best possible score
+    futures = _submit_provider_calls(providers, messages, max_tokens)
+    best_name, best_text, best_score = None, None, 0
+    try:
         for future in concurrent.futures.as_completed(futures):
             name = futures[future]
             try:
-                results[name] = future.result()
+                text = future.result()
             except Exception as e:
                 logging.error(f"Fallback provider {name} raised: {e}")
-                results[name] = None
-
-    # Score fallback responses and return the best
-    best_name, best_text, best_score = None, None, 0
-    for name, text in results.items():
-        score = _score_response(text, max_tokens)
-        logging.debug(f"AI fallback — {name}: score={score}, len={len(text) if text else 0}")
-        if score > best_score:
-            best_score = score
-            best_text = text
-            best_name = name
+                text = None
+            score = _score_response(text, max_tokens)
+            logging.debug(f"AI fallback — {name}: score={score}, len={len(text) if text else 0}")
+            if score > best_score:
+                best_score = score
+                best_text = text
+                best_name = name
+            if best_score >= _MAX_RESPONSE_SCORE:
+                if not all(f.done() for f in futures):
+                    with LLM_EXECUTOR_LOCK:
+                        LLM_EXECUTOR_STATS['early_returns'] += 1
+                break
+    finally:
+        _cancel_provider_calls(futures)
 
     if best_text:
         logging.info(f"AI fallback winner: {best_name} (score={best_score})")
-        cache_response(cache_key, best_text)
+        cache_response(cache_key, best_text, prompt_tokens + estimate_tokens(best_text))
         return best_text
 
     return None
 
 
-def generate_overseer_tweet(topic, context=None, max_chars=270):
-    """Generate a unique Overseer tweet via LLM, capped at max_chars characters.
+def generate_llm_candidates(prompt, n=3, max_tokens=120, context=None):
+    """Generate up to *n* alternative responses with a single provider request.
 
-    Returns the generated tweet text, or None if LLM is unavailable/fails.
+    Uses n= choices on the first routed OpenAI-compatible provider that returns
+    anything usable. Candidates are scored with _score_response; unusable and
+    repeated ones are dropped and the rest returned best-first. Falls back to one
+    generate_llm_response() call when no provider supports n= (HuggingFace only).
     """
-    if not LLM_ENABLED:
-        return None
-
-    hour = datetime.now().hour
-    if 5 <= hour < 12:
-        tod = "morning — dawn radiation nominal"
-    elif 12 <= hour < 17:
-        tod = "afternoon — Mojave sun at peak intensity"
-    elif 17 <= hour < 21:
-        tod = "evening — scavengers returning"
-    else:
-        tod = "night — nocturnal threats active"
+    messages = _build_llm_messages(prompt, context)
+    candidate_fns = {"xAI-Grok": _generate_xai_candidates, "OpenAI": _generate_openai_candidates}
+    routed = [(name, candidate_fns[name]) for name, _ in _llm_providers(names=candidate_fns)]
+    if not routed:
+        single = generate_llm_response(prompt, max_tokens=max_tokens, context=context)
+        return [single] if single else []
+
+    for i, (name, fn) in enumerate(routed):
+        texts = _timed_provider_call(name, functools.partial(fn, n=n), messages, max_tokens) or []
+        scored = {}
+        for text in texts:
+            score = _score_response(text, max_tokens)
+            if score > 0 and text not in scored:
+                scored[text] = score
+        logging.debug(f"AI candidates — {name}: {len(scored)}/{len(texts)} usable")
+        if scored:
+            for skipped, _ in routed[i + 1:]:
+                get_llm_breaker(skipped).release_trial()
+            return sorted(scored, key=scored.get, reverse=True)
+    return []
+
+
+def _overseer_tweet_request(topic, context, max_chars):
+    """Build the (prompt, context) pair used for an Overseer tweet about *topic*."""
+    tod = _TWEET_TIME_OF_DAY[get_time_period()]
 
     ctx_parts = [f"Time of day: {tod}"]
     if context:
@@ -2347,15 +3972,45 @@ def generate_overseer_tweet(topic, context=None, max_chars=270):
         f"Keep it under {max_chars} characters. "
         "Reply with only the tweet text — no quotes, no labels, no explanation."
     )
+    return prompt, full_context
+
+
+def _clean_tweet_text(result, max_chars):
+    """Strip quotes the model sometimes adds and trim to *max_chars*; None if nothing is left."""
+    result = result.strip().strip('"\'').strip()
+    if len(result) > max_chars:
+        result = result[:max_chars].rsplit(' ', 1)[0]
+    return result if result else None
+
 
-    result = generate_llm_response(prompt, max_tokens=100, context=full_context)
+def generate_overseer_tweet_candidates(topic, context=None, max_chars=270, n=3):
+    """Generate up to *n* distinct Overseer tweets about *topic* in one LLM request.
+
+    Returns a best-first list of cleaned tweet texts (empty if LLM is unavailable).
+    """
+    if not LLM_ENABLED:
+        return []
+    prompt, full_context = _overseer_tweet_request(topic, context, max_chars)
+    tweets = []
+    for text in generate_llm_candidates(prompt, n=n, max_tokens=100, context=full_context):
+        cleaned = _clean_tweet_text(text, max_chars)
+        if cleaned and cleaned not in tweets:
+            tweets.append(cleaned)
+    return tweets
+
+
+def generate_overseer_tweet(topic, context=None, max_chars=270):
+    """Generate a unique Overseer tweet via LLM, capped at max_chars characters.
+
+    Returns the generated tweet text, or None if LLM is unavailable/fails.
+    """
+    if not LLM_ENABLED:
+        return None
+
+    prompt, full_context = _overseer_tweet_request(topic, context, max_chars)
+    result = generate_llm_response(prompt, max_tokens=100, context=full_context, max_chars=max_chars)
     if result:
-        # Strip surrounding quotes the model sometimes adds
-        result = result.strip().strip('"\'').strip()
-        # Trim to hard limit
-        if len(result) > max_chars:
-            result = result[:max_chars].rsplit(' ', 1)[0]
-        return result if result else None
+        return _clean_tweet_text(result, max_chars)
     return None
 
 # ------------------------------------------------------------
@@ -2365,6 +4020,9 @@ def overseer_event_bridge(event: dict):
     """Process events from the game wallet with Overseer personality."""
     try:
         etype = event.get("type")
+        if not admit_event_immediately(etype):
+            logging.debug(f"Overseer event {etype} held for the next digest")
+            return
 
         if etype == "perk":
             handle_perk_event(event)
@@ -2388,25 +4046,244 @@ def overseer_event_bridge(event: dict):
     except TypeError as e:
         logging.error(f"Overseer event bridge - type error: {e}")
 
-def post_overseer_update(text):
-    """Post an update with Overseer branding."""
+# ------------------------------------------------------------
+# EVENT INGESTION QUEUE
+# /overseer-event only validates and enqueues; a daemon dispatcher thread
+# drains the bounded queue in batches, drops exact repeats within a batch
+# (producer retries), and runs overseer_event_bridge for the rest.
+# ------------------------------------------------------------
+OVERSEER_EVENT_TYPES = ('perk', 'quest', 'swap', 'moonpay', 'nft', 'claim', 'level_up')
+EVENT_QUEUE_SIZE = int(os.getenv('EVENT_QUEUE_SIZE', '500'))
+EVENT_DISPATCH_BATCH = int(os.getenv('EVENT_DISPATCH_BATCH', '50'))
+EVENT_BATCH_MAX_EVENTS = int(os.getenv('EVENT_BATCH_MAX_EVENTS', '1000'))  # per /overseer-events request
+EVENT_MAX_BYTES = 65536  # largest single event accepted by /overseer-events
+EVENT_QUEUE = queue.Queue(maxsize=EVENT_QUEUE_SIZE)
+EVENT_QUEUE_STATS = {'accepted': 0, 'rejected': 0, 'dropped': 0, 'coalesced': 0,
+                     'dispatched': 0, 'errors': 0, 'max_depth': 0}
+EVENT_QUEUE_LOCK = threading.Lock()
+_event_dispatcher = {'thread': None}
+
+def validate_overseer_event(event):
+    """Return an error message for a malformed event, or None when it can be queued"""
+    if not isinstance(event, dict):
+        return "Event must be a JSON object"
+    etype = event.get("type")
+    if not isinstance(etype, str) or not etype:
+        return "Event type is required"
+    if etype not in OVERSEER_EVENT_TYPES:
+        return f"Unknown event type: {etype}"
+    return None
+
+def record_rejected_event():
+    with EVENT_QUEUE_LOCK:
+        EVENT_QUEUE_STATS['rejected'] += 1
+
+def _ensure_event_dispatcher():
+    with EVENT_QUEUE_LOCK:
+        thread = _event_dispatcher['thread']
+        if thread is None or not thread.is_alive():
+            thread = threading.Thread(target=_event_dispatch_loop, daemon=True, name="overseer-event-dispatcher")
+            _event_dispatcher['thread'] = thread
+            thread.start()
+
+def enqueue_overseer_event(event: dict) -> bool:
+    """Queue a validated event for dispatch; False (and counted as dropped) when the queue is full"""
+    _ensure_event_dispatcher()
+    try:
+        EVENT_QUEUE.put_nowait(event)
+    except queue.Full:
+        with EVENT_QUEUE_LOCK:
+            EVENT_QUEUE_STATS['dropped'] += 1
+        logging.warning(f"Event queue full ({EVENT_QUEUE_SIZE}); dropped {event.get('type')} event")
+        return False
+    with EVENT_QUEUE_LOCK:
+        EVENT_QUEUE_STATS['accepted'] += 1
+        EVENT_QUEUE_STATS['max_depth'] = max(EVENT_QUEUE_STATS['max_depth'], EVENT_QUEUE.qsize())
+    return True
+
+def _coalesce_events(events: list) -> list:
+    """Drop exact repeats (same payload) from a drained batch, keeping first-seen order"""
+    seen = set()
+    unique = []
+    for event in events:
+        key = json.dumps(event, sort_keys=True, default=str)
+        if key not in seen:
+            seen.add(key)
+            unique.append(event)
+    return unique
+
+def _event_dispatch_loop():
+    while True:
+        batch = [EVENT_QUEUE.get()]
+        while len(batch) < EVENT_DISPATCH_BATCH:
+            try:
+                batch.append(EVENT_QUEUE.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            events = _coalesce_events(batch)
+            with EVENT_QUEUE_LOCK:
+                EVENT_QUEUE_STATS['coalesced'] += len(batch) - len(events)
+            for event in events:
+                try:
+                    overseer_event_bridge(event)
+                    with EVENT_QUEUE_LOCK:
+                        EVENT_QUEUE_STATS['dispatched'] += 1
+                except Exception as e:
+                    with EVENT_QUEUE_LOCK:
+                        EVENT_QUEUE_STATS['errors'] += 1
+                    logging.error(f"Event dispatch failed: {e}")
+        finally:
+            for _ in batch:
+                EVENT_QUEUE.task_done()
+
+def flush_event_queue(timeout: float = 5.0) -> bool:
+    """Wait until every queued event has been dispatched. Returns False on timeout."""
+    deadline = time.monotonic() + timeout
+    while EVENT_QUEUE.unfinished_tasks:
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+def get_event_queue_stats() -> dict:
+    with EVENT_QUEUE_LOCK:
+        stats = dict(EVENT_QUEUE_STATS)
+    stats['depth'] = EVENT_QUEUE.qsize()
+    stats['capacity'] = EVENT_QUEUE_SIZE
+    return stats
+
+# ------------------------------------------------------------
+# EVENT DIGEST
+# The first EVENT_IMMEDIATE_THRESHOLDS[type] events of each type in a digest
+# window are posted as usual; the rest only bump a counter, and
+# flush_event_digest() posts one summary tweet per window.
+# ------------------------------------------------------------
+EVENT_DIGEST_ENABLED = os.getenv('EVENT_DIGEST_ENABLED', 'true').lower() == 'true'
+EVENT_DIGEST_INTERVAL = int(os.getenv('EVENT_DIGEST_INTERVAL', '10'))  # minutes
+
+def _parse_event_thresholds(spec: str) -> dict:
+    """Parse 'swap=0,perk=3' into {type: count}, ignoring malformed entries"""
+    thresholds = {}
+    for item in spec.split(','):
+        name, _, value = item.partition('=')
+        try:
+            thresholds[name.strip()] = int(value)
+        except ValueError:
+            continue
+    return thresholds
+
+# Rare events keep their own tweet; frequent ones are summarized
+EVENT_IMMEDIATE_THRESHOLDS = {
+    'perk': 3, 'quest': 3, 'moonpay': 3, 'nft': 2, 'level_up': 1, 'claim': 1, 'swap': 0,
+}
+EVENT_IMMEDIATE_THRESHOLDS.update(_parse_event_thresholds(os.getenv('EVENT_IMMEDIATE_THRESHOLDS', '')))
+
+EVENT_DIGEST_LABELS = {
+    'swap': ('swap', 'swaps'),
+    'level_up': ('level-up', 'level-ups'),
+    'claim': ('location claim', 'location claims'),
+    'nft': ('NFT event', 'NFT events'),
+    'perk': ('perk unlock', 'perk unlocks'),
+    'quest': ('quest trigger', 'quest triggers'),
+    'moonpay': ('MoonPay deposit', 'MoonPay deposits'),
+}
+EVENT_DIGEST_HEADERS = [
+    "WASTELAND ACTIVITY REPORT:",
+    "Vault-Tec telemetry digest:",
+    "Overseer surveillance summary:",
+]
+
+EVENT_DIGEST_LOCK = threading.Lock()
+EVENT_DIGEST_SEEN: dict = {}    # type -> events seen this window
+EVENT_DIGEST_COUNTS: dict = {}  # type -> events held for the digest this window
+_event_digest_window = {'start': time.time()}
+EVENT_DIGEST_STATS = {'immediate': 0, 'digested': 0, 'digests_posted': 0}
+
+def admit_event_immediately(etype) -> bool:
+    """Count one event; True when it should still get its own tweet this window"""
+    if not EVENT_DIGEST_ENABLED or etype not in EVENT_DIGEST_LABELS:
+        return True
+    with EVENT_DIGEST_LOCK:
+        seen = EVENT_DIGEST_SEEN.get(etype, 0) + 1
+        EVENT_DIGEST_SEEN[etype] = seen
+        if seen <= EVENT_IMMEDIATE_THRESHOLDS.get(etype, 0):
+            EVENT_DIGEST_STATS['immediate'] += 1
+            return True
+        EVENT_DIGEST_COUNTS[etype] = EVENT_DIGEST_COUNTS.get(etype, 0) + 1
+        EVENT_DIGEST_STATS['digested'] += 1
+        return False
+
+def format_event_digest(counts: dict, minutes: int):
+    """'37 swaps, 12 level-ups in the last 10 minutes.' style summary, or None if nothing was counted"""
+    parts = []
+    for etype, count in sorted(counts.items(), key=lambda item: -item[1]):
+        if count <= 0:
+            continue
+        singular, plural = EVENT_DIGEST_LABELS.get(etype, (etype, etype))
+        parts.append(f"{count} {singular if count == 1 else plural}")
+    if not parts:
+        return None
+    window = "minute" if minutes == 1 else f"{minutes} minutes"
+    return f"{random.choice(EVENT_DIGEST_HEADERS)} {', '.join(parts)} in the last {window}."
+
+def flush_event_digest():
+    """Close the current digest window and post its summary (scheduler job)"""
+    now = time.time()
+    with EVENT_DIGEST_LOCK:
+        counts = dict(EVENT_DIGEST_COUNTS)
+        EVENT_DIGEST_COUNTS.clear()
+        EVENT_DIGEST_SEEN.clear()
+        minutes = max(1, round((now - _event_digest_window['start']) / 60))
+        _event_digest_window['start'] = now
+    text = format_event_digest(counts, minutes)
+    if not text:
+        return
+    if not TWITTER_ENABLED or not client:
+        logging.info(f"Event digest (Twitter disabled): {text}")
+        return
+    # Digests differ mainly in their numbers, so only exact repeats are skipped
+    if post_overseer_update(text, allow_similar=True):
+        with EVENT_DIGEST_LOCK:
+            EVENT_DIGEST_STATS['digests_posted'] += 1
+        add_activity("EVENT_DIGEST", text[:80])
+
+def get_event_digest_stats() -> dict:
+    with EVENT_DIGEST_LOCK:
+        stats = dict(EVENT_DIGEST_STATS)
+        stats['pending'] = dict(EVENT_DIGEST_COUNTS)
+    stats['enabled'] = EVENT_DIGEST_ENABLED
+    stats['interval_minutes'] = EVENT_DIGEST_INTERVAL
+    return stats
+
+def post_overseer_update(text, allow_similar=False):
+    """
+    Post an update with Overseer branding.
+
+    Near-duplicates of recent tweets are skipped unless *allow_similar* is set,
+    in which case only exact repeats are. The event handlers set it: two
+    distinct events often differ only in a player name or a number. Returns
+    True when a tweet was posted.
+    """
     try:
         personality_tag = get_personality_line()
         full_text = f"☢️ {BOT_NAME} UPDATE ☢️\n\n{text}\n\n{personality_tag}\n\n{GAME_LINK}"
         # Truncate if too long for Twitter
         if len(full_text) > TWITTER_CHAR_LIMIT:
             full_text = f"☢️ {text}\n\n{GAME_LINK}"[:TWITTER_CHAR_LIMIT]
-        if is_duplicate_tweet(full_text):
+        if (is_duplicate_tweet(full_text) if allow_similar else is_near_duplicate_tweet(full_text)):
             logging.debug(f"Skipping duplicate overseer update")
-            return
+            return False
         client.create_tweet(text=full_text)
         mark_tweet_sent(full_text)
         logging.info(f"Posted Overseer update: {text}")
+        return True
     except tweepy.TweepyException as e:
         if _is_twitter_duplicate_error(e):
             logging.warning(f"Overseer update skipped (duplicate content)")
         else:
             logging.error(f"Failed to post Overseer update: {e}")
+        return False
 
 def handle_perk_event(event):
     """Handle perk unlock events with personality."""
@@ -2417,7 +4294,7 @@ def handle_perk_event(event):
         f"Perk detected: {perk}. Your survival odds just improved. Slightly.",
         f"{perk} unlocked. The Overseer acknowledges your... competence."
     ]
-    post_overseer_update(random.choice(messages))
+    post_overseer_update(random.choice(messages), allow_similar=True)
 
 def handle_quest_event(event):
     """Handle quest trigger events."""
@@ -2428,7 +4305,7 @@ def handle_quest_event(event):
         f"New directive received. Code: {code}. {message}",
         f"Mission parameters updated. {code}: {message}"
     ]
-    post_overseer_update(random.choice(messages))
+    post_overseer_update(random.choice(messages), allow_similar=True)
 
 def handle_swap_event(event):
     """Handle token swap events."""
@@ -2440,7 +4317,7 @@ def handle_swap_event(event):
         f"Trade detected: {amount} {from_token} converted to {to_token}. Capitalism survives.",
         f"Currency exchange: {amount} {from_token} → {to_token}. FizzCo approves."
     ]
-    post_overseer_update(random.choice(messages))
+    post_overseer_update(random.choice(messages), allow_similar=True)
 
 def handle_moonpay_event(event):
     """Handle MoonPay funding events."""
@@ -2450,7 +4327,7 @@ def handle_moonpay_event(event):
         f"New caps entering circulation: {amount} USDC. The wasteland economy strengthens.",
         f"Funding confirmed: {amount} USDC. Vault-Tec shareholders rejoice."
     ]
-    post_overseer_update(random.choice(messages))
+    post_overseer_update(random.choice(messages), allow_similar=True)
 
 def handle_nft_event(event):
     """Handle NFT events."""
@@ -2461,7 +4338,7 @@ def handle_nft_event(event):
         f"Digital artifact {action}: {name}. Logged in Vault-Tec archives.",
         f"Collectible {action}: {name}. Your inventory expands."
     ]
-    post_overseer_update(random.choice(messages))
+    post_overseer_update(random.choice(messages), allow_similar=True)
 
 def handle_claim_event(event):
     """Handle location claim events."""
@@ -2472,7 +4349,7 @@ def handle_claim_event(event):
         f"New territory: {location}. Reward: {caps} CAPS. The map updates.",
         f"Claim successful: {location}. {caps} CAPS added to your stash."
     ]
-    post_overseer_update(random.choice(messages))
+    post_overseer_update(random.choice(messages), allow_similar=True)
 
 def handle_level_up_event(event):
     """Handle player level up events."""
@@ -2483,11 +4360,30 @@ def handle_level_up_event(event):
         f"Advancement detected: {player} is now Level {level}. The wasteland notices.",
         f"{player} leveled up to {level}. Survival odds: improved."
     ]
-    post_overseer_update(random.choice(messages))
+    post_overseer_update(random.choice(messages), allow_similar=True)
 
 # ------------------------------------------------------------
 # BROADCAST + REPLY SYSTEM - ENHANCED WITH FULL PERSONALITY
 # ------------------------------------------------------------
+def get_time_period(hour=None):
+    """Time-of-day period an LLM tweet prompt is written for (default: the current hour)."""
+    if hour is None:
+        hour = datetime.now().hour
+    if 5 <= hour < 12:
+        return 'morning'
+    if 12 <= hour < 17:
+        return 'afternoon'
+    if 17 <= hour < 21:
+        return 'evening'
+    return 'night'
+
+_TWEET_TIME_OF_DAY = {
+    'morning': "morning — dawn radiation nominal",
+    'afternoon': "afternoon — Mojave sun at peak intensity",
+    'evening': "evening — scavengers returning",
+    'night': "night — nocturnal threats active",
+}
+
 def get_time_phrase():
     """Get time-appropriate atmospheric phrase."""
     hour = datetime.now().hour
@@ -2523,6 +4419,15 @@ _BROADCAST_TYPES = [
 ]
 
 
+def _with_game_link(message):
+    """Append GAME_LINK to about half of the messages that lack it, when it fits."""
+    if GAME_LINK not in message and random.random() > 0.5:
+        suffix = f" {GAME_LINK}"
+        if len(message) + len(suffix) <= TWITTER_CHAR_LIMIT:
+            message += suffix
+    return message
+
+
 def _compose_broadcast_message(broadcast_type: str) -> str | None:
     """Build a tweet string for *broadcast_type*.
 
@@ -2534,6 +4439,7 @@ def _compose_broadcast_message(broadcast_type: str) -> str | None:
     # --- LLM path: try to generate a unique tweet (but skip sometimes to save costs) ---
     if LLM_ENABLED and random.random() > 0.3:  # 30% chance to skip LLM and use static responses
         price_context = None
+        prompt_prices = {}  # prices the prompt quotes; buffered spares go stale when they move
         price_cache = load_price_cache()
         if price_cache and random.random() > 0.4:
             token_key = random.choice(list(price_cache.keys()))
@@ -2545,6 +4451,7 @@ def _compose_broadcast_message(broadcast_type: str) -> str | None:
                     f"${token_name} is {direction} {td['change_24h']:+.2f}% "
                     f"at ${td['price']:.2f} — weave this in naturally if relevant"
                 )
+                prompt_prices = {token_key: td['price']}
 
         topic_map = {
             'status_report': f'a Vault 77 status observation and the Atomic Fizz Caps economy at {GAME_LINK}',
@@ -2562,12 +4469,17 @@ def _compose_broadcast_message(broadcast_type: str) -> str | None:
             ),
         }
         topic = topic_map.get(broadcast_type, 'the current state of the wasteland')
-        message = generate_overseer_tweet(topic, context=price_context)
-        if message:
-            if GAME_LINK not in message and random.random() > 0.5:
-                suffix = f" {GAME_LINK}"
-                if len(message) + len(suffix) <= TWITTER_CHAR_LIMIT:
-                    message += suffix
+        if LLM_BROADCAST_CANDIDATES > 1:
+            # One request, several candidates: dedup locally and keep the spares
+            candidates = generate_overseer_tweet_candidates(topic, context=price_context, n=LLM_BROADCAST_CANDIDATES)
+            fresh = [m for m in map(_with_game_link, candidates) if not is_near_duplicate_tweet(m)]
+            if fresh:
+                message = fresh[0]
+                stash_broadcast_candidates(broadcast_type, fresh[1:], prices=prompt_prices)
+        else:
+            message = generate_overseer_tweet(topic, context=price_context)
+            if message:
+                message = _with_game_link(message)
 
     # --- Static fallback path ---
     if not message:
@@ -2648,6 +4560,141 @@ def _compose_broadcast_message(broadcast_type: str) -> str | None:
     return message
 
 
+# ------------------------------------------------------------
+# BROADCAST BUFFER - PRE-GENERATED BROADCASTS READY TO POST
+# ------------------------------------------------------------
+# A background job composes broadcasts ahead of time so posting never waits on
+# the LLM. One small FIFO shared by all types holds (created_at, broadcast_type,
+# message, stamp), where stamp is the time-of-day period the prompt used and
+# the prices it quoted (empty when it quoted none). Entries are dropped once
+# older than BROADCAST_BUFFER_MAX_AGE, once the period changes, or once a
+# quoted price has moved more than BROADCAST_BUFFER_PRICE_DRIFT percent.
+# Broadcasts go out every 60-90 minutes, so one or two ready entries suffice.
+BROADCAST_BUFFER_ENABLED = os.getenv('BROADCAST_BUFFER_ENABLED', 'true').lower() == 'true'
+BROADCAST_BUFFER_SIZE = int(os.getenv('BROADCAST_BUFFER_SIZE', '2'))            # ready broadcasts in total
+BROADCAST_BUFFER_MAX_AGE = int(os.getenv('BROADCAST_BUFFER_MAX_AGE', '3600'))   # seconds (1 hour)
+BROADCAST_BUFFER_PRICE_DRIFT = float(os.getenv('BROADCAST_BUFFER_PRICE_DRIFT', '2.0'))  # percent
+BROADCAST_BUFFER_REFILL_BATCH = int(os.getenv('BROADCAST_BUFFER_REFILL_BATCH', '1'))  # generations per run
+BROADCAST_BUFFER = deque(maxlen=BROADCAST_BUFFER_SIZE)
+BROADCAST_BUFFER_LOCK = threading.Lock()
+BROADCAST_BUFFER_STATS = {'generated': 0, 'served': 0, 'misses': 0, 'stale_dropped': 0, 'duplicates_dropped': 0}
+
+
+def _broadcast_entry_stale(entry, cutoff, period, price_cache):
+    """True when a buffered entry is too old, from another period, or quotes a price that has moved."""
+    created_at, _, _, (entry_period, prices) = entry
+    if created_at < cutoff or entry_period != period:
+        return True
+    for key, price in prices.items():
+        now_price = (price_cache.get(key) or {}).get('price')
+        if price and now_price and abs(now_price - price) / price * 100 > BROADCAST_BUFFER_PRICE_DRIFT:
+            return True
+    return False
+
+
+def _drop_stale_broadcasts():
+    """Remove stale entries from BROADCAST_BUFFER. Caller holds BROADCAST_BUFFER_LOCK."""
+    cutoff = time.time() - BROADCAST_BUFFER_MAX_AGE
+    period = get_time_period()
+    price_cache = load_price_cache() if any(entry[3][1] for entry in BROADCAST_BUFFER) else {}
+    fresh = [entry for entry in BROADCAST_BUFFER if not _broadcast_entry_stale(entry, cutoff, period, price_cache)]
+    BROADCAST_BUFFER_STATS['stale_dropped'] += len(BROADCAST_BUFFER) - len(fresh)
+    BROADCAST_BUFFER.clear()
+    BROADCAST_BUFFER.extend(fresh)
+
+
+def pop_buffered_broadcast():
+    """Pop the oldest fresh, not-yet-posted broadcast as (broadcast_type, message), or None."""
+    while True:
+        with BROADCAST_BUFFER_LOCK:
+            _drop_stale_broadcasts()
+            if not BROADCAST_BUFFER:
+                BROADCAST_BUFFER_STATS['misses'] += 1
+                return None
+            _, broadcast_type, message, _ = BROADCAST_BUFFER.popleft()
+        # Something similar may have been posted since this was generated
+        if is_near_duplicate_tweet(message):
+            with BROADCAST_BUFFER_LOCK:
+                BROADCAST_BUFFER_STATS['duplicates_dropped'] += 1
+            continue
+        with BROADCAST_BUFFER_LOCK:
+            BROADCAST_BUFFER_STATS['served'] += 1
+        return broadcast_type, message
+
+
+def stash_broadcast_candidates(broadcast_type, messages, prices=None):
+    """Keep spare *broadcast_type* messages for later broadcasts. Returns how many were kept.
+
+    *prices* maps price-cache keys to the prices the prompt quoted; pass it only
+    when the messages were written against them.
+    """
+    if not BROADCAST_BUFFER_ENABLED:
+        return 0
+    kept = 0
+    now = time.time()
+    stamp = (get_time_period(), dict(prices or {}))
+    with BROADCAST_BUFFER_LOCK:
+        for message in messages:
+            if len(BROADCAST_BUFFER) >= BROADCAST_BUFFER_SIZE:
+                break
+            if any(message == m for _, _, m, _ in BROADCAST_BUFFER):
+                BROADCAST_BUFFER_STATS['duplicates_dropped'] += 1
+                continue
+            BROADCAST_BUFFER.append((now, broadcast_type, message, stamp))
+            BROADCAST_BUFFER_STATS['generated'] += 1
+            kept += 1
+    return kept
+
+
+def _llm_busy():
+    """True while live LLM work is queued or running on the shared executor."""
+    stats = get_llm_executor_stats()
+    return stats['queued'] > 0 or any(stats['in_flight'].values())
+
+
+def refill_broadcast_buffer(max_items=None):
+    """Top up the broadcast buffer to BROADCAST_BUFFER_SIZE with deduplicated messages.
+
+    Generates at most *max_items* messages (default BROADCAST_BUFFER_REFILL_BATCH),
+    only for free slots, and skips the run while live LLM work is in progress.
+    Returns the number added.
+    """
+    if max_items is None:
+        max_items = BROADCAST_BUFFER_REFILL_BATCH
+    with BROADCAST_BUFFER_LOCK:
+        _drop_stale_broadcasts()
+        free = BROADCAST_BUFFER_SIZE - len(BROADCAST_BUFFER)
+        buffered_types = {entry[1] for entry in BROADCAST_BUFFER}
+    if free <= 0:
+        return 0
+    if _llm_busy():
+        logging.debug("Broadcast buffer refill skipped - LLM busy")
+        return 0
+
+    added = 0
+    for _ in range(min(free, max_items)):
+        choices = [t for t in _BROADCAST_TYPES if t not in buffered_types] or _BROADCAST_TYPES
+        broadcast_type = random.choice(choices)
+        buffered_types.add(broadcast_type)
+        message = _compose_broadcast_message(broadcast_type)
+        if not message or is_near_duplicate_tweet(message):
+            continue
+        added += stash_broadcast_candidates(broadcast_type, [message])
+    if added:
+        logging.debug(f"Broadcast buffer refilled with {added} candidate(s)")
+    return added
+
+
+def get_broadcast_buffer_stats():
+    """Buffer depth and types plus hit/miss counters for /api/metrics."""
+    with BROADCAST_BUFFER_LOCK:
+        stats = dict(BROADCAST_BUFFER_STATS)
+        stats['depth'] = len(BROADCAST_BUFFER)
+        stats['types'] = [entry[1] for entry in BROADCAST_BUFFER]
+    stats['enabled'] = BROADCAST_BUFFER_ENABLED
+    return stats
+
+
 def overseer_broadcast():
     """Main broadcast function — LLM-driven with static fallback.
 
@@ -2665,15 +4712,19 @@ def overseer_broadcast():
     random.shuffle(type_pool)
 
     for attempt in range(MAX_BROADCAST_ATTEMPTS):
-        broadcast_type = type_pool[attempt]
+        # Pre-generated broadcast first; compose live only when the buffer is empty
+        buffered = pop_buffered_broadcast()
+        if buffered:
+            broadcast_type, message = buffered
+        else:
+            broadcast_type = type_pool[attempt]
+            message = _compose_broadcast_message(broadcast_type)
         logging.info(f"🎙️ Broadcasting: type={broadcast_type} (attempt {attempt + 1})")
-
-        message = _compose_broadcast_message(broadcast_type)
         if not message:
             logging.warning(f"Broadcast attempt {attempt + 1} produced no message: {broadcast_type} — retrying")
             continue
 
-        if is_duplicate_tweet(message):
+        if is_near_duplicate_tweet(message):
             logging.warning(
                 f"Broadcast attempt {attempt + 1} skipped (duplicate): {broadcast_type} — retrying"
             )
@@ -2707,6 +4758,109 @@ def overseer_broadcast():
 
     logging.warning("All broadcast attempts exhausted — no unique message found this cycle")
 
+# ------------------------------------------------------------
+# MENTION REPLY PIPELINE
+# Replies are generated in parallel (LLM, price and honeypot lookups), then
+# posted in mention order through per-endpoint token buckets sized to the
+# Twitter rate-limit windows. When a bucket runs dry or Twitter answers 429
+# the run stops posting; since_id is checkpointed after every mention and
+# generated-but-unsent replies are kept, so the next run resumes there.
+# ------------------------------------------------------------
+MENTION_REPLY_WORKERS = int(os.getenv('MENTION_REPLY_WORKERS', '4'))
+MENTION_REPLY_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=MENTION_REPLY_WORKERS, thread_name_prefix='mention-reply')
+
+# (requests, window seconds) per endpoint; defaults follow the Basic tier user limits
+TWITTER_ENDPOINT_LIMITS = {
+    'create_tweet': (int(os.getenv('TWITTER_TWEET_LIMIT', '100')), int(os.getenv('TWITTER_TWEET_WINDOW', '900'))),
+    'like': (int(os.getenv('TWITTER_LIKE_LIMIT', '50')), int(os.getenv('TWITTER_LIKE_WINDOW', '900'))),
+}
+TWITTER_SEND_LIMITERS = {
+    endpoint: TokenBucket(rate=limit / window, capacity=limit)
+    for endpoint, (limit, window) in TWITTER_ENDPOINT_LIMITS.items()
+}
+# After a 429 nothing is sent to the endpoint until this monotonic deadline passes
+_TWITTER_PAUSED_UNTIL = {endpoint: 0.0 for endpoint in TWITTER_ENDPOINT_LIMITS}
+TWITTER_SENDER_STATS = {endpoint: {'sent': 0, 'throttled': 0, 'rate_limited': 0}
+                        for endpoint in TWITTER_ENDPOINT_LIMITS}
+TWITTER_SENDER_LOCK = threading.Lock()
+
+# mention_id -> generated reply text not yet posted. Only touched by
+# overseer_respond, which runs as a single-instance scheduler job.
+_PENDING_REPLIES: dict = {}
+
+def acquire_twitter_slot(endpoint: str) -> bool:
+    """Take one send slot for *endpoint*; False while paused or out of budget (never sleeps)"""
+    with TWITTER_SENDER_LOCK:
+        if time.monotonic() < _TWITTER_PAUSED_UNTIL[endpoint]:
+            TWITTER_SENDER_STATS[endpoint]['throttled'] += 1
+            return False
+    if not TWITTER_SEND_LIMITERS[endpoint].try_acquire():
+        with TWITTER_SENDER_LOCK:
+            TWITTER_SENDER_STATS[endpoint]['throttled'] += 1
+        return False
+    with TWITTER_SENDER_LOCK:
+        TWITTER_SENDER_STATS[endpoint]['sent'] += 1
+    return True
+
+def pause_twitter_endpoint(endpoint: str, exc: tweepy.TweepyException):
+    """Pause *endpoint* until the reset time Twitter sent with a 429 (or one full window)"""
+    delay = TWITTER_ENDPOINT_LIMITS[endpoint][1]
+    response = getattr(exc, 'response', None)
+    try:
+        reset = float(response.headers['x-rate-limit-reset'])
+        delay = max(1.0, reset - time.time())
+    except (AttributeError, KeyError, TypeError, ValueError):
+        pass
+    with TWITTER_SENDER_LOCK:
+        _TWITTER_PAUSED_UNTIL[endpoint] = time.monotonic() + delay
+        TWITTER_SENDER_STATS[endpoint]['rate_limited'] += 1
+    logging.warning(f"Twitter {endpoint} rate limited; pausing for {delay:.0f}s")
+
+def twitter_send_capacity(endpoint: str) -> int:
+    """Whole sends *endpoint* could make right now (0 while paused), without taking any"""
+    with TWITTER_SENDER_LOCK:
+        if time.monotonic() < _TWITTER_PAUSED_UNTIL[endpoint]:
+            return 0
+    return int(TWITTER_SEND_LIMITERS[endpoint].available())
+
+def get_twitter_sender_stats() -> dict:
+    now = time.monotonic()
+    with TWITTER_SENDER_LOCK:
+        stats = {endpoint: dict(counts) for endpoint, counts in TWITTER_SENDER_STATS.items()}
+        for endpoint in stats:
+            stats[endpoint]['paused_for'] = round(max(0.0, _TWITTER_PAUSED_UNTIL[endpoint] - now), 1)
+    for endpoint, limiter in TWITTER_SEND_LIMITERS.items():
+        stats[endpoint]['available'] = round(limiter.available(), 2)
+    stats['pending_replies'] = len(_PENDING_REPLIES)
+    return stats
+
+def _prepare_mention_reply(mention):
+    """Worker task: (username, user_message, response), or None when the author is unknown"""
+    username = resolve_username(mention.author_id)
+    if not username:
+        return None
+    user_message = mention.text.replace(f"@{bot_username}", "").strip().lower()
+    response = _PENDING_REPLIES.get(int(mention.id)) or generate_contextual_response(username, user_message)
+    return username, user_message, response
+
+def _generate_mention_replies(mentions) -> dict:
+    """
+    Prepare replies for *mentions* on MENTION_REPLY_EXECUTOR
+
+    Returns {mention_id: result of _prepare_mention_reply}; mentions whose
+    generation raised are left out so they are retried next run.
+    """
+    futures = {MENTION_REPLY_EXECUTOR.submit(_prepare_mention_reply, m): int(m.id) for m in mentions}
+    results = {}
+    for future in concurrent.futures.as_completed(futures):
+        mention_id = futures[future]
+        try:
+            results[mention_id] = future.result()
+        except Exception as e:
+            logging.error(f"Reply generation failed for mention {mention_id}: {e}")
+    return results
+
 def overseer_respond():
     """Respond to mentions with personality-driven responses."""
     if not TWITTER_ENABLED or not client:
@@ -2716,7 +4870,7 @@ def overseer_respond():
         logging.debug("Skipping mention check - read access not available (free tier)")
         return
 
-    processed = load_json_set(PROCESSED_MENTIONS_FILE)
+    _migrate_processed_mentions_file()
     try:
         # Use cached bot identity from startup tier detection — avoids an
         # extra get_me() API call on every scheduler tick.
@@ -2724,46 +4878,97 @@ def overseer_respond():
             logging.error("Bot user identity not cached; skipping mention check")
             return
 
-        mentions = client.get_users_mentions(
-            bot_user_id,
-            max_results=50,
-            tweet_fields=["author_id", "text"]
-        )
-        
-        if not mentions.data:
+        since_id = get_mention_since_id()
+        until_id = get_mention_until_id()
+        mentions, truncated = fetch_new_mentions(since_id, until_id)
+        if not mentions:
+            if until_id:
+                set_mention_until_id(None)  # the gap below until_id was empty
             return
-            
-        for mention in mentions.data:
-            if str(mention.id) in processed:
-                continue
-
-            user_id = mention.author_id
-            user_data = client.get_user(id=user_id)
-            if not user_data or not user_data.data:
-                continue
-                
-            username = user_data.data.username
-            user_message = mention.text.replace(
-                f"@{bot_username}", ""
-            ).strip().lower()
-
-            # Generate contextual response based on user message
-            response = generate_contextual_response(username, user_message)
-
-            try:
-                client.create_tweet(
-                    text=response,
-                    in_reply_to_tweet_id=mention.id
-                )
-                client.like(mention.id)
-                processed.add(str(mention.id))
-                logging.info(f"Replied to @{username}")
-                add_activity("MENTION_REPLY", f"@{username}: {user_message[:50]}...")
-            except tweepy.TweepyException as e:
-                logging.error(f"Reply failed: {e}")
-                add_activity("ERROR", f"Reply failed to @{username}: {str(e)}")
-
-        save_json_set(processed, PROCESSED_MENTIONS_FILE)
+        if truncated:
+            # Older mentions were left unread: read the gap below these next run
+            set_mention_until_id(mentions[0].id)
+
+        pending = filter_unprocessed_mentions(m.id for m in mentions)
+        # Forget unsent replies whose mentions were handled some other way
+        for mention_id in [i for i in _PENDING_REPLIES if i not in pending]:
+            del _PENDING_REPLIES[mention_id]
+        # Only prepare as many replies as the send budget can post this run
+        batch = [m for m in mentions if int(m.id) in pending][:twitter_send_capacity('create_tweet')]
+        replies = _generate_mention_replies(batch)
+        batch_ids = {int(m.id) for m in batch}
+        finished = set()  # posted or given up this run
+
+        # since_id only advances past a contiguous run of handled mentions, so
+        # a failed reply is retried next run; processed_mentions stops the
+        # handled ones above it from being answered twice. Unread pages below
+        # a truncated fetch block it the same way.
+        high_water = since_id
+        blocked = truncated
+        for mention in mentions:
+            mention_id = int(mention.id)
+            handled = mention_id not in pending or replies.get(mention_id, False) is None
+            if not handled:
+                if mention_id not in batch_ids:
+                    logging.info("Reply budget exhausted; remaining mentions resume next run")
+                    break
+                if mention_id not in replies:
+                    blocked = True  # generation failed; retry next run
+                    continue
+                username, user_message, response = replies[mention_id]
+                posted = False
+                if not acquire_twitter_slot('create_tweet'):
+                    logging.info("Reply budget exhausted; remaining mentions resume next run")
+                    break
+                try:
+                    client.create_tweet(
+                        text=response,
+                        in_reply_to_tweet_id=mention.id
+                    )
+                    handled = posted = True
+                    mark_mention_processed(mention.id)
+                    logging.info(f"Replied to @{username}")
+                    add_activity("MENTION_REPLY", f"@{username}: {user_message[:50]}...")
+                except tweepy.TooManyRequests as e:
+                    pause_twitter_endpoint('create_tweet', e)
+                    break
+                except tweepy.TweepyException as e:
+                    attempts = _MENTION_FAILURES.get(mention_id, 0) + 1
+                    _MENTION_FAILURES[mention_id] = attempts
+                    if _is_twitter_duplicate_error(e) or attempts >= MENTION_REPLY_MAX_ATTEMPTS:
+                        # Give up on this mention rather than pinning since_id forever
+                        mark_mention_processed(mention.id)
+                        _MENTION_FAILURES.pop(mention_id, None)
+                        handled = True
+                    else:
+                        blocked = True
+                    logging.error(f"Reply failed: {e}")
+                    add_activity("ERROR", f"Reply failed to @{username}: {str(e)}")
+                if handled:
+                    finished.add(mention_id)
+
+                # Likes are best effort: skipped when over budget, never retried
+                if posted and acquire_twitter_slot('like'):
+                    try:
+                        client.like(mention.id)
+                    except tweepy.TooManyRequests as e:
+                        pause_twitter_endpoint('like', e)
+                    except tweepy.TweepyException as e:
+                        logging.warning(f"Like failed for mention {mention_id}: {e}")
+
+            if handled and not blocked:
+                high_water = mention_id
+                set_mention_since_id(high_water)
+
+        if until_id and not truncated and high_water == int(mentions[-1].id):
+            set_mention_until_id(None)  # gap closed; since_id can move on past until_id
+
+        # Keep every generated reply that was not sent so the next run posts it as-is
+        for mention_id, prepared in replies.items():
+            if mention_id in finished:
+                _PENDING_REPLIES.pop(mention_id, None)
+            elif prepared is not None:
+                _PENDING_REPLIES[mention_id] = prepared[2]
 
     except tweepy.TweepyException as e:
         logging.error(f"Mentions fetch failed: {e}")
@@ -3008,7 +5213,7 @@ def overseer_diagnostic():
             )
     diag = diag[:TWITTER_CHAR_LIMIT]
     try:
-        if is_duplicate_tweet(diag):
+        if is_near_duplicate_tweet(diag):
             logging.debug("Diagnostic skipped (duplicate content)")
             return
         client.create_tweet(text=diag)
@@ -3031,7 +5236,7 @@ def keep_alive_ping():
         return
     try:
         url = f"{RENDER_EXTERNAL_URL}/health"
-        resp = requests.get(url, timeout=10)
+        resp = http_client.get(url, timeout=10)
         logging.debug(f"Keep-alive ping: {resp.status_code}")
     except Exception as e:
         logging.warning(f"Keep-alive ping failed (service may sleep): {e}")
@@ -3095,7 +5300,13 @@ def post_activation_tweet():
                 f"{random.choice(LORES)}\n\n"
                 f"🎮 {GAME_LINK}"
             )[:TWITTER_CHAR_LIMIT]
+        # Quick redeploys can land in the same minute and rebuild an identical message
+        if is_duplicate_tweet(activation_msg):
+            logging.info("Activation tweet skipped (duplicate of a recent post)")
+            add_activity("STARTUP", f"Bot activated - {BOT_NAME} (announcement skipped: duplicate)")
+            return
         client.create_tweet(text=activation_msg)
+        mark_tweet_sent(activation_msg)
         logging.info("Activation message posted")
         add_activity("STARTUP", f"Bot activated - {BOT_NAME}")
     except tweepy.TweepyException as e:
@@ -3135,6 +5346,10 @@ def initialize_bot():
         scheduler.add_job(overseer_retweet_hunt, 'interval', hours=1, id='retweet')
         logging.info("Scheduler: overseer_retweet_hunt job added (interval: 1 hour)")
 
+        if EVENT_DIGEST_ENABLED:
+            scheduler.add_job(flush_event_digest, 'interval', minutes=EVENT_DIGEST_INTERVAL, id='event_digest')
+            logging.info(f"Scheduler: flush_event_digest job added (interval: {EVENT_DIGEST_INTERVAL} minutes)")
+
         scheduler.add_job(overseer_diagnostic, 'cron', hour=8, id='diagnostic')
         logging.info("Scheduler: overseer_diagnostic job added (cron: 8 AM daily)")
 
@@ -3148,6 +5363,20 @@ def initialize_bot():
             scheduler.add_job(keep_alive_ping, 'interval', minutes=7, id='keep_alive')
             logging.info("Scheduler: keep_alive_ping job added (interval: 7 minutes)")
 
+        if BROADCAST_BUFFER_ENABLED and LLM_ENABLED:
+            scheduler.add_job(
+                refill_broadcast_buffer, 'interval', minutes=10, id='broadcast_buffer',
+                next_run_time=datetime.now(timezone.utc) + timedelta(minutes=1),
+            )
+            logging.info("Scheduler: refill_broadcast_buffer job added (first run in 1 min, then every 10 minutes)")
+
+        scheduler.add_job(compact_state_store, 'interval', hours=1, id='state_compact')
+        logging.info("Scheduler: compact_state_store job added (interval: 1 hour)")
+
+        if LLM_CACHE_PERSIST:
+            scheduler.add_job(compact_llm_disk_cache, 'interval', hours=1, id='llm_cache_compact')
+            logging.info("Scheduler: compact_llm_disk_cache job added (interval: 1 hour)")
+
         # Warm the Fallout wiki lore cache on startup and refresh every 2 hours
         scheduler.add_job(
             warm_wiki_lore_cache, 'interval', hours=2, id='wiki_lore_refresh',
@@ -3173,6 +5402,9 @@ def initialize_bot():
     activation_thread = threading.Thread(target=delayed_activation, daemon=True)
     activation_thread.start()
 
+    # Start the optional websocket price feed (REST polling remains the fallback)
+    start_price_stream()
+
     # Start external API polling (overseer-bot-ai <-> overseer-bot-ui bridge)
     api_client.start_polling()
     logging.info("External API polling started")
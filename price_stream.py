@@ -0,0 +1,255 @@
+"""
+Streaming price feed for overseer-bot-ai
+Subscribes to exchange websocket ticker streams and pushes each update to a
+callback, plus a local replay server so the streaming mode can be tested offline
+"""
+import argparse
+import json
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+# websockets is optional; without it the bot stays on the REST polling path
+WEBSOCKETS_AVAILABLE = False
+try:
+    from websockets.sync.client import connect as ws_connect
+    from websockets.sync.server import serve as ws_serve
+    WEBSOCKETS_AVAILABLE = True
+except ImportError as e:
+    logging.warning(f"websockets not available: {e}. Streaming price mode will be disabled.")
+
+
+# Configuration from environment variables
+PRICE_STREAM_ENABLED = os.getenv('PRICE_STREAM_ENABLED', 'false').lower() == 'true'
+PRICE_STREAM_URL = os.getenv('PRICE_STREAM_URL', 'wss://stream.binance.com:9443/stream')
+PRICE_STREAM_STALE_SECONDS = int(os.getenv('PRICE_STREAM_STALE_SECONDS', '60'))
+RECONNECT_MIN_DELAY = 1   # seconds
+RECONNECT_MAX_DELAY = 60  # seconds
+
+
+def stream_name(symbol: str) -> str:
+    """Binance ticker stream name for a ccxt symbol ('SOL/USDT' -> 'solusdt@ticker')"""
+    return f"{symbol.replace('/', '').lower()}@ticker"
+
+
+def build_stream_url(base_url: str, symbols: Iterable[str]) -> str:
+    """Combined-stream URL subscribing to the ticker stream of every symbol"""
+    return f"{base_url.rstrip('/')}?streams={'/'.join(stream_name(s) for s in symbols)}"
+
+
+def parse_ticker_message(raw, symbols_by_id: Dict[str, str], source: str = 'binance') -> Optional[tuple]:
+    """
+    Parse a Binance 24hr ticker message (raw or combined-stream envelope)
+
+    Args:
+        raw: Message text or bytes from the websocket
+        symbols_by_id: Exchange market id -> ccxt symbol (e.g. 'SOLUSDT' -> 'SOL/USDT')
+        source: Value for the 'source' field of the price data
+
+    Returns:
+        (symbol, price data) in the same shape as overseer_bot.get_token_price(),
+        or None for messages that are not tickers for a known symbol
+    """
+    try:
+        message = json.loads(raw)
+    except (TypeError, ValueError):
+        return None
+    data = message.get('data', message) if isinstance(message, dict) else None
+    if not isinstance(data, dict) or data.get('e') != '24hrTicker':
+        return None
+    symbol = symbols_by_id.get(data.get('s'))
+    if not symbol:
+        return None
+    try:
+        return symbol, {
+            'price': float(data['c']),
+            'high_24h': float(data['h']),
+            'low_24h': float(data['l']),
+            'volume_24h': float(data['q']),
+            'change_24h': float(data['P']),
+            'timestamp': time.time(),
+            'source': source
+        }
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class PriceStream:
+    """
+    Background websocket ticker subscription with automatic reconnect
+
+    Every parsed ticker is passed to on_price(symbol, price_data). The latest
+    price per symbol is kept so callers can tell whether the stream is fresh
+    enough to skip the REST poll.
+    """
+
+    def __init__(self, symbols: List[str], on_price: Callable[[str, dict], None],
+                 base_url: str = PRICE_STREAM_URL, source: str = 'binance',
+                 stale_seconds: int = PRICE_STREAM_STALE_SECONDS):
+        self.symbols = list(symbols)
+        self.on_price = on_price
+        self.url = build_stream_url(base_url, self.symbols)
+        self.source = source
+        self.stale_seconds = stale_seconds
+        self._symbols_by_id = {s.replace('/', '').upper(): s for s in self.symbols}
+        self._latest: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._status = {
+            'connected': False,
+            'messages': 0,
+            'reconnects': 0,
+            'errors': 0,
+            'last_message': None
+        }
+
+    def start(self):
+        """Start the background subscription thread"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True, name='price-stream')
+        self._thread.start()
+        logging.info(f"Price stream started for {self.symbols}")
+
+    def stop(self, timeout: float = 5):
+        """Stop the subscription and wait for the thread to exit"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _run(self):
+        delay = RECONNECT_MIN_DELAY
+        while not self._stop.is_set():
+            try:
+                with ws_connect(self.url, open_timeout=10) as ws:
+                    with self._lock:
+                        self._status['connected'] = True
+                    delay = RECONNECT_MIN_DELAY
+                    self._consume(ws)
+            except Exception as e:
+                with self._lock:
+                    self._status['errors'] += 1
+                logging.warning(f"Price stream disconnected: {e}")
+            finally:
+                with self._lock:
+                    self._status['connected'] = False
+
+            if self._stop.wait(delay):
+                break
+            delay = min(delay * 2, RECONNECT_MAX_DELAY)
+            with self._lock:
+                self._status['reconnects'] += 1
+
+    def _consume(self, ws):
+        last_message = time.monotonic()
+        while not self._stop.is_set():
+            try:
+                raw = ws.recv(timeout=1)
+            except TimeoutError:
+                if time.monotonic() - last_message > self.stale_seconds:
+                    raise TimeoutError(f"no ticker for {self.stale_seconds}s")
+                continue
+            last_message = time.monotonic()
+            parsed = parse_ticker_message(raw, self._symbols_by_id, self.source)
+            if not parsed:
+                continue
+            symbol, price_data = parsed
+            with self._lock:
+                self._latest[symbol] = price_data
+                self._status['messages'] += 1
+                self._status['last_message'] = price_data['timestamp']
+            try:
+                self.on_price(symbol, price_data)
+            except Exception as e:
+                logging.error(f"Price stream callback failed for {symbol}: {e}", exc_info=True)
+
+    def fresh_prices(self) -> Dict[str, dict]:
+        """Latest streamed price data for symbols updated within stale_seconds"""
+        cutoff = time.time() - self.stale_seconds
+        with self._lock:
+            if not self._status['connected']:
+                return {}
+            return {s: d for s, d in self._latest.items() if d['timestamp'] >= cutoff}
+
+    def status(self) -> dict:
+        """Connection and message counters for /api/metrics"""
+        with self._lock:
+            return dict(self._status, symbols=self.symbols)
+
+
+class ReplayServer:
+    """
+    Local websocket server that replays recorded ticker messages
+
+    Every client connection receives the same messages in order, `interval`
+    seconds apart, optionally looping forever. Use port=0 to bind a free port.
+    """
+
+    def __init__(self, messages: List[str], host: str = '127.0.0.1', port: int = 0,
+                 interval: float = 0.0, loop: bool = False):
+        self.messages = list(messages)
+        self.interval = interval
+        self.loop = loop
+        self._server = ws_serve(self._handler, host, port)
+        self.host, self.port = self._server.socket.getsockname()[:2]
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}"
+
+    def _handler(self, connection):
+        try:
+            while True:
+                for message in self.messages:
+                    connection.send(message)
+                    if self.interval:
+                        time.sleep(self.interval)
+                if not self.loop:
+                    break
+            # Hold the connection open so clients see a quiet, not dropped, stream
+            connection.recv()
+        except Exception:
+            pass
+
+    def start(self):
+        """Serve in a background thread"""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True, name='price-replay')
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Shut the server down"""
+        self._server.shutdown()
+        if self._thread:
+            self._thread.join(5)
+
+
+def load_replay_file(path: str) -> List[str]:
+    """Read recorded messages from an NDJSON file (one message per line)"""
+    with open(path, 'r') as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def main():
+    """Run a replay server from the command line for offline testing"""
+    parser = argparse.ArgumentParser(description="Replay recorded ticker messages over a local websocket")
+    parser.add_argument('file', help="NDJSON file with one recorded websocket message per line")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--interval', type=float, default=1.0, help="seconds between messages")
+    parser.add_argument('--once', action='store_true', help="replay once instead of looping")
+    args = parser.parse_args()
+
+    server = ReplayServer(load_replay_file(args.file), port=args.port,
+                          interval=args.interval, loop=not args.once)
+    print(f"Replaying {len(server.messages)} messages on {server.url} "
+          f"(set PRICE_STREAM_URL={server.url})")
+    server._server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""
+Embedded SQLite storage for overseer-bot-ai
+Small WAL-mode databases that open lazily on first use and apply writes on a
+background thread, so persistence stays off request and posting hot paths
+"""
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from typing import Iterable, List, Optional
+
+
+class SQLiteStore:
+    """
+    Lazily opened SQLite database with batched asynchronous writes
+
+    Reads run synchronously on a shared connection guarded by a lock. Writes
+    queued with execute_async() are applied by a daemon writer thread, which
+    groups up to `batch_size` statements into one transaction. Each statement
+    runs in its own savepoint, so a failing one is logged and dropped without
+    losing the rest of the batch.
+    """
+
+    def __init__(self, path: str, schema: Iterable[str], batch_size: int = 200):
+        self.path = path
+        self.schema = list(schema)
+        self.batch_size = batch_size
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue" = queue.Queue()
+        self._writer = None
+        self._writer_lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database and apply the schema on first use. Caller holds _lock."""
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            for statement in self.schema:
+                conn.execute(statement)
+            conn.commit()
+            self._conn = conn
+            logging.info(f"State store opened: {self.path}")
+        return self._conn
+
+    def query(self, sql: str, params: tuple = ()) -> List[tuple]:
+        """Run a read query and return all rows"""
+        with self._lock:
+            return self._connection().execute(sql, params).fetchall()
+
+    def execute(self, sql: str, params: tuple = ()):
+        """Run a write statement synchronously and commit"""
+        with self._lock:
+            conn = self._connection()
+            conn.execute(sql, params)
+            conn.commit()
+
+    def execute_async(self, sql: str, params: tuple = ()):
+        """Queue a write statement for the background writer"""
+        self._ensure_writer()
+        self._queue.put((sql, params))
+
+    def _ensure_writer(self):
+        with self._writer_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._writer_loop, daemon=True,
+                                                name=f"sqlite-writer:{self.path}")
+                self._writer.start()
+
+    def _writer_loop(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                with self._lock:
+                    self._apply_batch(self._connection(), batch)
+            except sqlite3.Error as e:
+                logging.error(f"State store write failed ({self.path}): {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _apply_batch(self, conn: sqlite3.Connection, batch: List[tuple]):
+        """Apply *batch* in one transaction, one savepoint per statement. Caller holds _lock."""
+        try:
+            conn.execute("BEGIN")
+            for sql, params in batch:
+                conn.execute("SAVEPOINT write")
+                try:
+                    conn.execute(sql, params)
+                except sqlite3.Error as e:
+                    conn.execute("ROLLBACK TO write")
+                    logging.error(f"State store write dropped ({self.path}): {sql} {params!r}: {e}")
+                conn.execute("RELEASE write")
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until queued writes are applied. Returns False on timeout."""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def pending_writes(self) -> int:
+        """Number of queued writes not yet applied"""
+        return self._queue.unfinished_tasks
+
+    def close(self):
+        """Flush pending writes and close the connection"""
+        self.flush()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -10,6 +10,8 @@ All tests use plain assert statements and mock out external I/O so they can
 run without real Twitter credentials or network access.
 """
 
+import base64
+import concurrent.futures
 import importlib
 import sys
 import types
@@ -47,6 +49,11 @@ for _key in ['CONSUMER_KEY', 'CONSUMER_SECRET', 'ACCESS_TOKEN',
              'ACCESS_SECRET', 'BEARER_TOKEN']:
     os.environ.pop(_key, None)
 
+# Keep persisted dedup state out of the working tree
+import tempfile
+_STATE_DIR = tempfile.TemporaryDirectory()
+os.environ.setdefault('STATE_DB_FILE', os.path.join(_STATE_DIR.name, 'state.db'))
+
 import overseer_bot as bot
 
 # ===========================================================================
@@ -54,19 +61,56 @@ import overseer_bot as bot
 # ===========================================================================
 
 def _reset_tweet_dedup():
-    """Clear the in-memory dedup dict between tests."""
+    """Clear the dedup dict, its persisted rows and the near-duplicate index between tests."""
+    bot.STATE_STORE.flush()
+    bot.STATE_STORE.execute("DELETE FROM tweet_hashes")
     with bot.RECENT_TWEET_HASHES_LOCK:
         bot.RECENT_TWEET_HASHES.clear()
+        bot._RECENT_TWEET_ORDER.clear()
+        bot._tweet_dedup_state['loaded'] = True
+    bot.NEAR_DUPLICATE_INDEX.clear()
 
 
 def _reset_price_cooldowns():
-    bot.PRICE_ALERT_COOLDOWNS.clear()
+    bot.STATE_STORE.flush()
+    bot.STATE_STORE.execute("DELETE FROM price_alert_cooldowns")
+    with bot.PRICE_ALERT_COOLDOWNS_LOCK:
+        bot.PRICE_ALERT_COOLDOWNS.clear()
+        bot._price_cooldown_state['loaded'] = True
+
+
+def _reset_mention_state():
+    bot.STATE_STORE.flush()
+    bot.STATE_STORE.execute("DELETE FROM processed_mentions")
+    bot.STATE_STORE.execute("DELETE FROM bot_state")
+    bot._mention_state['migrated'] = True
+    bot._mention_state[bot.MENTIONS_SINCE_ID_KEY] = None
+    bot._mention_state[bot.MENTIONS_UNTIL_ID_KEY] = None
+    bot._PROCESSED_MENTIONS.clear()
+    bot._MENTION_FAILURES.clear()
+    with bot.USER_CACHE_LOCK:
+        bot.USER_CACHE.clear()
+    bot._PENDING_REPLIES.clear()
+    for endpoint, (limit, window) in bot.TWITTER_ENDPOINT_LIMITS.items():
+        bot.TWITTER_SEND_LIMITERS[endpoint] = bot.TokenBucket(rate=limit / window, capacity=limit)
+        bot._TWITTER_PAUSED_UNTIL[endpoint] = 0.0
 
 
 def _reset_llm_cache():
     bot.LLM_CACHE.clear()
 
 
+def _reset_llm_breakers():
+    with bot._LLM_BREAKERS_LOCK:
+        bot._LLM_BREAKERS.clear()
+
+
+def _admin_auth_headers():
+    """HTTP Basic Auth header for the admin-protected dashboard and /api/* routes."""
+    token = base64.b64encode(f"{bot.ADMIN_USERNAME}:{bot.ADMIN_PASSWORD}".encode()).decode()
+    return {'Authorization': f'Basic {token}'}
+
+
 # ===========================================================================
 # 1. Tweet deduplication
 # ===========================================================================
@@ -103,10 +147,9 @@ class TestTweetDedup(unittest.TestCase):
     def test_expired_entry_not_duplicate(self):
         """Entries older than the dedup window should not block new tweets."""
         text = "old tweet"
-        h = bot._tweet_hash(text)
-        with bot.RECENT_TWEET_HASHES_LOCK:
-            # Place a timestamp well outside the window
-            bot.RECENT_TWEET_HASHES[h] = time.time() - bot.TWEET_DEDUP_WINDOW_SECONDS - 1
+        # Post at a time well outside the window
+        with patch.object(bot.time, 'time', return_value=time.time() - bot.TWEET_DEDUP_WINDOW_SECONDS - 1):
+            bot.mark_tweet_sent(text)
         assert not bot.is_duplicate_tweet(text), \
             "Expired dedup entry should not block re-posting"
 
@@ -114,8 +157,8 @@ class TestTweetDedup(unittest.TestCase):
         """is_duplicate_tweet should clean up expired entries."""
         old_text = "ancient tweet"
         h = bot._tweet_hash(old_text)
-        with bot.RECENT_TWEET_HASHES_LOCK:
-            bot.RECENT_TWEET_HASHES[h] = time.time() - bot.TWEET_DEDUP_WINDOW_SECONDS - 1
+        with patch.object(bot.time, 'time', return_value=time.time() - bot.TWEET_DEDUP_WINDOW_SECONDS - 1):
+            bot.mark_tweet_sent(old_text)
         bot.is_duplicate_tweet("trigger prune")
         with bot.RECENT_TWEET_HASHES_LOCK:
             assert h not in bot.RECENT_TWEET_HASHES, "Expired entry should be pruned"
@@ -147,6 +190,18 @@ class TestPriceAlertCooldown(unittest.TestCase):
         assert not bot.is_price_alert_on_cooldown(symbol), \
             "Cooldown should have expired"
 
+    def test_reservation_is_granted_once(self):
+        reserved_at = bot.reserve_price_alert_cooldown("BTC/USDT")
+        assert reserved_at is not None
+        assert bot.reserve_price_alert_cooldown("BTC/USDT") is None
+        assert bot.is_price_alert_on_cooldown("BTC/USDT")
+
+    def test_released_reservation_can_be_taken_again(self):
+        reserved_at = bot.reserve_price_alert_cooldown("ETH/USDT")
+        bot.release_price_alert_cooldown("ETH/USDT", reserved_at)
+        assert not bot.is_price_alert_on_cooldown("ETH/USDT")
+        assert bot.reserve_price_alert_cooldown("ETH/USDT") is not None
+
 
 # ===========================================================================
 # 3. Twitter duplicate error detection
@@ -368,6 +423,12 @@ class TestPostActivationTweet(unittest.TestCase):
         self.mock_client.create_tweet.side_effect = bot.tweepy.TweepyException("fail")
         bot.post_activation_tweet()  # must not raise
 
+    def test_identical_activation_tweet_not_reposted(self):
+        with patch.object(bot.random, 'choice', side_effect=lambda seq: seq[0]):
+            bot.post_activation_tweet()
+            bot.post_activation_tweet()
+        self.mock_client.create_tweet.assert_called_once()
+
 
 # ===========================================================================
 # 9. overseer_diagnostic — with mocked Twitter client
@@ -479,6 +540,7 @@ class TestLlmFallbacks(unittest.TestCase):
 
     def setUp(self):
         _reset_llm_cache()
+        _reset_llm_breakers()
 
     def tearDown(self):
         _reset_llm_cache()
@@ -507,6 +569,7 @@ class TestLlmFallbacks(unittest.TestCase):
             bot.LLM_ENABLED = True
             with patch.object(bot.random, 'random', return_value=0.9), \
                  patch.object(bot, 'generate_overseer_tweet', return_value=None), \
+                 patch.object(bot, 'generate_overseer_tweet_candidates', return_value=[]), \
                  patch.object(bot, 'load_price_cache', return_value={}):
                 message = bot._compose_broadcast_message('status_report')
             assert message, "Broadcast generation should fall back to static content"
@@ -599,6 +662,2108 @@ class TestHealthEndpoint(unittest.TestCase):
         assert response.get_json()["status"] == "ok"
 
 
+# ===========================================================================
+# 13. Exchange registry — pooled ccxt instances
+# ===========================================================================
+
+class TestExchangeRegistry(unittest.TestCase):
+
+    def setUp(self):
+        bot._EXCHANGES.clear()
+        with bot.EXCHANGE_LATENCY_STATS_LOCK:
+            bot.EXCHANGE_LATENCY_STATS.clear()
+        self.exchange_cls = MagicMock()
+        self.exchange_cls.return_value.fetch_ticker.return_value = {
+            'last': 150.0, 'high': 155.0, 'low': 140.0,
+            'quoteVolume': 1e6, 'percentage': 2.5,
+        }
+
+    def tearDown(self):
+        bot._EXCHANGES.clear()
+
+    def test_exchange_built_once_across_calls(self):
+        with patch.object(bot.ccxt, 'binance', self.exchange_cls, create=True):
+            bot.get_token_price('SOL/USDT', 'binance')
+            bot.get_token_price('SOL/USDT', 'binance')
+        assert self.exchange_cls.call_count == 1, "Exchange should be constructed only once"
+        assert self.exchange_cls.return_value.fetch_ticker.call_count == 2
+
+    def test_latency_counters_recorded(self):
+        with patch.object(bot.ccxt, 'binance', self.exchange_cls, create=True):
+            data = bot.get_token_price('SOL/USDT', 'binance')
+        assert data['price'] == 150.0
+        stats = bot.get_exchange_latency_stats()['binance']
+        assert stats['calls'] == 1 and stats['errors'] == 0
+        assert stats['avg_ms'] >= 0
+
+    def test_failed_call_counts_as_error_and_falls_back(self):
+        self.exchange_cls.return_value.fetch_ticker.side_effect = RuntimeError("boom")
+        with patch.object(bot.ccxt, 'binance', self.exchange_cls, create=True), \
+             patch.object(bot, 'get_token_price_coingecko', return_value=None) as cg:
+            assert bot.get_token_price('SOL/USDT', 'binance') is None
+        cg.assert_called_once_with('SOL/USDT')
+        assert bot.get_exchange_latency_stats()['binance']['errors'] == 1
+
+
+# ===========================================================================
+# 14. Bulk price fetch — one multi-ticker request per exchange
+# ===========================================================================
+
+class TestBulkTokenPrices(unittest.TestCase):
+
+    def setUp(self):
+        bot._EXCHANGES.clear()
+        bot.COINGECKO_CACHE.clear()
+        self.exchange_cls = MagicMock()
+
+    def tearDown(self):
+        bot._EXCHANGES.clear()
+        bot.COINGECKO_CACHE.clear()
+
+    def _ticker(self, last):
+        return {'last': last, 'high': last, 'low': last, 'quoteVolume': 1.0, 'percentage': 1.0}
+
+    def test_one_fetch_tickers_call_per_exchange(self):
+        self.exchange_cls.return_value.fetch_tickers.return_value = {
+            'SOL/USDT': self._ticker(150.0),
+            'BTC/USDT': self._ticker(60000.0),
+            'ETH/USDT': self._ticker(3000.0),
+        }
+        with patch.object(bot.ccxt, 'binance', self.exchange_cls, create=True), \
+             patch.object(bot, 'get_token_prices_coingecko') as cg:
+            prices = bot.get_token_prices(bot.MONITORED_TOKENS)
+        self.exchange_cls.return_value.fetch_tickers.assert_called_once()
+        cg.assert_not_called()
+        assert prices['BTC/USDT']['price'] == 60000.0
+        assert prices['SOL/USDT']['source'] == 'binance'
+
+    def test_missing_symbols_go_to_one_coingecko_call(self):
+        self.exchange_cls.return_value.fetch_tickers.return_value = {
+            'SOL/USDT': self._ticker(150.0),
+        }
+        cg_result = {'BTC/USDT': {'price': 1.0}, 'ETH/USDT': {'price': 2.0}}
+        with patch.object(bot.ccxt, 'binance', self.exchange_cls, create=True), \
+             patch.object(bot, 'get_token_prices_coingecko', return_value=cg_result) as cg:
+            prices = bot.get_token_prices(bot.MONITORED_TOKENS)
+        cg.assert_called_once_with(['BTC/USDT', 'ETH/USDT'])
+        assert set(prices) == {'SOL/USDT', 'BTC/USDT', 'ETH/USDT'}
+
+    def test_coingecko_batch_uses_single_request(self):
+        payload = {
+            'solana': {'usd': 150.0, 'usd_24h_change': 1.0, 'usd_24h_vol': 5.0},
+            'bitcoin': {'usd': 60000.0, 'usd_24h_change': -1.0, 'usd_24h_vol': 9.0},
+        }
+        with patch.object(bot, '_fetch_coingecko_simple_prices', return_value=payload) as fetch:
+            prices = bot.get_token_prices_coingecko(['SOL/USDT', 'BTC/USDT'])
+        fetch.assert_called_once()
+        assert sorted(fetch.call_args[0][0]) == sorted(set(bot.COINGECKO_MAPPING.values()))
+        assert prices['BTC/USDT']['price'] == 60000.0
+        assert prices['SOL/USDT']['source'] == 'coingecko'
+
+
+# ===========================================================================
+# 15. CoinGecko — whole-mapping refresh and token-bucket limiter
+# ===========================================================================
+
+class TestCoinGeckoBatching(unittest.TestCase):
+
+    def setUp(self):
+        bot.COINGECKO_CACHE.clear()
+        bot._coingecko_backoff.update({'until': 0.0, 'delay': bot.COINGECKO_BACKOFF})
+        self.payload = {
+            coin_id: {'usd': 10.0 * (i + 1), 'usd_24h_change': 0.5, 'usd_24h_vol': 1.0}
+            for i, coin_id in enumerate(sorted(set(bot.COINGECKO_MAPPING.values())))
+        }
+
+    def tearDown(self):
+        bot.COINGECKO_CACHE.clear()
+        bot._coingecko_backoff.update({'until': 0.0, 'delay': bot.COINGECKO_BACKOFF})
+
+    def _response(self, status=200, payload=None):
+        resp = MagicMock(status_code=status)
+        resp.json.return_value = payload
+        return resp
+
+    def test_single_symbol_lookup_fills_cache_for_all_mapped_coins(self):
+        with patch.object(bot.http_client, 'get', return_value=self._response(payload=self.payload)) as get, \
+             patch.object(bot.COINGECKO_LIMITER, 'try_acquire', return_value=True):
+            assert bot.get_token_price_coingecko('SOL/USDT') is not None
+            # Every other mapped symbol is now served from the cache
+            for symbol in bot.COINGECKO_MAPPING:
+                assert bot.get_token_price_coingecko(symbol) is not None
+        assert get.call_count == 1, "All mapped coins should resolve with one request"
+
+    def test_rate_limited_response_sets_backoff_without_sleeping(self):
+        with patch.object(bot.http_client, 'get', return_value=self._response(status=429)) as get, \
+             patch.object(bot.COINGECKO_LIMITER, 'try_acquire', return_value=True), \
+             patch.object(bot.time, 'sleep') as sleep:
+            assert bot.get_token_price_coingecko('BTC/USDT') is None
+            assert bot.get_token_price_coingecko('BTC/USDT') is None
+        sleep.assert_not_called()
+        assert get.call_count == 1, "Requests during the backoff window must be skipped"
+
+    def test_overlapping_rate_limits_double_the_delay_once(self):
+        def get(*args, **kwargs):
+            if get.calls == 0:
+                get.calls += 1
+                # A second request is in flight and gets its 429 first
+                assert bot._fetch_coingecko_simple_prices(['bitcoin']) is None
+            return self._response(status=429)
+        get.calls = 0
+        with patch.object(bot.http_client, 'get', side_effect=get), \
+             patch.object(bot.COINGECKO_LIMITER, 'try_acquire', return_value=True):
+            assert bot._fetch_coingecko_simple_prices(['solana']) is None
+        assert bot._coingecko_backoff['delay'] == min(bot.COINGECKO_BACKOFF * 2, bot.COINGECKO_MAX_BACKOFF)
+
+    def test_late_success_does_not_reset_newer_backoff(self):
+        def get(*args, **kwargs):
+            if get.calls == 0:
+                get.calls += 1
+                assert bot._fetch_coingecko_simple_prices(['bitcoin']) is None  # 429 lands first
+                return self._response(payload=self.payload)
+            return self._response(status=429)
+        get.calls = 0
+        with patch.object(bot.http_client, 'get', side_effect=get), \
+             patch.object(bot.COINGECKO_LIMITER, 'try_acquire', return_value=True):
+            assert bot._fetch_coingecko_simple_prices(['solana']) == self.payload
+        assert bot._coingecko_backoff['delay'] == min(bot.COINGECKO_BACKOFF * 2, bot.COINGECKO_MAX_BACKOFF)
+
+    def test_exhausted_budget_skips_request(self):
+        with patch.object(bot.http_client, 'get') as get, \
+             patch.object(bot.COINGECKO_LIMITER, 'try_acquire', return_value=False):
+            assert bot.get_token_prices_coingecko(['ETH/USDT']) == {}
+        get.assert_not_called()
+
+    def test_token_bucket_caps_burst(self):
+        bucket = bot.TokenBucket(rate=0.0, capacity=2)
+        assert bucket.try_acquire()
+        assert bucket.try_acquire()
+        assert not bucket.try_acquire(), "Bucket must refuse once the burst is spent"
+
+    def test_token_bucket_refills_over_time(self):
+        bucket = bot.TokenBucket(rate=1000.0, capacity=1)
+        assert bucket.try_acquire()
+        time.sleep(0.01)
+        assert bucket.try_acquire(), "Bucket should refill after waiting"
+
+
+# ===========================================================================
+# 16. In-memory price store with write-behind persistence
+# ===========================================================================
+
+class TestPriceStore(unittest.TestCase):
+
+    def setUp(self):
+        import tempfile
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'price_cache.json')
+        self.file_patch = patch.object(bot, 'PRICE_CACHE_FILE', self.path)
+        self.file_patch.start()
+        self._reset_store()
+
+    def tearDown(self):
+        self.file_patch.stop()
+        self._reset_store()
+        self.tmpdir.cleanup()
+
+    def _reset_store(self):
+        with bot.PRICE_STORE_LOCK:
+            bot.PRICE_STORE.clear()
+            bot._price_store_state['loaded'] = False
+        bot._price_store_dirty.clear()
+
+    def test_reads_do_not_touch_disk_after_warm_load(self):
+        bot.save_price_cache({'SOL/USDT_binance': {'price': 1.0}})
+        with patch('builtins.open', side_effect=AssertionError("disk read")):
+            assert bot.load_price_cache()['SOL/USDT_binance']['price'] == 1.0
+            assert bot.load_price_cache()['SOL/USDT_binance']['price'] == 1.0
+
+    def test_warm_restart_loads_from_disk_once(self):
+        with open(self.path, 'w') as f:
+            bot.json.dump({'BTC/USDT_binance': {'price': 2.0}}, f)
+        assert bot.load_price_cache() == {'BTC/USDT_binance': {'price': 2.0}}
+        os.remove(self.path)
+        assert bot.load_price_cache() == {'BTC/USDT_binance': {'price': 2.0}}
+
+    def test_flush_writes_atomically(self):
+        bot.save_price_cache({'ETH/USDT_binance': {'price': 3.0}})
+        with patch.object(bot.os, 'replace', wraps=os.replace) as replace:
+            bot.flush_price_store()
+        replace.assert_called_once_with(f"{self.path}.tmp", self.path)
+        with open(self.path) as f:
+            assert bot.json.load(f) == {'ETH/USDT_binance': {'price': 3.0}}
+        assert not os.path.exists(f"{self.path}.tmp")
+
+    def test_concurrent_flushes_do_not_share_temp_file(self):
+        import threading
+        writing = threading.Event()
+        release = threading.Event()
+        real_write = bot._atomic_write_json
+        calls = []
+
+        def slow_write(path, data):
+            calls.append(data)
+            writing.set()
+            release.wait(5)
+            real_write(path, data)
+
+        bot.save_price_cache({'SOL/USDT_binance': {'price': 1.0}})
+        with patch.object(bot, '_atomic_write_json', side_effect=slow_write):
+            writer = threading.Thread(target=bot.flush_price_store)
+            writer.start()
+            assert writing.wait(5)
+            bot.update_price_entry('SOL/USDT_binance', {'price': 2.0})
+            exiting = threading.Thread(target=bot.flush_price_store)  # the atexit hook
+            exiting.start()
+            exiting.join(0.1)
+            assert len(calls) == 1, "second flush must wait for the first to finish"
+            release.set()
+            writer.join(5)
+            exiting.join(5)
+        assert len(calls) == 2
+        with open(self.path) as f:
+            assert bot.json.load(f) == {'SOL/USDT_binance': {'price': 2.0}}
+
+    def test_snapshot_is_isolated_from_store(self):
+        bot.save_price_cache({'SOL/USDT_binance': {'price': 1.0}})
+        snapshot = bot.load_price_cache()
+        snapshot['new_key'] = {'price': 9.0}
+        assert 'new_key' not in bot.load_price_cache()
+
+    def _check_with_stream(self, fresh_prices):
+        stream = MagicMock()
+        stream.fresh_prices.side_effect = fresh_prices
+        rest = {'BTC/USDT': {'price': 60000.0, 'change_24h': 0.5}, 'ETH/USDT': {'price': 3000.0, 'change_24h': 0.1}}
+        with patch.object(bot, '_price_stream', stream), \
+             patch.object(bot, 'get_token_prices', return_value=rest), \
+             patch.object(bot, 'reserve_price_alert_cooldown', return_value=1.0), \
+             patch.object(bot, '_post_reserved_price_alert') as post:
+            bot.check_price_alerts()
+        return post
+
+    def test_streamed_symbols_alert_against_history_baseline(self):
+        _reset_price_history()
+        self.addCleanup(_reset_price_history)
+        bot.record_price_samples({'SOL/USDT': 100.0}, now=time.time() - 300)
+        sol = {'price': 107.0, 'change_24h': 7.0}
+        bot.update_price_entry('SOL/USDT_binance', sol)  # the stream stored it already
+        post = self._check_with_stream(lambda: {'SOL/USDT': dict(sol)})
+        post.assert_called_once()
+        assert post.call_args[0][0] == 'SOL/USDT'
+        assert abs(post.call_args[0][2] - 7.0) < 1e-6
+
+    def test_check_keeps_newer_streamed_prices(self):
+        _reset_price_history()
+        self.addCleanup(_reset_price_history)
+
+        def fresh_prices():
+            snapshot = {'SOL/USDT': {'price': 107.0, 'change_24h': 7.0}}
+            bot.update_price_entry('SOL/USDT_binance', {'price': 108.0, 'change_24h': 8.0})  # tick mid-check
+            return snapshot
+
+        self._check_with_stream(fresh_prices)
+        store = bot.load_price_cache()
+        assert store['SOL/USDT_binance']['price'] == 108.0
+        assert store['BTC/USDT_binance']['price'] == 60000.0
+
+
+# ===========================================================================
+# 17. Rolling price history and windowed alert metrics
+# ===========================================================================
+
+def _reset_price_history():
+    with bot.PRICE_HISTORY_LOCK:
+        bot._price_history['rows'].clear()
+        bot._price_history['ts'] = bot.np.full((0, bot.PRICE_HISTORY_SIZE), bot.np.nan)
+        bot._price_history['price'] = bot.np.full((0, bot.PRICE_HISTORY_SIZE), bot.np.nan)
+        bot._price_history['head'] = bot.np.zeros(0, dtype=bot.np.int64)
+    bot._price_metrics_snapshot = {}
+
+
+class TestPriceHistory(unittest.TestCase):
+
+    CONFIG = {'alert_threshold_up': 3.0, 'alert_threshold_down': 3.0}
+
+    def setUp(self):
+        _reset_price_history()
+
+    def tearDown(self):
+        _reset_price_history()
+
+    def _record_series(self, symbol, prices, start=1_000_000.0, step=300.0):
+        for i, price in enumerate(prices):
+            bot.record_price_samples({symbol: price}, now=start + i * step)
+        return start + (len(prices) - 1) * step
+
+    def test_ring_buffer_keeps_fixed_size(self):
+        self._record_series('BTC/USDT', range(1, bot.PRICE_HISTORY_SIZE + 11))
+        history = bot.get_price_history('BTC/USDT')
+        assert len(history['prices']) == bot.PRICE_HISTORY_SIZE
+        assert history['prices'][0] == 11, "Oldest samples should be overwritten"
+        assert history['timestamps'] == sorted(history['timestamps'])
+
+    def test_windowed_change_covers_multi_tick_drift(self):
+        # 13 samples of +0.5% each: no single tick crosses 3%, the hour does
+        prices = [100.0 * (1.005 ** i) for i in range(13)]
+        self._record_series('SOL/USDT', prices)
+        metrics = bot.get_price_metrics()['SOL/USDT']
+        assert metrics['change_pct']['1h'] > 6.0
+        assert bot.evaluate_price_alert(self.CONFIG, 0.5, metrics) == metrics['change_pct']['1h']
+
+    def test_flat_market_does_not_alert(self):
+        self._record_series('ETH/USDT', [100.0] * 20)
+        metrics = bot.get_price_metrics()['ETH/USDT']
+        assert metrics['volatility_pct'] == 0.0
+        assert bot.evaluate_price_alert(self.CONFIG, 0.0, metrics) is None
+
+    def test_metrics_vectorized_across_symbols(self):
+        bot.record_price_samples({'A': 100.0, 'B': 50.0}, now=1000.0)
+        bot.record_price_samples({'A': 110.0, 'B': 45.0}, now=1300.0)
+        metrics = bot.get_price_metrics()
+        assert abs(metrics['A']['change_pct']['1h'] - 10.0) < 1e-6
+        assert abs(metrics['B']['change_pct']['1h'] + 10.0) < 1e-6
+
+    def test_api_prices_serves_metrics_and_history(self):
+        self._record_series('SOL/USDT', [100.0, 101.0])
+        client = bot.app.test_client()
+        with patch.object(bot, 'load_price_cache', return_value={}):
+            response = client.get('/api/prices?history=1', headers=_admin_auth_headers())
+        body = response.get_json()
+        assert response.status_code == 200
+        assert body['metrics']['SOL/USDT']['samples'] == 2
+        assert body['history']['SOL/USDT']['prices'] == [100.0, 101.0]
+
+
+# ===========================================================================
+# 18. Streaming price feed — replayed over a local websocket server
+# ===========================================================================
+
+def _binance_ticker(market_id, last, change=1.0):
+    return bot.json.dumps({
+        'stream': f"{market_id.lower()}@ticker",
+        'data': {'e': '24hrTicker', 's': market_id, 'c': str(last), 'h': str(last),
+                 'l': str(last), 'q': '1000', 'P': str(change)},
+    })
+
+
+@unittest.skipUnless(bot.price_stream.WEBSOCKETS_AVAILABLE, "websockets not installed")
+class TestPriceStream(unittest.TestCase):
+
+    def setUp(self):
+        _reset_price_history()
+        self.received = []
+        self.got_all = bot.threading.Event()
+
+    def tearDown(self):
+        _reset_price_history()
+
+    def _on_price(self, symbol, data):
+        self.received.append((symbol, data['price']))
+        if len(self.received) >= 2:
+            self.got_all.set()
+
+    def test_replayed_tickers_reach_callback(self):
+        messages = [
+            _binance_ticker('SOLUSDT', 150.5),
+            bot.json.dumps({'result': None, 'id': 1}),  # non-ticker frames are ignored
+            _binance_ticker('BTCUSDT', 60000.0),
+        ]
+        server = bot.price_stream.ReplayServer(messages).start()
+        stream = bot.price_stream.PriceStream(['SOL/USDT', 'BTC/USDT'], self._on_price, base_url=server.url)
+        try:
+            stream.start()
+            assert self.got_all.wait(5), "Replayed tickers should arrive"
+            assert self.received == [('SOL/USDT', 150.5), ('BTC/USDT', 60000.0)]
+            assert set(stream.fresh_prices()) == {'SOL/USDT', 'BTC/USDT'}
+            assert stream.status()['connected']
+        finally:
+            stream.stop()
+            server.stop()
+
+    def test_stale_symbols_fall_back_to_rest(self):
+        stream = MagicMock()
+        stream.fresh_prices.return_value = {'SOL/USDT': {'price': 150.0}}
+        rest = {'BTC/USDT': {'price': 1.0}, 'ETH/USDT': {'price': 2.0}}
+        with patch.object(bot, '_price_stream', stream), \
+             patch.object(bot, 'get_token_prices', return_value=rest) as get_prices:
+            prices = bot.get_current_prices()
+        assert set(get_prices.call_args[0][0]) == {'BTC/USDT', 'ETH/USDT'}
+        assert set(prices) == {'SOL/USDT', 'BTC/USDT', 'ETH/USDT'}
+
+    def test_stream_price_triggers_alert_on_arrival(self):
+        _reset_price_cooldowns()
+        bot.record_price_samples({'SOL/USDT': 100.0}, now=time.time())
+        threads = []
+
+        def post(symbol, price_data, price_change):
+            threads.append(bot.threading.current_thread().name)
+            return True
+
+        with patch.object(bot, 'update_price_entry'), \
+             patch.object(bot, 'post_price_alert', side_effect=post) as post_alert:
+            bot.handle_stream_price('SOL/USDT', {'price': 107.0, 'change_24h': 7.0})
+            bot.handle_stream_price('SOL/USDT', {'price': 107.5, 'change_24h': 7.5})
+            bot.PRICE_ALERT_EXECUTOR.submit(lambda: None).result(timeout=5)
+        post_alert.assert_called_once()
+        assert abs(post_alert.call_args[0][2] - 7.0) < 1e-6
+        assert threads[0].startswith('price-alert'), "Alert must not be posted on the stream thread"
+        _reset_price_cooldowns()
+
+    def test_failed_stream_alert_releases_cooldown(self):
+        _reset_price_cooldowns()
+        bot.record_price_samples({'SOL/USDT': 100.0}, now=time.time())
+        with patch.object(bot, 'update_price_entry'), \
+             patch.object(bot, 'post_price_alert', return_value=False):
+            bot.handle_stream_price('SOL/USDT', {'price': 107.0, 'change_24h': 7.0})
+            bot.PRICE_ALERT_EXECUTOR.submit(lambda: None).result(timeout=5)
+        assert not bot.is_price_alert_on_cooldown('SOL/USDT')
+
+
+# ===========================================================================
+# 19. LLM response cache — LRU + TTL with hit-rate metrics
+# ===========================================================================
+
+def _reset_llm_cache_stats():
+    with bot.LLM_CACHE_LOCK:
+        for key in bot.LLM_CACHE_STATS:
+            bot.LLM_CACHE_STATS[key] = 0
+
+
+class TestLlmCache(unittest.TestCase):
+
+    def setUp(self):
+        _reset_llm_cache()
+        _reset_llm_cache_stats()
+
+    def tearDown(self):
+        _reset_llm_cache()
+        _reset_llm_cache_stats()
+
+    def test_evicts_least_recently_used(self):
+        with patch.object(bot, 'LLM_CACHE_MAX_SIZE', 2):
+            bot.cache_response('a', 'response a')
+            bot.cache_response('b', 'response b')
+            assert bot.get_cached_response('a') == 'response a'  # 'a' becomes most recent
+            bot.cache_response('c', 'response c')
+        assert bot.get_cached_response('b') is None, "'b' was least recently used"
+        assert bot.get_cached_response('a') == 'response a'
+        assert bot.get_llm_cache_stats()['evictions'] == 1
+
+    def test_expired_entry_is_a_miss(self):
+        bot.cache_response('k', 'stale')
+        with bot.LLM_CACHE_LOCK:
+            bot.LLM_CACHE['k']['timestamp'] -= bot.LLM_CACHE_TTL + 1
+        assert bot.get_cached_response('k') is None
+        stats = bot.get_llm_cache_stats()
+        assert stats['expirations'] == 1 and stats['size'] == 0
+
+    def test_hits_accumulate_saved_tokens(self):
+        bot.cache_response('k', 'cached text', tokens=150)
+        bot.get_cached_response('k')
+        bot.get_cached_response('k')
+        bot.get_cached_response('missing')
+        stats = bot.get_llm_cache_stats()
+        assert stats['hits'] == 2 and stats['misses'] == 1
+        assert stats['saved_tokens'] == 300
+        assert abs(stats['hit_rate'] - 2 / 3) < 1e-3
+
+    def test_concurrent_inserts_stay_bounded(self):
+        def worker(n):
+            for i in range(200):
+                bot.cache_response(f"{n}-{i}", "x")
+        threads = [bot.threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(bot.LLM_CACHE) == bot.LLM_CACHE_MAX_SIZE
+
+    def test_admin_endpoint_requires_auth_and_reports_stats(self):
+        client = bot.app.test_client()
+        assert client.get('/api/llm/cache').status_code == 401
+        response = client.get('/api/llm/cache', headers=_admin_auth_headers())
+        assert response.status_code == 200
+        assert {'hits', 'misses', 'evictions', 'saved_tokens', 'hit_rate'} <= set(response.get_json())
+
+
+# ===========================================================================
+# 20. LLM cache — optional SQLite second tier
+# ===========================================================================
+
+class TestLlmDiskCache(unittest.TestCase):
+
+    def setUp(self):
+        import tempfile
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.store = bot.state_store.SQLiteStore(
+            os.path.join(self.tmpdir.name, 'llm_cache.db'), bot.LLM_DISK_CACHE.schema)
+        self.patches = [
+            patch.object(bot, 'LLM_DISK_CACHE', self.store),
+            patch.object(bot, 'LLM_CACHE_PERSIST', True),
+        ]
+        for p in self.patches:
+            p.start()
+        _reset_llm_cache()
+        _reset_llm_cache_stats()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        self.store.close()
+        self.tmpdir.cleanup()
+        _reset_llm_cache()
+        _reset_llm_cache_stats()
+
+    def test_survives_memory_loss_and_promotes_hit(self):
+        bot.cache_response('k', 'persisted', tokens=40)
+        assert self.store.flush()
+        _reset_llm_cache()  # simulate a restart
+        assert bot.get_cached_response('k') == 'persisted'
+        assert 'k' in bot.LLM_CACHE, "disk hit should be promoted into memory"
+        assert bot.get_cached_response('k') == 'persisted'
+        stats = bot.get_llm_cache_stats()
+        assert stats['disk_hits'] == 1 and stats['hits'] == 1 and stats['misses'] == 0
+        assert stats['saved_tokens'] == 80 and stats['hit_rate'] == 1.0
+
+    def test_expired_disk_rows_miss_and_are_compacted(self):
+        now = time.time()
+        self.store.execute(
+            "INSERT INTO llm_cache (cache_key, response, tokens, created_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+            ('old', 'stale', 10, now - 7200, now - 3600))
+        assert bot.get_cached_response('old') is None
+        assert bot.get_llm_cache_stats()['misses'] == 1
+        bot.compact_llm_disk_cache()
+        assert self.store.flush()
+        assert self.store.query("SELECT COUNT(*) FROM llm_cache")[0][0] == 0
+
+    def test_disabled_persistence_never_touches_disk(self):
+        with patch.object(bot, 'LLM_CACHE_PERSIST', False):
+            bot.cache_response('k', 'memory only')
+            _reset_llm_cache()
+            assert bot.get_cached_response('k') is None
+        assert self.store.pending_writes() == 0
+        assert self.store._conn is None, "store should stay unopened"
+
+    def test_failing_statement_does_not_drop_rest_of_batch(self):
+        # Queue before the writer starts so all three land in one batch
+        self.store._queue.put(("INSERT INTO llm_cache (cache_key, response, tokens, created_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+                               ('a', 'first', 1, 0, 1)))
+        self.store._queue.put(("INSERT INTO missing_table (x) VALUES (?)", (1,)))
+        self.store._queue.put(("INSERT INTO llm_cache (cache_key, response, tokens, created_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+                               ('b', 'second', 1, 0, 1)))
+        with self.assertLogs(level='ERROR') as logs:
+            self.store._ensure_writer()
+            assert self.store.flush()
+        assert any('missing_table' in line for line in logs.output), logs.output
+        rows = self.store.query("SELECT cache_key FROM llm_cache ORDER BY cache_key")
+        assert [r[0] for r in rows] == ['a', 'b']
+
+
+# ===========================================================================
+# 21. Shared OpenAI-compatible clients — one per base URL and key
+# ===========================================================================
+
+def _fake_openai_module(setup_delay=0.0):
+    """Stand-in for the openai package whose client construction costs *setup_delay* seconds."""
+    created = []
+
+    class FakeClient:
+        def __init__(self, api_key=None, base_url=None):
+            time.sleep(setup_delay)  # connection pool + TLS setup
+            self.api_key, self.base_url = api_key, base_url
+            self.chat = MagicMock()
+            self.chat.completions.create.return_value = MagicMock(
+                choices=[MagicMock(message=MagicMock(content=" Vault 77 reporting. "))])
+            created.append(self)
+
+    return types.SimpleNamespace(OpenAI=FakeClient), created
+
+
+class TestLlmClientReuse(unittest.TestCase):
+
+    def setUp(self):
+        with bot._LLM_CLIENTS_LOCK:
+            bot._LLM_CLIENTS.clear()
+
+    def tearDown(self):
+        with bot._LLM_CLIENTS_LOCK:
+            bot._LLM_CLIENTS.clear()
+
+    def test_providers_reuse_one_client_per_base_url(self):
+        fake, created = _fake_openai_module()
+        messages = [{"role": "user", "content": "status"}]
+        with patch.dict(sys.modules, {'openai': fake}), \
+             patch.object(bot, 'XAI_API', 'xai-key'), \
+             patch.object(bot, 'OPENAI_API_KEY', 'openai-key'):
+            for _ in range(3):
+                assert bot._generate_xai_response(messages) == "Vault 77 reporting."
+                assert bot._generate_openai_response(messages) == "Vault 77 reporting."
+        assert len(created) == 2
+        assert {c.base_url for c in created} == {bot.XAI_BASE_URL, bot.OPENAI_BASE_URL}
+        assert created[0].chat.completions.create.call_count == 3
+
+    def test_new_key_gets_its_own_client(self):
+        fake, created = _fake_openai_module()
+        with patch.dict(sys.modules, {'openai': fake}):
+            a = bot.get_llm_client(bot.XAI_BASE_URL, 'key-1')
+            b = bot.get_llm_client(bot.XAI_BASE_URL, 'key-2')
+            assert a is not b and bot.get_llm_client(bot.XAI_BASE_URL, 'key-1') is a
+
+    def test_reused_client_is_faster_than_per_call_construction(self):
+        setup_delay, calls = 0.02, 10
+        fake, created = _fake_openai_module(setup_delay)
+        messages = [{"role": "user", "content": "status"}]
+        with patch.dict(sys.modules, {'openai': fake}), patch.object(bot, 'XAI_API', 'xai-key'):
+            start = time.perf_counter()
+            for _ in range(calls):
+                fake.OpenAI(api_key='xai-key', base_url=bot.XAI_BASE_URL).chat.completions.create()
+            per_call = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for _ in range(calls):
+                bot._generate_xai_response(messages)
+            reused = time.perf_counter() - start
+        assert per_call >= calls * setup_delay
+        assert reused < per_call / 3, f"reused={reused:.3f}s per_call={per_call:.3f}s"
+
+
+# ===========================================================================
+# 22. Shared HTTP client — pooled per-host sessions, retries, host stats
+# ===========================================================================
+
+class _LocalHttpHandler(__import__('http.server').server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive
+    statuses = []        # status codes to return in order, then 200
+    client_ports = []    # peer port of every request, to detect connection reuse
+
+    def do_GET(self):
+        type(self).client_ports.append(self.client_address[1])
+        status = type(self).statuses.pop(0) if type(self).statuses else 200
+        body = b'{"ok": true}'
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHttpClient(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        from http.server import ThreadingHTTPServer
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _LocalHttpHandler)
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        cls.thread = bot.threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        _LocalHttpHandler.statuses = []
+        _LocalHttpHandler.client_ports = []
+        self.backoff = patch.object(bot.http_client, 'HTTP_BACKOFF_FACTOR', 0.0)
+        self.jitter = patch.object(bot.http_client, 'HTTP_BACKOFF_JITTER', 0.0)
+        self.backoff.start()
+        self.jitter.start()
+        bot.http_client.close_sessions()
+        with bot.http_client.HOST_STATS_LOCK:
+            bot.http_client.HOST_STATS.clear()
+
+    def tearDown(self):
+        self.backoff.stop()
+        self.jitter.stop()
+        bot.http_client.close_sessions()
+
+    def test_requests_to_one_host_reuse_a_connection(self):
+        for _ in range(5):
+            assert bot.http_client.get(f"{self.url}/health", timeout=5).status_code == 200
+        assert len(_LocalHttpHandler.client_ports) == 5
+        assert len(set(_LocalHttpHandler.client_ports)) == 1, "keep-alive should reuse one TCP connection"
+        assert bot.http_client.get_session(self.url) is bot.http_client.get_session(f"{self.url}/other")
+
+    def test_retries_server_errors_but_not_rate_limits(self):
+        _LocalHttpHandler.statuses = [503, 502]
+        assert bot.http_client.get(f"{self.url}/flaky", timeout=5).status_code == 200
+        assert len(_LocalHttpHandler.client_ports) == 3
+
+        _LocalHttpHandler.client_ports = []
+        _LocalHttpHandler.statuses = [429]
+        assert bot.http_client.get(f"{self.url}/limited", timeout=5).status_code == 429
+        assert len(_LocalHttpHandler.client_ports) == 1, "429 is left to the caller's own backoff"
+
+    def test_configure_host_disables_retries(self):
+        bot.http_client.configure_host(self.url, max_retries=0)
+        try:
+            _LocalHttpHandler.statuses = [503]
+            assert bot.http_client.get(f"{self.url}/flaky", timeout=5).status_code == 503
+            assert len(_LocalHttpHandler.client_ports) == 1
+        finally:
+            bot.http_client._HOST_RETRIES.pop(self.url, None)
+
+    def test_host_stats_count_requests_and_errors(self):
+        _LocalHttpHandler.statuses = [500] * (bot.http_client.HTTP_MAX_RETRIES + 1)
+        bot.http_client.get(f"{self.url}/broken", timeout=5)
+        bot.http_client.get(f"{self.url}/ok", timeout=5)
+        with self.assertRaises(bot.requests.exceptions.ConnectionError):
+            bot.http_client.get("http://127.0.0.1:1/unreachable", timeout=1)
+        stats = bot.http_client.get_host_stats()
+        assert stats[self.url]['requests'] == 2 and stats[self.url]['errors'] == 1
+        assert stats['http://127.0.0.1:1']['errors'] == 1
+        assert stats[self.url]['avg_ms'] >= 0
+
+    def test_metrics_endpoint_reports_http_hosts(self):
+        bot.http_client.get(f"{self.url}/health", timeout=5)
+        response = bot.app.test_client().get('/api/metrics', headers=_admin_auth_headers())
+        assert self.url in response.get_json()['http_hosts']
+
+
+# ===========================================================================
+# 23. Hedged LLM generation — race providers, per-provider latency histograms
+# ===========================================================================
+
+def _slow_provider(text, delay):
+    def provider(messages, max_tokens=120):
+        time.sleep(delay)
+        return text
+    return provider
+
+
+class TestLlmHedging(unittest.TestCase):
+
+    GOOD = "Vault 77 diagnostics remain nominal. The market hums like a dying reactor."
+
+    def setUp(self):
+        _reset_llm_cache()
+        _reset_llm_breakers()
+        with bot.LLM_PROVIDER_LATENCY_LOCK:
+            bot.LLM_PROVIDER_LATENCY.clear()
+        self.patches = [
+            patch.object(bot, 'LLM_HEDGE_MODE', True),
+            patch.object(bot, 'LLM_HEDGE_DELAY', 0.05),
+            patch.object(bot, 'XAI_API', 'xai-key'),
+            patch.object(bot, 'OPENAI_API_KEY', 'openai-key'),
+            patch.object(bot, 'HUGGING_FACE_TOKEN', None),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        _reset_llm_cache()
+
+    def test_slow_primary_is_hedged_by_secondary(self):
+        with patch.object(bot, '_generate_xai_response', _slow_provider(self.GOOD + " xai", 1.0)), \
+             patch.object(bot, '_generate_openai_response', _slow_provider(self.GOOD, 0.01)):
+            start = time.perf_counter()
+            result = bot.generate_llm_response("status update", max_tokens=40)
+            elapsed = time.perf_counter() - start
+        assert result == self.GOOD
+        assert elapsed < 0.5, f"hedged call should not wait for the slow primary ({elapsed:.2f}s)"
+
+    def test_fast_primary_never_starts_secondaries(self):
+        openai_mock = MagicMock(return_value=self.GOOD)
+        with patch.object(bot, '_generate_xai_response', _slow_provider(self.GOOD, 0.0)), \
+             patch.object(bot, '_generate_openai_response', openai_mock):
+            assert bot.generate_llm_response("status update", max_tokens=40) == self.GOOD
+        openai_mock.assert_not_called()
+
+    def test_unusable_primary_hedges_immediately(self):
+        with patch.object(bot, 'LLM_HEDGE_DELAY', 5.0), \
+             patch.object(bot, '_generate_xai_response', return_value="low"), \
+             patch.object(bot, '_generate_openai_response', return_value=self.GOOD):
+            start = time.perf_counter()
+            assert bot.generate_llm_response("status update", max_tokens=40) == self.GOOD
+        assert time.perf_counter() - start < 1.0
+
+    def test_latency_histograms_are_recorded(self):
+        with patch.object(bot, 'LLM_HEDGE_MODE', False), \
+             patch.object(bot, '_generate_xai_response', return_value=None), \
+             patch.object(bot, '_generate_openai_response', return_value=self.GOOD):
+            bot.generate_llm_response("status update", max_tokens=40)
+        stats = bot.get_llm_latency_stats()
+        assert stats['xAI-Grok']['calls'] == 1 and stats['xAI-Grok']['errors'] == 1
+        assert stats['OpenAI']['calls'] == 1 and stats['OpenAI']['errors'] == 0
+        assert sum(stats['OpenAI']['histogram'].values()) == 1
+        assert stats['OpenAI']['histogram']['le_250ms'] == 1
+
+
+# ===========================================================================
+# 24. Shared LLM executor — early return, per-provider limits, queue metrics
+# ===========================================================================
+
+class TestLlmExecutor(unittest.TestCase):
+
+    GOOD = "Vault 77 diagnostics remain nominal. The market hums like a dying reactor."
+
+    def setUp(self):
+        _reset_llm_cache()
+        _reset_llm_breakers()
+
+    def tearDown(self):
+        _reset_llm_cache()
+
+    def test_fallback_returns_without_waiting_for_slow_provider(self):
+        assert bot._score_response(self.GOOD, 40) == bot._MAX_RESPONSE_SCORE
+        with patch.object(bot, 'XAI_API', None), \
+             patch.object(bot, 'OPENAI_API_KEY', 'openai-key'), \
+             patch.object(bot, 'HUGGING_FACE_TOKEN', 'hf-token'), \
+             patch.object(bot, '_generate_openai_response', _slow_provider(self.GOOD, 0.0)), \
+             patch.object(bot, '_generate_hf_chat_response', _slow_provider(self.GOOD + " hf", 1.0)):
+            early_before = bot.get_llm_executor_stats()['early_returns']
+            start = time.perf_counter()
+            result = bot.generate_llm_response("status update", max_tokens=40)
+            elapsed = time.perf_counter() - start
+        assert result == self.GOOD
+        assert elapsed < 0.5, f"should not wait on the slow provider ({elapsed:.2f}s)"
+        assert bot.get_llm_executor_stats()['early_returns'] == early_before + 1
+
+    def test_saturated_provider_is_skipped_without_taking_a_thread(self):
+        release = bot.threading.Event()
+        started = []
+
+        def blocking(messages, max_tokens=120):
+            started.append(1)
+            release.wait(5)
+            return self.GOOD
+
+        with patch.object(bot, 'LLM_PROVIDER_CONCURRENCY', 1):
+            bot._LLM_PROVIDER_SEMAPHORES.pop('Blocking', None)
+            saturated_before = bot.get_llm_executor_stats()['saturated']
+            first = bot.submit_provider_call('Blocking', blocking, [], 40)
+            assert first is not None
+            assert bot.submit_provider_call('Blocking', blocking, [], 40) is None, \
+                "no free permit: the caller moves on instead of queueing"
+            other = bot.submit_provider_call('Other', lambda m, t: self.GOOD, [], 40)
+            assert other.result(2) == self.GOOD, "other providers are not held up"
+            stats = bot.get_llm_executor_stats()
+            assert stats['saturated'] == saturated_before + 1
+            release.set()
+            assert first.result(5) == self.GOOD
+        assert bot.submit_provider_call('Blocking', blocking, [], 40).result(5) == self.GOOD, \
+            "permit is released after the call"
+        bot._LLM_PROVIDER_SEMAPHORES.pop('Blocking', None)
+        bot._LLM_PROVIDER_SEMAPHORES.pop('Other', None)
+        stats = bot.get_llm_executor_stats()
+        assert stats['in_flight']['Blocking'] == 0 and stats['queued'] == 0
+
+    def test_abandoned_call_skips_provider_and_frees_permit(self):
+        import threading
+        gate = threading.Event()
+        provider = MagicMock(return_value=self.GOOD)
+        with patch.object(bot, 'LLM_EXECUTOR', concurrent.futures.ThreadPoolExecutor(max_workers=1)) as pool, \
+             patch.object(bot, 'LLM_PROVIDER_CONCURRENCY', 1):
+            bot._LLM_PROVIDER_SEMAPHORES.pop('Loser', None)
+            pool.submit(gate.wait, 5)  # occupy the only worker
+            queued = bot.submit_provider_call('Loser', provider, [], 40)
+            bot._cancel_provider_calls([queued])
+            assert queued.cancelled()
+            assert bot._provider_semaphore('Loser').acquire(blocking=False), "cancel releases the permit"
+            bot._provider_semaphore('Loser').release()
+
+            # Already picked up by a worker, but abandoned before the provider call
+            future = bot.submit_provider_call('Loser', provider, [], 40)
+            future.abandoned.set()
+            gate.set()
+            assert future.result(5) is None
+            pool.shutdown(wait=True)
+        provider.assert_not_called()
+        bot._LLM_PROVIDER_SEMAPHORES.pop('Loser', None)
+
+    def test_metrics_endpoint_reports_executor(self):
+        response = bot.app.test_client().get('/api/metrics', headers=_admin_auth_headers())
+        executor = response.get_json()['llm_executor']
+        assert {'queued', 'in_flight', 'workers', 'per_provider_limit'} <= set(executor)
+
+
+# ===========================================================================
+# 25. LLM circuit breakers — skip failing providers, route by health and cost
+# ===========================================================================
+
+class TestLlmCircuitBreaker(unittest.TestCase):
+
+    GOOD = "Vault 77 diagnostics remain nominal. The market hums like a dying reactor."
+
+    def setUp(self):
+        _reset_llm_cache()
+        _reset_llm_breakers()
+        self.patches = [
+            patch.object(bot, 'LLM_HEDGE_MODE', False),
+            patch.object(bot, 'XAI_API', 'xai-key'),
+            patch.object(bot, 'OPENAI_API_KEY', 'openai-key'),
+            patch.object(bot, 'HUGGING_FACE_TOKEN', 'hf-token'),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        _reset_llm_cache()
+        _reset_llm_breakers()
+
+    def _breaker(self, **overrides):
+        params = dict(window=10, min_calls=4, failure_rate=0.5, cooldown=60, slow_ms=1000)
+        params.update(overrides)
+        return bot.CircuitBreaker(**params)
+
+    def test_opens_after_failure_rate_and_recovers_through_half_open(self):
+        breaker = self._breaker(cooldown=0.05)
+        for ok in (True, False, True, False):
+            breaker.record(ok, 10)
+        assert breaker.health() == 'open'
+        time.sleep(0.06)
+        assert breaker.health() == 'degraded' and breaker.snapshot()['state'] == 'half_open'
+        breaker.record(False, 10)
+        assert breaker.health() == 'open', "failed trial call reopens the breaker"
+        time.sleep(0.06)
+        breaker.record(True, 10)
+        assert breaker.health() == 'healthy' and breaker.snapshot()['trips'] == 2
+
+    def test_slow_p95_marks_provider_degraded(self):
+        breaker = self._breaker()
+        for elapsed in (100, 100, 100, 5000):
+            breaker.record(True, elapsed)
+        assert breaker.health() == 'degraded'
+        assert breaker.snapshot()['p95_ms'] == 5000
+
+    def test_open_primary_is_skipped_without_waiting(self):
+        xai = MagicMock(return_value=None)
+        for _ in range(bot.LLM_BREAKER_MIN_CALLS):
+            bot.get_llm_breaker('xAI-Grok').record(False, 30000)
+        with patch.object(bot, '_generate_xai_response', xai), \
+             patch.object(bot, '_generate_openai_response', return_value=self.GOOD), \
+             patch.object(bot, '_generate_hf_chat_response', return_value=None):
+            assert bot.generate_llm_response("status update", max_tokens=40) == self.GOOD
+        xai.assert_not_called()
+
+    def test_routing_prefers_healthy_then_cheaper_providers(self):
+        assert [n for n, _ in bot._llm_providers()] == ['xAI-Grok', 'HuggingFace', 'OpenAI']
+        for _ in range(bot.LLM_BREAKER_MIN_CALLS):
+            bot.get_llm_breaker('xAI-Grok').record(True, bot.LLM_BREAKER_SLOW_MS * 2)
+        assert [n for n, _ in bot._llm_providers()] == ['HuggingFace', 'OpenAI', 'xAI-Grok']
+
+    def test_tripped_primary_gets_trial_call_and_closes(self):
+        xai = MagicMock(return_value=None)
+        with patch.object(bot, 'LLM_BREAKER_COOLDOWN', 0.05), \
+             patch.object(bot, '_generate_xai_response', xai), \
+             patch.object(bot, '_generate_openai_response', return_value=self.GOOD), \
+             patch.object(bot, '_generate_hf_chat_response', return_value=None):
+            for _ in range(bot.LLM_BREAKER_MIN_CALLS):
+                bot.get_llm_breaker('xAI-Grok').record(False, 100)
+            assert bot.get_llm_breaker('xAI-Grok').health() == 'open'
+            time.sleep(0.06)
+            xai.return_value = self.GOOD + " Primary restored."
+            assert bot.generate_llm_response("status one", max_tokens=40) == xai.return_value
+            xai.assert_called_once()
+            assert bot.get_llm_breaker('xAI-Grok').snapshot()['state'] == 'closed'
+            bot.generate_llm_response("status two", max_tokens=40)
+            assert xai.call_count == 2, "Closed primary is routed first again"
+
+    def test_candidates_only_claim_trials_for_providers_they_call(self):
+        with patch.object(bot, 'LLM_BREAKER_COOLDOWN', 0.05), \
+             patch.object(bot, '_generate_xai_candidates', return_value=[self.GOOD]):
+            for name in ('HuggingFace', 'OpenAI'):
+                for _ in range(bot.LLM_BREAKER_MIN_CALLS):
+                    bot.get_llm_breaker(name).record(False, 100)
+            time.sleep(0.06)
+            with patch.object(bot, '_generate_openai_candidates', return_value=[self.GOOD]) as openai:
+                assert bot.generate_llm_candidates("status", n=3) == [self.GOOD]
+            openai.assert_called_once()
+            assert bot.get_llm_breaker('OpenAI').snapshot()['state'] == 'closed'
+            assert bot.get_llm_breaker('HuggingFace').health() == 'degraded', \
+                "the n= path never calls HuggingFace, so it must not hold its trial"
+
+    def test_unused_trial_is_released(self):
+        breaker = self._breaker(cooldown=0.05)
+        for _ in range(4):
+            breaker.record(False, 10)
+        time.sleep(0.06)
+        assert breaker.allow_trial()
+        breaker.release_trial()
+        assert breaker.health() == 'degraded' and breaker.allow_trial()
+
+    def test_half_open_admits_a_single_trial(self):
+        import threading
+        breaker = self._breaker(cooldown=0.05)
+        for _ in range(4):
+            breaker.record(False, 10)
+        time.sleep(0.06)
+        assert breaker.allow_trial()
+        assert breaker.health() == 'trial'
+        other = []
+        t = threading.Thread(target=lambda: other.append((breaker.allow_trial(), breaker.health())))
+        t.start()
+        t.join()
+        assert other == [(False, 'open')], "Other callers skip the provider while the trial runs"
+        breaker.record(True, 10)
+        assert breaker.health() == 'healthy'
+
+    def test_slow_latency_samples_age_out(self):
+        breaker = self._breaker(sample_ttl=0.05)
+        for _ in range(4):
+            breaker.record(True, 5000)
+        assert breaker.health() == 'degraded'
+        time.sleep(0.06)
+        assert breaker.health() == 'healthy'
+
+    def test_metrics_endpoint_reports_breakers(self):
+        bot.get_llm_breaker('OpenAI').record(True, 120)
+        response = bot.app.test_client().get('/api/metrics', headers=_admin_auth_headers())
+        assert response.get_json()['llm_breakers']['OpenAI']['state'] == 'closed'
+
+
+# ===========================================================================
+# 26. Streaming generation — stop at the tweet limit or on an early refusal
+# ===========================================================================
+
+class _FakeStream:
+    """Iterable of chat-completion chunks that records how far it was read."""
+
+    def __init__(self, pieces):
+        self.pieces = pieces
+        self.consumed = 0
+        self.closed = False
+
+    def __iter__(self):
+        for piece in self.pieces:
+            self.consumed += 1
+            yield types.SimpleNamespace(choices=[types.SimpleNamespace(delta=types.SimpleNamespace(content=piece))])
+
+    def close(self):
+        self.closed = True
+
+
+def _streaming_client(pieces):
+    client = MagicMock()
+    client.stream = _FakeStream(pieces)
+    client.chat.completions.create.return_value = client.stream
+    return client
+
+
+class TestLlmStreaming(unittest.TestCase):
+
+    WORDS = ["Vault ", "77 ", "reports ", "nominal ", "radiation ", "across ", "the ", "Mojave. "] * 10
+
+    def setUp(self):
+        _reset_llm_cache()
+        _reset_llm_breakers()
+
+    def tearDown(self):
+        _reset_llm_cache()
+        _reset_llm_breakers()
+
+    def test_stream_stops_at_max_chars_on_word_boundary(self):
+        client = _streaming_client(self.WORDS)
+        text = bot._stream_completion(client, 'model', [], 100, max_chars=60)
+        assert len(text) <= 60 and not text.endswith(' ')
+        assert "".join(self.WORDS).startswith(text) and "".join(self.WORDS)[len(text)] == ' '
+        assert client.stream.consumed < len(self.WORDS), "stream should be abandoned early"
+        assert client.stream.closed
+        assert client.chat.completions.create.call_args.kwargs['stream'] is True
+
+    def test_stream_stops_on_early_refusal(self):
+        client = _streaming_client(["I'm ", "sorry, ", "but ", "I ", "cannot ", "help "] * 20)
+        text = bot._stream_completion(client, 'model', [], 100, max_chars=270)
+        assert client.stream.consumed == 2 and client.stream.closed
+        assert bot._score_response(text, 100) == 0
+
+    def test_truncate_at_word(self):
+        assert bot._truncate_at_word("short", 10) == "short"
+        assert bot._truncate_at_word("alpha beta gamma", 12) == "alpha beta"
+        assert bot._truncate_at_word("alpha beta gamma", 10) == "alpha beta"
+        assert bot._truncate_at_word("supercalifragilistic", 5) == "super"
+
+    def test_refusing_primary_fails_over_to_streamed_fallback(self):
+        clients = {
+            bot.XAI_BASE_URL: _streaming_client(["As an AI, ", "I must decline "] * 30),
+            bot.OPENAI_BASE_URL: _streaming_client(self.WORDS),
+        }
+        with patch.object(bot, 'LLM_HEDGE_MODE', False), \
+             patch.object(bot, 'LLM_STREAMING', True), \
+             patch.object(bot, 'XAI_API', 'xai-key'), \
+             patch.object(bot, 'OPENAI_API_KEY', 'openai-key'), \
+             patch.object(bot, 'HUGGING_FACE_TOKEN', None), \
+             patch.object(bot, 'get_llm_client', side_effect=lambda url, key: clients[url]):
+            result = bot.generate_llm_response("status update", max_tokens=100, max_chars=200)
+        assert result and result.startswith("Vault 77") and len(result) <= 200
+        assert clients[bot.XAI_BASE_URL].stream.consumed == 1
+        assert clients[bot.OPENAI_BASE_URL].stream.consumed < len(self.WORDS)
+
+    def test_streaming_disabled_uses_plain_completion(self):
+        client = MagicMock()
+        client.chat.completions.create.return_value = MagicMock(
+            choices=[MagicMock(message=MagicMock(content="Vault 77 reporting."))])
+        with patch.object(bot, 'LLM_STREAMING', False), \
+             patch.object(bot, 'XAI_API', 'xai-key'), \
+             patch.object(bot, 'get_llm_client', return_value=client):
+            assert bot._generate_xai_response([], 100, max_chars=50) == "Vault 77 reporting."
+        assert 'stream' not in client.chat.completions.create.call_args.kwargs
+
+
+# ===========================================================================
+# 27. Broadcast buffer — a few pre-generated broadcasts ready to post
+# ===========================================================================
+
+def _reset_broadcast_buffer():
+    with bot.BROADCAST_BUFFER_LOCK:
+        bot.BROADCAST_BUFFER.clear()
+        for key in bot.BROADCAST_BUFFER_STATS:
+            bot.BROADCAST_BUFFER_STATS[key] = 0
+
+
+class TestBroadcastBuffer(unittest.TestCase):
+
+    def setUp(self):
+        _reset_tweet_dedup()
+        _reset_broadcast_buffer()
+        self.counter = 0
+        # Slow providers from earlier tests may still be finishing on the executor
+        self.idle = patch.object(bot, '_llm_busy', return_value=False)
+        self.idle.start()
+
+    def tearDown(self):
+        self.idle.stop()
+        bot.TWITTER_ENABLED = False
+        bot.client = None
+        _reset_tweet_dedup()
+        _reset_broadcast_buffer()
+
+    def _compose(self, broadcast_type):
+        self.counter += 1
+        return f"Candidate {self.counter} for {broadcast_type} from Vault 77"
+
+    def test_refill_only_fills_free_slots(self):
+        with patch.object(bot, '_compose_broadcast_message', side_effect=self._compose) as compose:
+            assert bot.refill_broadcast_buffer(max_items=1) == 1
+            assert bot.refill_broadcast_buffer(max_items=5) == bot.BROADCAST_BUFFER_SIZE - 1
+            assert bot.refill_broadcast_buffer(max_items=5) == 0
+        assert compose.call_count == bot.BROADCAST_BUFFER_SIZE, "a full buffer must not generate"
+        stats = bot.get_broadcast_buffer_stats()
+        assert stats['depth'] == bot.BROADCAST_BUFFER_SIZE
+        assert len(set(stats['types'])) == bot.BROADCAST_BUFFER_SIZE, "buffered types should differ"
+
+    def test_refill_skips_duplicates_and_busy_llm(self):
+        bot.mark_tweet_sent("Candidate 1 for status_report from Vault 77")
+        with patch.object(bot, '_compose_broadcast_message', side_effect=self._compose), \
+             patch.object(bot, '_llm_busy', return_value=True):
+            assert bot.refill_broadcast_buffer() == 0
+        with patch.object(bot, '_compose_broadcast_message', return_value="Same text every time, Vault 77"):
+            assert bot.refill_broadcast_buffer(max_items=3) == 1
+        assert bot.get_broadcast_buffer_stats()['duplicates_dropped'] == 1
+
+    def test_pop_drops_stale_and_already_posted_entries(self):
+        now = time.time()
+        stamp = (bot.get_time_period(), {})
+        bot.BROADCAST_BUFFER.append((now - bot.BROADCAST_BUFFER_MAX_AGE - 1, 'lore_drop', "stale lore", stamp))
+        bot.BROADCAST_BUFFER.append((now, 'lore_drop', "fresh lore", stamp))
+        assert bot.pop_buffered_broadcast() == ('lore_drop', "fresh lore")
+        bot.BROADCAST_BUFFER.append((now, 'lore_drop', "already posted lore", stamp))
+        bot.mark_tweet_sent("already posted lore")
+        assert bot.pop_buffered_broadcast() is None
+        stats = bot.get_broadcast_buffer_stats()
+        assert stats['stale_dropped'] == 1 and stats['duplicates_dropped'] == 1
+        assert stats['served'] == 1 and stats['misses'] == 1
+
+    def test_period_matches_tweet_prompt(self):
+        for hour, period in ((2, 'night'), (5, 'morning'), (12, 'afternoon'), (17, 'evening'), (21, 'night')):
+            assert bot.get_time_period(hour) == period
+        with patch.object(bot, 'get_time_period', return_value='evening'), \
+             patch.object(bot, 'get_live_lore_context', return_value=None):
+            _, context = bot._overseer_tweet_request("status", None, 270)
+        assert context.startswith("Time of day: evening")
+
+    def test_pop_drops_entries_from_another_period(self):
+        with patch.object(bot, 'get_time_period', return_value='morning'):
+            bot.stash_broadcast_candidates('lore_drop', ["Morning lore from Vault 77"])
+        with patch.object(bot, 'get_time_period', return_value='night'):
+            assert bot.pop_buffered_broadcast() is None, "written for the morning"
+        assert bot.get_broadcast_buffer_stats()['stale_dropped'] == 1
+
+    def test_price_drift_only_drops_entries_that_quoted_prices(self):
+        with patch.object(bot, 'get_time_period', return_value='morning'):
+            bot.stash_broadcast_candidates('status_report', ["SOL holds at 100 caps, Vault 77"],
+                                           prices={'SOL/USDT_binance': 100.0})
+            bot.stash_broadcast_candidates('lore_drop', ["Lore with no prices, Vault 77"])
+            with patch.object(bot, 'load_price_cache', return_value={'SOL/USDT_binance': {'price': 110.0}}):
+                assert bot.pop_buffered_broadcast() == ('lore_drop', "Lore with no prices, Vault 77")
+        assert bot.get_broadcast_buffer_stats()['stale_dropped'] == 1
+
+    def test_small_price_moves_keep_entry(self):
+        with patch.object(bot, 'get_time_period', return_value='evening'):
+            bot.stash_broadcast_candidates('status_report', ["BTC steady near 60k, Vault 77"],
+                                           prices={'BTC/USDT_binance': 60000.0})
+            with patch.object(bot, 'load_price_cache', return_value={'BTC/USDT_binance': {'price': 60300.0}}):
+                assert bot.pop_buffered_broadcast() == ('status_report', "BTC steady near 60k, Vault 77")
+
+    def test_broadcast_posts_buffered_message_without_composing(self):
+        bot.TWITTER_ENABLED = True
+        bot.client = MagicMock()
+        bot.stash_broadcast_candidates('vault_log', ["Buffered vault_log broadcast from Vault 77"])
+        with patch.object(bot, '_compose_broadcast_message') as compose, \
+             patch.object(bot.random, 'random', return_value=0.0):
+            bot.overseer_broadcast()
+        compose.assert_not_called()
+        assert bot.client.create_tweet.call_args[1]['text'] == "Buffered vault_log broadcast from Vault 77"
+
+    def test_broadcast_falls_back_to_live_generation_when_empty(self):
+        bot.TWITTER_ENABLED = True
+        bot.client = MagicMock()
+        with patch.object(bot, '_compose_broadcast_message', return_value="Live broadcast from Vault 77"), \
+             patch.object(bot.random, 'random', return_value=0.0):
+            bot.overseer_broadcast()
+        assert bot.client.create_tweet.call_args[1]['text'] == "Live broadcast from Vault 77"
+
+
+# ===========================================================================
+# 28. Batched candidates — n= choices per request, scored and deduped locally
+# ===========================================================================
+
+def _choices_client(texts):
+    client = MagicMock()
+    client.chat.completions.create.return_value = MagicMock(
+        choices=[MagicMock(message=MagicMock(content=t)) for t in texts])
+    return client
+
+
+class TestLlmCandidates(unittest.TestCase):
+
+    A = "Vault 77 telemetry nominal. The Mojave hums like a reactor at dusk."
+    B = "HELIOS One still hums. Two centuries of stored power, aimed at nothing."
+    C = "The Brotherhood hoards tech. I hoard your attention. Difference is, I share."
+
+    def setUp(self):
+        _reset_llm_cache()
+        _reset_llm_breakers()
+        _reset_tweet_dedup()
+        _reset_broadcast_buffer()
+        self.patches = [
+            patch.object(bot, 'XAI_API', 'xai-key'),
+            patch.object(bot, 'OPENAI_API_KEY', None),
+            patch.object(bot, 'HUGGING_FACE_TOKEN', None),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        _reset_tweet_dedup()
+        _reset_broadcast_buffer()
+
+    def test_one_request_returns_scored_unique_candidates(self):
+        client = _choices_client([self.B, "I'm sorry, I cannot do that.", self.A, self.B, ""])
+        with patch.object(bot, 'get_llm_client', return_value=client):
+            candidates = bot.generate_llm_candidates("status", n=5, max_tokens=40)
+        assert client.chat.completions.create.call_count == 1
+        assert client.chat.completions.create.call_args.kwargs['n'] == 5
+        assert sorted(candidates) == sorted([self.A, self.B])
+
+    def test_without_n_capable_provider_falls_back_to_single_response(self):
+        with patch.object(bot, 'XAI_API', None), \
+             patch.object(bot, 'HUGGING_FACE_TOKEN', 'hf-token'), \
+             patch.object(bot, 'generate_llm_response', return_value=self.A) as single:
+            assert bot.generate_llm_candidates("status", n=3) == [self.A]
+        single.assert_called_once()
+
+    def test_broadcast_skips_duplicates_and_buffers_spares(self):
+        bot.mark_tweet_sent(self.A)
+        with patch.object(bot, 'LLM_ENABLED', True), \
+             patch.object(bot, 'LLM_BROADCAST_CANDIDATES', 3), \
+             patch.object(bot, 'get_live_lore_context', return_value=None), \
+             patch.object(bot, 'load_price_cache', return_value={}), \
+             patch.object(bot.random, 'random', return_value=0.4), \
+             patch.object(bot, 'generate_llm_candidates', return_value=[self.A, self.B, self.C]) as gen:
+            message = bot._compose_broadcast_message('lore_drop')
+        gen.assert_called_once()
+        assert message == self.B, "the already-posted candidate must be skipped locally"
+        assert [(t, m) for _, t, m, _ in bot.BROADCAST_BUFFER] == [('lore_drop', self.C)]
+
+
+# ===========================================================================
+# 29. Near-duplicate detection — MinHash/LSH index over recent posts
+# ===========================================================================
+
+class TestNearDuplicateIndex(unittest.TestCase):
+
+    TWEET = ("Vault 77 telemetry nominal. The Mojave hums like a reactor at dusk "
+             "while the NCR patrols drift east. atomicfizzcaps.xyz")
+
+    def setUp(self):
+        _reset_tweet_dedup()
+        self.mock_client = MagicMock()
+        bot.TWITTER_ENABLED = True
+        bot.client = self.mock_client
+
+    def tearDown(self):
+        bot.TWITTER_ENABLED = False
+        bot.client = None
+        _reset_tweet_dedup()
+
+    def test_one_word_rewrite_is_near_duplicate(self):
+        index = bot.near_duplicate.NearDuplicateIndex(threshold=0.7)
+        index.add(self.TWEET)
+        assert index.is_near_duplicate(self.TWEET.replace("drift", "march"))
+        assert index.is_near_duplicate(self.TWEET.replace(" atomicfizzcaps.xyz", "")), "links are ignored"
+        assert not index.is_near_duplicate("HELIOS One still hums. Two centuries of stored power, aimed at nothing.")
+
+    def test_entries_expire_and_capacity_is_bounded(self):
+        index = bot.near_duplicate.NearDuplicateIndex(window_seconds=60, max_items=50)
+        index.add(self.TWEET, now=1000.0)
+        assert index.is_near_duplicate(self.TWEET, now=1030.0)
+        assert not index.is_near_duplicate(self.TWEET, now=1061.0)
+        for i in range(200):
+            index.add(f"Wasteland bulletin {i}: sector {i * 7} reports activity", now=2000.0)
+        assert len(index) == 50
+
+    def test_queries_only_compare_lsh_candidates(self):
+        index = bot.near_duplicate.NearDuplicateIndex()
+        for i in range(500):
+            index.add(f"Bulletin {i} {i * 3} {i * 7}: sector {i * 11} quiet, caravan {i * 13} late")
+        with patch.object(bot.near_duplicate.np, 'stack', wraps=bot.near_duplicate.np.stack) as stack:
+            index.similarity(self.TWEET)
+            index.similarity("Bulletin 42 126 294: sector 462 quiet, caravan 546 late")
+        compared = [len(c.args[0]) for c in stack.call_args_list]
+        assert all(n < 50 for n in compared), f"compared against {compared} signatures"
+
+    def test_broadcast_rejects_reworded_recent_post(self):
+        bot.mark_tweet_sent(self.TWEET)
+        reworded = self.TWEET.replace("drift", "march")
+        fresh = "HELIOS One still hums. Two centuries of stored power, aimed at nothing."
+        with patch.object(bot, '_compose_broadcast_message', side_effect=[reworded, fresh]), \
+             patch.object(bot, 'pop_buffered_broadcast', return_value=None), \
+             patch.object(bot.random, 'random', return_value=0.0):
+            bot.overseer_broadcast()
+        self.mock_client.create_tweet.assert_called_once()
+        assert self.mock_client.create_tweet.call_args[1]['text'] == fresh
+
+    def test_distinct_events_with_similar_text_both_post(self):
+        with patch.object(bot, 'admit_event_immediately', return_value=True), \
+             patch.object(bot, 'get_personality_line',
+                          return_value="Vault-Tec reminds you that compliance is mandatory and survival optional."), \
+             patch.object(bot.random, 'choice', side_effect=lambda seq: seq[0]):
+            bot.overseer_event_bridge({"type": "level_up", "player": "Courier Six", "level": 12})
+            bot.overseer_event_bridge({"type": "level_up", "player": "Courier Seven", "level": 12})
+            bot.overseer_event_bridge({"type": "level_up", "player": "Courier Seven", "level": 12})
+        texts = [c.kwargs['text'] for c in self.mock_client.create_tweet.call_args_list]
+        assert bot.is_near_duplicate_tweet(texts[0].replace("Six", "Nine")), "texts are near-duplicates"
+        assert len(texts) == 2, "different players must both post; only the exact repeat is skipped"
+        assert "Courier Six" in texts[0] and "Courier Seven" in texts[1]
+
+    def test_diagnostic_and_update_skip_near_duplicates(self):
+        bot.mark_tweet_sent(self.TWEET)
+        with patch.object(bot, 'generate_overseer_tweet', return_value=self.TWEET.replace("drift", "march")):
+            bot.overseer_diagnostic()
+        with patch.object(bot, 'get_personality_line', return_value="Stay sharp."):
+            bot.post_overseer_update("Caravan 12 arrived at Primm with a full load of Fizz Caps and stimpaks.")
+            bot.post_overseer_update("Caravan 12 arrived at Primm with a full load of Fizz Caps and stimpaks!")
+        assert self.mock_client.create_tweet.call_count == 1
+
+
+# ===========================================================================
+# 30. Persistent dedup — ordered expiry and restore after restart
+# ===========================================================================
+
+class TestPersistentTweetDedup(unittest.TestCase):
+
+    def setUp(self):
+        _reset_tweet_dedup()
+
+    def tearDown(self):
+        _reset_tweet_dedup()
+
+    def _simulate_restart(self):
+        bot.STATE_STORE.flush()
+        with bot.RECENT_TWEET_HASHES_LOCK:
+            bot.RECENT_TWEET_HASHES.clear()
+            bot._RECENT_TWEET_ORDER.clear()
+            bot._tweet_dedup_state['loaded'] = False
+        bot.NEAR_DUPLICATE_INDEX.clear()
+
+    def test_duplicate_detected_after_restart(self):
+        text = "The Overseer remembers every broadcast, vault dweller."
+        bot.mark_tweet_sent(text)
+        self._simulate_restart()
+        assert bot.is_duplicate_tweet(text)
+        assert bot.is_near_duplicate_tweet(text + " Stay vigilant.")
+
+    def test_expired_rows_not_restored(self):
+        with patch.object(bot.time, 'time', return_value=time.time() - bot.TWEET_DEDUP_WINDOW_SECONDS - 5):
+            bot.mark_tweet_sent("stale broadcast")
+        self._simulate_restart()
+        assert not bot.is_duplicate_tweet("stale broadcast")
+        assert len(bot._RECENT_TWEET_ORDER) == 0
+
+    def test_expiry_pops_only_old_entries(self):
+        old = time.time() - bot.TWEET_DEDUP_WINDOW_SECONDS - 10
+        for i in range(3):
+            with patch.object(bot.time, 'time', return_value=old + i):
+                bot.mark_tweet_sent(f"old tweet {i}")
+        bot.mark_tweet_sent("fresh tweet")
+        assert bot.is_duplicate_tweet("fresh tweet")
+        assert list(bot.RECENT_TWEET_HASHES) == [bot._tweet_hash("fresh tweet")]
+        assert len(bot._RECENT_TWEET_ORDER) == 1
+
+    def test_repost_keeps_newer_timestamp(self):
+        with patch.object(bot.time, 'time', return_value=time.time() - bot.TWEET_DEDUP_WINDOW_SECONDS - 10):
+            bot.mark_tweet_sent("repeat me")
+        bot.mark_tweet_sent("repeat me")
+        assert bot.is_duplicate_tweet("repeat me"), "Stale order entry must not evict the newer post"
+
+    def test_compact_removes_expired_rows(self):
+        with patch.object(bot.time, 'time', return_value=time.time() - bot.TWEET_DEDUP_WINDOW_SECONDS - 10):
+            bot.mark_tweet_sent("expired row")
+        bot.mark_tweet_sent("current row")
+        bot.compact_state_store()
+        bot.STATE_STORE.flush()
+        rows = bot.STATE_STORE.query("SELECT text FROM tweet_hashes")
+        assert rows == [("current row",)]
+
+
+# ===========================================================================
+# 31. Persistent price alert cooldowns
+# ===========================================================================
+
+class TestPersistentPriceCooldowns(unittest.TestCase):
+
+    def setUp(self):
+        _reset_price_cooldowns()
+
+    def tearDown(self):
+        _reset_price_cooldowns()
+
+    def _simulate_restart(self):
+        bot.STATE_STORE.flush()
+        with bot.PRICE_ALERT_COOLDOWNS_LOCK:
+            bot.PRICE_ALERT_COOLDOWNS.clear()
+            bot._price_cooldown_state['loaded'] = False
+
+    def test_cooldown_survives_restart(self):
+        bot.mark_price_alert_sent("BTC/USDT")
+        self._simulate_restart()
+        assert bot.is_price_alert_on_cooldown("BTC/USDT")
+        assert not bot.is_price_alert_on_cooldown("ETH/USDT")
+
+    def test_expired_cooldown_not_restored(self):
+        with patch.object(bot.time, 'time', return_value=time.time() - bot.PRICE_ALERT_COOLDOWN_SECONDS - 5):
+            bot.mark_price_alert_sent("SOL/USDT")
+        self._simulate_restart()
+        assert not bot.is_price_alert_on_cooldown("SOL/USDT")
+        assert "SOL/USDT" not in bot.PRICE_ALERT_COOLDOWNS
+
+    def test_mark_does_not_block_on_disk_write(self):
+        with patch.object(bot.STATE_STORE, 'execute') as sync_write:
+            bot.mark_price_alert_sent("ETH/USDT")
+        sync_write.assert_not_called()
+        assert bot.is_price_alert_on_cooldown("ETH/USDT")
+
+    def test_compact_removes_expired_cooldowns(self):
+        with patch.object(bot.time, 'time', return_value=time.time() - bot.PRICE_ALERT_COOLDOWN_SECONDS - 5):
+            bot.mark_price_alert_sent("OLD/USDT")
+        bot.mark_price_alert_sent("NEW/USDT")
+        bot.compact_state_store()
+        bot.STATE_STORE.flush()
+        rows = bot.STATE_STORE.query("SELECT symbol FROM price_alert_cooldowns")
+        assert rows == [("NEW/USDT",)]
+
+
+# ===========================================================================
+# 32. Incremental mention polling — since_id and the processed-ID table
+# ===========================================================================
+
+def _mention(tweet_id, text="@OverseerBot hello", author_id=7):
+    return types.SimpleNamespace(id=tweet_id, text=text, author_id=author_id)
+
+
+def _mentions_page(mentions, next_token=None, users=None):
+    meta = {'result_count': len(mentions)}
+    if next_token:
+        meta['next_token'] = next_token
+    includes = {'users': users} if users else {}
+    return types.SimpleNamespace(data=mentions or None, meta=meta, includes=includes)
+
+
+class _MentionClientTestCase(unittest.TestCase):
+    """Twitter enabled with a mocked client; mention state reset around each test."""
+
+    def setUp(self):
+        _reset_mention_state()
+        self.mock_client = MagicMock()
+        self.mock_client.get_user.return_value = types.SimpleNamespace(
+            data=types.SimpleNamespace(username="dweller"))
+        self.patches = [
+            patch.object(bot, 'TWITTER_ENABLED', True),
+            patch.object(bot, 'TWITTER_READ_ENABLED', True),
+            patch.object(bot, 'client', self.mock_client),
+            patch.object(bot, 'bot_user_id', 42),
+            patch.object(bot, 'bot_username', 'OverseerBot'),
+            patch.object(bot, 'generate_contextual_response', return_value="Acknowledged."),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        _reset_mention_state()
+
+    def _replied_ids(self):
+        return [c.kwargs['in_reply_to_tweet_id'] for c in self.mock_client.create_tweet.call_args_list]
+
+
+class TestIncrementalMentions(_MentionClientTestCase):
+
+    def test_first_run_sets_high_water_mark(self):
+        self.mock_client.get_users_mentions.return_value = _mentions_page([_mention(12), _mention(10)])
+        bot.overseer_respond()
+        assert self._replied_ids() == [10, 12], "Mentions should be answered oldest first"
+        bot.STATE_STORE.flush()
+        assert bot.get_mention_since_id() == 12
+        assert 'since_id' not in self.mock_client.get_users_mentions.call_args.kwargs
+
+    def test_next_run_requests_only_newer_mentions(self):
+        bot.set_mention_since_id(12)
+        bot.STATE_STORE.flush()
+        self.mock_client.get_users_mentions.return_value = _mentions_page([])
+        bot.overseer_respond()
+        assert self.mock_client.get_users_mentions.call_args.kwargs['since_id'] == 12
+        self.mock_client.create_tweet.assert_not_called()
+
+    def test_processed_mentions_are_not_answered_again(self):
+        bot.mark_mention_processed(11)
+        self.mock_client.get_users_mentions.return_value = _mentions_page([_mention(11), _mention(13)])
+        bot.overseer_respond()
+        assert self._replied_ids() == [13]
+
+    def test_failed_reply_holds_back_since_id(self):
+        def create_tweet(text, in_reply_to_tweet_id):
+            if in_reply_to_tweet_id == 21:
+                raise bot.tweepy.TweepyException("503 Service Unavailable")
+        self.mock_client.create_tweet.side_effect = create_tweet
+        self.mock_client.get_users_mentions.return_value = _mentions_page(
+            [_mention(20), _mention(21), _mention(22)])
+        bot.overseer_respond()
+        bot.STATE_STORE.flush()
+        assert bot.get_mention_since_id() == 20
+        assert bot.filter_unprocessed_mentions([20, 21, 22]) == {21}
+
+    def test_catch_up_follows_pagination(self):
+        bot.set_mention_since_id(1)
+        bot.STATE_STORE.flush()
+        self.mock_client.get_users_mentions.side_effect = [
+            _mentions_page([_mention(5), _mention(4)], next_token="page2"),
+            _mentions_page([_mention(3), _mention(2)]),
+        ]
+        bot.overseer_respond()
+        assert self._replied_ids() == [2, 3, 4, 5]
+        second = self.mock_client.get_users_mentions.call_args_list[1].kwargs
+        assert second['pagination_token'] == "page2"
+
+    def test_page_cap_keeps_unread_mentions_for_later_runs(self):
+        bot.set_mention_since_id(1)
+        bot.STATE_STORE.flush()
+        self.mock_client.get_users_mentions.side_effect = [
+            _mentions_page([_mention(9), _mention(8)], next_token="older"),  # cap hit, 2..7 unread
+            _mentions_page([_mention(3), _mention(2)]),                      # the gap below 8
+            _mentions_page([_mention(9), _mention(8)]),                      # back to new mentions
+        ]
+        with patch.object(bot, 'MENTIONS_MAX_PAGES', 1):
+            bot.overseer_respond()
+            bot.STATE_STORE.flush()
+            assert bot.get_mention_since_id() == 1, "since_id must not skip the unread pages"
+            assert bot.get_mention_until_id() == 8
+            bot.overseer_respond()
+            bot.STATE_STORE.flush()
+            assert bot.get_mention_since_id() == 3
+            assert bot.get_mention_until_id() is None
+            bot.overseer_respond()
+        bot.STATE_STORE.flush()
+        calls = [c.kwargs for c in self.mock_client.get_users_mentions.call_args_list]
+        assert calls[1]['since_id'] == 1 and calls[1]['until_id'] == 8
+        assert 'until_id' not in calls[2] and calls[2]['since_id'] == 3
+        assert self._replied_ids() == [8, 9, 2, 3]
+        assert bot.get_mention_since_id() == 9
+
+    def test_legacy_json_file_is_migrated_once(self):
+        import json
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp:
+            legacy = os.path.join(tmp, "processed_mentions.json")
+            with open(legacy, 'w') as f:
+                json.dump(["30", "31"], f)
+            bot._mention_state['migrated'] = False
+            with patch.object(bot, 'PROCESSED_MENTIONS_FILE', legacy):
+                bot._migrate_processed_mentions_file()
+            assert not os.path.exists(legacy)
+            assert os.path.exists(legacy + '.migrated')
+        assert bot.get_mention_since_id() == 31
+        assert bot.filter_unprocessed_mentions([30, 31, 32]) == {32}
+
+
+class TestInMemoryMentionState(_MentionClientTestCase):
+    """STATE_PERSIST=false keeps since_id and replied IDs out of STATE_STORE."""
+
+    def setUp(self):
+        super().setUp()
+        persist = patch.object(bot, 'STATE_PERSIST', False)
+        persist.start()
+        self.patches.append(persist)
+
+    def test_mention_state_stays_in_memory(self):
+        self.mock_client.get_users_mentions.return_value = _mentions_page([_mention(41), _mention(40)])
+        with patch.object(bot.STATE_STORE, 'execute_async') as write, \
+             patch.object(bot.STATE_STORE, 'query') as read:
+            bot.overseer_respond()
+            assert bot.get_mention_since_id() == 41
+            assert bot.filter_unprocessed_mentions([40, 41, 42]) == {42}
+        write.assert_not_called()
+        read.assert_not_called()
+        assert self._replied_ids() == [40, 41]
+
+    def test_compact_prunes_old_processed_ids(self):
+        with patch.object(bot.time, 'time', return_value=time.time() - bot.PROCESSED_MENTIONS_RETENTION_SECONDS - 5):
+            bot.mark_mention_processed(50)
+        bot.mark_mention_processed(51)
+        bot.compact_state_store()
+        assert list(bot._PROCESSED_MENTIONS) == [51]
+
+
+# ===========================================================================
+# 33. Mention author hydration — expansions=author_id and the user cache
+# ===========================================================================
+
+def _user(user_id, username):
+    return types.SimpleNamespace(id=user_id, username=username, name=username.title())
+
+
+class TestMentionAuthorHydration(_MentionClientTestCase):
+
+    def test_authors_come_from_includes(self):
+        self.mock_client.get_users_mentions.return_value = _mentions_page(
+            [_mention(40, author_id=1), _mention(41, author_id=2)],
+            users=[_user(1, "ghoul"), _user(2, "paladin")])
+        bot.overseer_respond()
+        kwargs = self.mock_client.get_users_mentions.call_args.kwargs
+        assert kwargs['expansions'] == ["author_id"]
+        assert "username" in kwargs['user_fields']
+        self.mock_client.get_user.assert_not_called()
+        replied_to = [c.args[0] for c in bot.generate_contextual_response.call_args_list]
+        assert replied_to == ["ghoul", "paladin"]
+
+    def test_repeat_mentioner_costs_no_lookup(self):
+        bot.cache_users([_user(3, "courier")])
+        self.mock_client.get_users_mentions.return_value = _mentions_page([_mention(50, author_id=3)])
+        bot.overseer_respond()
+        self.mock_client.get_user.assert_not_called()
+        assert bot.get_user_cache_stats()['hits'] >= 1
+
+    def test_missing_author_falls_back_to_get_user_once(self):
+        self.mock_client.get_user.return_value = types.SimpleNamespace(data=_user(4, "synth"))
+        assert bot.resolve_username(4) == "synth"
+        assert bot.resolve_username(4) == "synth"
+        self.mock_client.get_user.assert_called_once_with(id=4)
+
+    def test_expired_entry_is_refetched(self):
+        bot.cache_users([_user(5, "raider")])
+        with bot.USER_CACHE_LOCK:
+            bot.USER_CACHE['5']['timestamp'] -= bot.USER_CACHE_TTL + 1
+        assert bot.get_cached_username(5) is None
+        assert '5' not in bot.USER_CACHE
+
+    def test_cache_is_bounded(self):
+        with patch.object(bot, 'USER_CACHE_MAX_SIZE', 2):
+            bot.cache_users([_user(i, f"dweller{i}") for i in range(4)])
+        assert list(bot.USER_CACHE) == ['2', '3']
+
+
+# ===========================================================================
+# 34. Mention reply pipeline — parallel generation, rate-limited sending
+# ===========================================================================
+
+def _too_many_requests(reset_in=120):
+    response = MagicMock(status_code=429, reason="Too Many Requests",
+                         headers={'x-rate-limit-reset': str(int(time.time() + reset_in))})
+    response.json.return_value = {}
+    return bot.tweepy.TooManyRequests(response)
+
+
+class TestMentionReplyPipeline(_MentionClientTestCase):
+
+    def test_replies_are_generated_concurrently(self):
+        import threading
+        barrier = threading.Barrier(3, timeout=2)
+
+        def generate(username, message):
+            barrier.wait()  # only passes when all three run at the same time
+            return f"Reply to {username}"
+
+        self.mock_client.get_users_mentions.return_value = _mentions_page([_mention(i) for i in (60, 61, 62)])
+        with patch.object(bot, 'generate_contextual_response', side_effect=generate):
+            bot.overseer_respond()
+        assert self._replied_ids() == [60, 61, 62]
+
+    def test_generation_limited_to_send_budget(self):
+        bot.TWITTER_SEND_LIMITERS['create_tweet'] = bot.TokenBucket(rate=0, capacity=1)
+        self.mock_client.get_users_mentions.return_value = _mentions_page(
+            [_mention(70), _mention(71), _mention(72)])
+        bot.overseer_respond()
+        bot.STATE_STORE.flush()
+        assert self._replied_ids() == [70]
+        assert bot.generate_contextual_response.call_count == 1, "Only replies that can be posted are generated"
+        assert bot.get_mention_since_id() == 70
+
+    def test_unsent_replies_kept_and_resumed_without_regeneration(self):
+        def create_tweet(text, in_reply_to_tweet_id):
+            if in_reply_to_tweet_id == 74:
+                raise _too_many_requests(reset_in=60)
+        self.mock_client.create_tweet.side_effect = create_tweet
+        bot.generate_contextual_response.side_effect = lambda username, message: f"Reply {time.monotonic()}"
+        self.mock_client.get_users_mentions.return_value = _mentions_page(
+            [_mention(73), _mention(74), _mention(75), _mention(76)])
+        bot.overseer_respond()
+        bot.STATE_STORE.flush()
+        assert bot.get_mention_since_id() == 73
+        assert set(bot._PENDING_REPLIES) == {74, 75, 76}, "Every generated but unsent reply is kept"
+        stored = dict(bot._PENDING_REPLIES)
+
+        bot._TWITTER_PAUSED_UNTIL['create_tweet'] = 0.0
+        self.mock_client.create_tweet.reset_mock(side_effect=True)
+        bot.generate_contextual_response.reset_mock()
+        self.mock_client.get_users_mentions.return_value = _mentions_page(
+            [_mention(74), _mention(75), _mention(76)])
+        bot.overseer_respond()
+        bot.STATE_STORE.flush()
+        bot.generate_contextual_response.assert_not_called()
+        sent = {c.kwargs['in_reply_to_tweet_id']: c.kwargs['text']
+                for c in self.mock_client.create_tweet.call_args_list}
+        assert sent == stored, "Stored replies are posted unchanged"
+        assert bot.get_mention_since_id() == 76
+        assert not bot._PENDING_REPLIES
+
+    def test_rate_limit_pauses_endpoint(self):
+        self.mock_client.create_tweet.side_effect = _too_many_requests(reset_in=120)
+        self.mock_client.get_users_mentions.return_value = _mentions_page([_mention(80), _mention(81)])
+        bot.overseer_respond()
+        assert self.mock_client.create_tweet.call_count == 1, "Posting stops at the first 429"
+        assert bot.get_twitter_sender_stats()['create_tweet']['paused_for'] > 100
+        assert not bot.acquire_twitter_slot('create_tweet')
+        bot.STATE_STORE.flush()
+        assert bot.get_mention_since_id() is None
+        assert bot._MENTION_FAILURES == {}, "A 429 is not counted as a failed reply"
+
+    def test_like_failure_does_not_repeat_reply(self):
+        self.mock_client.like.side_effect = bot.tweepy.TweepyException("like failed")
+        self.mock_client.get_users_mentions.return_value = _mentions_page([_mention(90)])
+        bot.overseer_respond()
+        bot.STATE_STORE.flush()
+        assert self._replied_ids() == [90]
+        assert bot.filter_unprocessed_mentions([90]) == set()
+        assert bot.get_mention_since_id() == 90
+
+    def test_like_skipped_when_over_budget(self):
+        bot.TWITTER_SEND_LIMITERS['like'] = bot.TokenBucket(rate=0, capacity=0)
+        self.mock_client.get_users_mentions.return_value = _mentions_page([_mention(95)])
+        bot.overseer_respond()
+        assert self._replied_ids() == [95]
+        self.mock_client.like.assert_not_called()
+
+
+# ===========================================================================
+# 35. Webhook ingestion queue — /overseer-event returns 202 and dispatches later
+# ===========================================================================
+
+class TestEventIngestionQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.client = bot.app.test_client()
+        bot.flush_event_queue()
+        with bot.EVENT_QUEUE_LOCK:
+            for key in bot.EVENT_QUEUE_STATS:
+                bot.EVENT_QUEUE_STATS[key] = 0
+
+    def tearDown(self):
+        bot.flush_event_queue()
+
+    def test_valid_event_is_accepted_and_dispatched(self):
+        with patch.object(bot, 'overseer_event_bridge') as bridge:
+            resp = self.client.post('/overseer-event', json={"type": "swap", "amount": 5})
+            assert resp.status_code == 202
+            assert resp.get_json() == {"ok": True, "queued": True}
+            assert bot.flush_event_queue()
+        bridge.assert_called_once_with({"type": "swap", "amount": 5})
+        assert bot.get_event_queue_stats()['dispatched'] == 1
+
+    def test_request_does_not_wait_for_dispatch(self):
+        import threading
+        release = threading.Event()
+        with patch.object(bot, 'overseer_event_bridge', side_effect=lambda e: release.wait(2)):
+            start = time.monotonic()
+            resp = self.client.post('/overseer-event', json={"type": "claim"})
+            elapsed = time.monotonic() - start
+            release.set()
+            bot.flush_event_queue()
+        assert resp.status_code == 202
+        assert elapsed < 1.0, "Handler must return before the event is processed"
+
+    def test_invalid_events_rejected(self):
+        for payload in ([1, 2], {"amount": 3}, {"type": "teleport"}):
+            resp = self.client.post('/overseer-event', json=payload)
+            assert resp.status_code == 400, payload
+        resp = self.client.post('/overseer-event', data="not json", content_type='application/json')
+        assert resp.status_code == 400
+        assert bot.get_event_queue_stats()['rejected'] == 4
+
+    def test_unauthorized_when_key_configured(self):
+        with patch.object(bot, 'WEBHOOK_API_KEY', 'secret'):
+            resp = self.client.post('/overseer-event', json={"type": "swap"})
+            assert resp.status_code == 401
+            resp = self.client.post('/overseer-event', json={"type": "swap"},
+                                    headers={'Authorization': 'Bearer secret'})
+            assert resp.status_code == 202
+
+    def test_full_queue_drops_with_503(self):
+        import queue
+        with patch.object(bot, 'EVENT_QUEUE', queue.Queue(maxsize=1)), \
+             patch.object(bot, '_ensure_event_dispatcher'):
+            assert self.client.post('/overseer-event', json={"type": "perk"}).status_code == 202
+            resp = self.client.post('/overseer-event', json={"type": "perk"})
+            assert resp.status_code == 503
+            stats = bot.get_event_queue_stats()
+        assert stats['dropped'] == 1
+        assert stats['depth'] == 1
+
+    def test_identical_events_in_a_batch_are_coalesced(self):
+        events = [{"type": "nft", "name": "Pip-Boy"}, {"type": "nft", "name": "Pip-Boy"},
+                  {"type": "nft", "name": "Power Armor"}]
+        assert bot._coalesce_events(events) == [events[0], events[2]]
+
+
+# ===========================================================================
+# 36. Event digest — frequent wallet events summarized per window
+# ===========================================================================
+
+def _reset_event_digest():
+    with bot.EVENT_DIGEST_LOCK:
+        bot.EVENT_DIGEST_SEEN.clear()
+        bot.EVENT_DIGEST_COUNTS.clear()
+        for key in bot.EVENT_DIGEST_STATS:
+            bot.EVENT_DIGEST_STATS[key] = 0
+        bot._event_digest_window['start'] = time.time() - 600
+
+
+class TestEventDigest(unittest.TestCase):
+
+    def setUp(self):
+        _reset_event_digest()
+        _reset_tweet_dedup()
+        self.mock_client = MagicMock()
+        self.patches = [
+            patch.object(bot, 'TWITTER_ENABLED', True),
+            patch.object(bot, 'client', self.mock_client),
+            patch.object(bot, 'EVENT_DIGEST_ENABLED', True),
+            patch.dict(bot.EVENT_IMMEDIATE_THRESHOLDS, {'swap': 0, 'level_up': 1, 'perk': 3}),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        _reset_event_digest()
+        _reset_tweet_dedup()
+
+    def test_frequent_events_only_count(self):
+        for _ in range(5):
+            bot.overseer_event_bridge({"type": "swap", "amount": 1, "from": "CAPS", "to": "SOL"})
+        self.mock_client.create_tweet.assert_not_called()
+        assert bot.EVENT_DIGEST_COUNTS == {'swap': 5}
+
+    def test_rare_events_post_immediately_up_to_threshold(self):
+        bot.overseer_event_bridge({"type": "level_up", "player": "Nate", "level": 5})
+        bot.overseer_event_bridge({"type": "level_up", "player": "Nora", "level": 7})
+        assert self.mock_client.create_tweet.call_count == 1
+        assert bot.EVENT_DIGEST_COUNTS == {'level_up': 1}
+        bot.overseer_event_bridge({"type": "perk", "perk": "Lone Wanderer"})
+        assert self.mock_client.create_tweet.call_count == 2
+
+    def test_digest_posts_one_summary_and_resets_window(self):
+        for _ in range(37):
+            bot.admit_event_immediately('swap')
+        for _ in range(13):
+            bot.admit_event_immediately('level_up')
+        bot.flush_event_digest()
+        self.mock_client.create_tweet.assert_called_once()
+        text = self.mock_client.create_tweet.call_args.kwargs['text']
+        assert "37 swaps, 12 level-ups in the last 10 minutes." in text
+        assert bot.EVENT_DIGEST_COUNTS == {}
+        assert bot.admit_event_immediately('level_up'), "Thresholds start over in a new window"
+        assert bot.get_event_digest_stats()['digests_posted'] == 1
+
+    def test_similar_digest_is_not_suppressed(self):
+        bot.admit_event_immediately('swap')
+        bot.admit_event_immediately('swap')
+        bot.flush_event_digest()
+        bot._event_digest_window['start'] = time.time() - 600
+        for _ in range(3):
+            bot.admit_event_immediately('swap')
+        bot.flush_event_digest()
+        assert self.mock_client.create_tweet.call_count == 2
+
+    def test_empty_window_posts_nothing(self):
+        bot.flush_event_digest()
+        self.mock_client.create_tweet.assert_not_called()
+
+    def test_format_singular_and_threshold_parsing(self):
+        with patch.object(bot.random, 'choice', return_value="REPORT:"):
+            text = bot.format_event_digest({'claim': 1, 'nft': 0}, 1)
+        assert text == "REPORT: 1 location claim in the last minute."
+        assert bot._parse_event_thresholds("swap=2, nft = 5,bogus,perk=x") == {'swap': 2, 'nft': 5}
+
+    def test_disabled_digest_posts_every_event(self):
+        with patch.object(bot, 'EVENT_DIGEST_ENABLED', False):
+            assert bot.admit_event_immediately('swap')
+            assert bot.admit_event_immediately('swap')
+        assert bot.EVENT_DIGEST_COUNTS == {}
+
+
+# ===========================================================================
+# 37. Batch event ingestion — JSON arrays and NDJSON on /overseer-events
+# ===========================================================================
+
+import io
+import event_stream
+
+
+def _parse(body, chunk_size=7, **kwargs):
+    return list(event_stream.iter_json_values(io.BytesIO(body.encode('utf-8')),
+                                              chunk_size=chunk_size, **kwargs))
+
+
+class TestEventStreamParser(unittest.TestCase):
+
+    def test_array_split_across_small_chunks(self):
+        body = '[{"type": "swap", "amount": 12}, {"type": "perk", "perk": "Ghoulish"} ]'
+        assert _parse(body) == [({"type": "swap", "amount": 12}, None),
+                                ({"type": "perk", "perk": "Ghoulish"}, None)]
+
+    def test_ndjson_skips_bad_lines(self):
+        body = '{"type": "claim"}\n{oops\n\n{"type": "nft"}\n'
+        values = _parse(body)
+        assert values[0] == ({"type": "claim"}, None)
+        assert values[1][0] is None and values[1][1].startswith("Invalid JSON")
+        assert values[2] == ({"type": "nft"}, None)
+
+    def test_multibyte_characters_split_between_chunks(self):
+        body = '{"type": "nft", "name": "☢️ Nuka-Cola Quantum"}\n'
+        assert _parse(body, chunk_size=3) == [({"type": "nft", "name": "☢️ Nuka-Cola Quantum"}, None)]
+
+    def test_numbers_split_across_chunks(self):
+        for chunk_size in (1, 2, 3):
+            assert _parse('[1.5, -2e3, true]', chunk_size=chunk_size) == [(1.5, None), (-2000.0, None), (True, None)]
+            assert _parse('10.25\n7', chunk_size=chunk_size) == [(10.25, None), (7, None)]
+
+    def test_bad_array_raises(self):
+        for body in ('[{"type": "swap"} {"type": "perk"}]', '[{"type": "swap"},', '[{"type": "swap"}] {}',
+                     '[1,]', '[{"type": "swap"}, ]'):
+            with self.assertRaises(event_stream.EventStreamError):
+                _parse(body)
+
+    def test_oversized_value_raises(self):
+        body = '{"type": "quest", "message": "' + 'x' * 500 + '"}'
+        with self.assertRaises(event_stream.EventStreamError):
+            _parse(body, chunk_size=64, max_value_bytes=100)
+
+    def test_reads_incrementally(self):
+        class CountingStream(io.BytesIO):
+            reads = 0
+
+            def read(self, n=-1):
+                CountingStream.reads += 1
+                return super().read(n)
+
+        stream = CountingStream(b'{"type": "swap"}\n' * 100)
+        values = event_stream.iter_json_values(stream, chunk_size=64)
+        next(values)
+        assert CountingStream.reads == 1, "First event must be yielded before the body is consumed"
+
+
+class TestBatchEventEndpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.client = bot.app.test_client()
+        self.bridge = patch.object(bot, 'overseer_event_bridge').start()
+        bot.flush_event_queue()
+
+    def tearDown(self):
+        bot.flush_event_queue()
+        patch.stopall()
+
+    def test_json_array_returns_per_event_results(self):
+        events = [{"type": "swap", "amount": 1}, {"type": "teleport"}, {"type": "claim", "caps": 5}]
+        resp = self.client.post('/overseer-events', json=events)
+        assert resp.status_code == 202
+        body = resp.get_json()
+        assert body['accepted'] == 2 and body['rejected'] == 1
+        assert [r['ok'] for r in body['results']] == [True, False, True]
+        assert body['results'][1]['error'] == "Unknown event type: teleport"
+        assert bot.flush_event_queue()
+        dispatched = [c.args[0] for c in self.bridge.call_args_list]
+        assert dispatched == [events[0], events[2]]
+
+    def test_ndjson_body(self):
+        body = '{"type": "level_up", "level": 3}\nnot json\n{"type": "nft", "name": "Pip-Boy"}\n'
+        resp = self.client.post('/overseer-events', data=body, content_type='application/x-ndjson')
+        assert resp.status_code == 202
+        results = resp.get_json()['results']
+        assert [r['ok'] for r in results] == [True, False, True]
+
+    def test_auth_checked_once_per_request(self):
+        with patch.object(bot, 'verify_webhook_auth', return_value=True) as verify:
+            body = '\n'.join('{"type": "swap"}' for _ in range(5))
+            resp = self.client.post('/overseer-events', data=body, content_type='application/x-ndjson')
+        assert resp.status_code == 202
+        verify.assert_called_once()
+
+    def test_unauthorized(self):
+        with patch.object(bot, 'WEBHOOK_API_KEY', 'secret'):
+            resp = self.client.post('/overseer-events', json=[{"type": "swap"}])
+        assert resp.status_code == 401
+        self.bridge.assert_not_called()
+
+    def test_truncated_array_keeps_earlier_results(self):
+        resp = self.client.post('/overseer-events', data='[{"type": "perk"}, {"type": "qu',
+                                content_type='application/json')
+        assert resp.status_code == 202
+        body = resp.get_json()
+        assert body['ok'] is False and body['accepted'] == 1
+        assert "Invalid JSON" in body['error']
+
+    def test_empty_or_unparseable_body_is_400(self):
+        assert self.client.post('/overseer-events', data='').status_code == 400
+        assert self.client.post('/overseer-events', data='[}').status_code == 400
+
+    def test_no_accepted_events_is_400(self):
+        resp = self.client.post('/overseer-events', json=[{"type": "teleport"}, {"amount": 3}])
+        assert resp.status_code == 400
+        body = resp.get_json()
+        assert body['ok'] is False and body['accepted'] == 0 and body['rejected'] == 2
+        assert len(body['results']) == 2
+
+    def test_batch_limit(self):
+        with patch.object(bot, 'EVENT_BATCH_MAX_EVENTS', 2):
+            resp = self.client.post('/overseer-events', json=[{"type": "swap"}] * 3)
+        body = resp.get_json()
+        assert body['accepted'] == 2
+        assert "limit" in body['error']
+
+
 # ===========================================================================
 # Run
 # ===========================================================================